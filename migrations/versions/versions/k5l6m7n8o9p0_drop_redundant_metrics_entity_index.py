@@ -0,0 +1,25 @@
+"""drop idx_metrics_entity, covered by uq_metrics_entity_date
+
+Revision ID: k5l6m7n8o9p0
+Revises: bd5e3da3b8f2
+Create Date: 2026-10-15 10:00:00.000000
+"""
+from alembic import op
+
+revision = "k5l6m7n8o9p0"
+down_revision = "bd5e3da3b8f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The unique index on (entity_type, entity_id, recorded_at) serves both
+    # entity lookups and "latest snapshot before date" scans (read backwards),
+    # so the two-column index only adds write cost.
+    op.drop_index("idx_metrics_entity", table_name="metrics_history")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_metrics_entity", "metrics_history", ["entity_type", "entity_id"], unique=False
+    )
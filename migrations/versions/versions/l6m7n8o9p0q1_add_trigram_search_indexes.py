@@ -0,0 +1,38 @@
+"""add pg_trgm GIN indexes for paper and repository text search
+
+Revision ID: l6m7n8o9p0q1
+Revises: k5l6m7n8o9p0
+Create Date: 2026-10-15 10:10:00.000000
+"""
+from alembic import op
+
+revision = "l6m7n8o9p0q1"
+down_revision = "k5l6m7n8o9p0"
+branch_labels = None
+depends_on = None
+
+_TRGM_INDEXES = [
+    ("idx_papers_title_trgm", "papers", "title"),
+    ("idx_papers_abstract_trgm", "papers", "abstract"),
+    ("idx_papers_arxiv_id_trgm", "papers", "arxiv_id"),
+    ("idx_repos_full_name_trgm", "repositories", "full_name"),
+    ("idx_repos_description_trgm", "repositories", "description"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in _TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(_TRGM_INDEXES):
+        op.drop_index(name, table_name=table, postgresql_using="gin")
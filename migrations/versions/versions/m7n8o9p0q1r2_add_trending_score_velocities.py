@@ -0,0 +1,25 @@
+"""add velocity columns to trending_scores
+
+Revision ID: m7n8o9p0q1r2
+Revises: l6m7n8o9p0q1
+Create Date: 2026-10-15 10:20:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "m7n8o9p0q1r2"
+down_revision = "l6m7n8o9p0q1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("trending_scores", sa.Column("velocity_1d", sa.Float(), nullable=True))
+    op.add_column("trending_scores", sa.Column("velocity_7d", sa.Float(), nullable=True))
+    op.add_column("trending_scores", sa.Column("velocity_30d", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("trending_scores", "velocity_30d")
+    op.drop_column("trending_scores", "velocity_7d")
+    op.drop_column("trending_scores", "velocity_1d")
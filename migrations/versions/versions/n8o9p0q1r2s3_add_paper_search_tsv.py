@@ -0,0 +1,39 @@
+"""add generated full-text search column to papers
+
+Revision ID: n8o9p0q1r2s3
+Revises: m7n8o9p0q1r2
+Create Date: 2026-10-15 10:30:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+revision = "n8o9p0q1r2s3"
+down_revision = "m7n8o9p0q1r2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "papers",
+        sa.Column(
+            "search_tsv",
+            TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english'::regconfig, coalesce(abstract, '')), 'B') || "
+                "setweight(to_tsvector('simple'::regconfig, coalesce(arxiv_id, '')), 'A')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_papers_search_tsv", "papers", ["search_tsv"], unique=False, postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_papers_search_tsv", table_name="papers", postgresql_using="gin")
+    op.drop_column("papers", "search_tsv")
@@ -0,0 +1,35 @@
+"""store chat_messages.citations as JSONB
+
+Revision ID: o9p0q1r2s3t4
+Revises: n8o9p0q1r2s3
+Create Date: 2026-10-15 10:40:00.000000
+"""
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "o9p0q1r2s3t4"
+down_revision = "n8o9p0q1r2s3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "chat_messages",
+        "citations",
+        type_=postgresql.JSONB(),
+        existing_type=postgresql.JSON(),
+        existing_nullable=True,
+        postgresql_using="citations::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "chat_messages",
+        "citations",
+        type_=postgresql.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="citations::json",
+    )
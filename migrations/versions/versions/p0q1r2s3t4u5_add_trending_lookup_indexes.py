@@ -0,0 +1,35 @@
+"""add trending_scores lookup indexes ordered by total_score, id
+
+Revision ID: p0q1r2s3t4u5
+Revises: o9p0q1r2s3t4
+Create Date: 2026-10-15 10:50:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "p0q1r2s3t4u5"
+down_revision = "o9p0q1r2s3t4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_trending_type_score",
+        "trending_scores",
+        ["entity_type", sa.text("total_score DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_include=["entity_id"],
+    )
+    op.create_index(
+        "idx_trending_type_category_score",
+        "trending_scores",
+        ["entity_type", "category", sa.text("total_score DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_include=["entity_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_trending_type_category_score", table_name="trending_scores")
+    op.drop_index("idx_trending_type_score", table_name="trending_scores")
@@ -0,0 +1,25 @@
+"""add (conversation_id, created_at) index on chat_messages
+
+Revision ID: q1r2s3t4u5v6
+Revises: p0q1r2s3t4u5
+Create Date: 2026-10-15 11:00:00.000000
+"""
+from alembic import op
+
+revision = "q1r2s3t4u5v6"
+down_revision = "p0q1r2s3t4u5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_chat_messages_conversation_created",
+        "chat_messages",
+        ["conversation_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_chat_messages_conversation_created", table_name="chat_messages")
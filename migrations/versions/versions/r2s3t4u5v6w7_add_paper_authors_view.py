@@ -0,0 +1,53 @@
+"""add paper_authors_mv materialized view
+
+Revision ID: r2s3t4u5v6w7
+Revises: q1r2s3t4u5v6
+Create Date: 2026-10-15 11:10:00.000000
+"""
+from alembic import op
+
+revision = "r2s3t4u5v6w7"
+down_revision = "q1r2s3t4u5v6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per (paper, author) so author analytics don't re-run
+    # jsonb_array_elements over the whole papers heap on every request
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW paper_authors_mv AS
+        SELECT p.id AS paper_id,
+               a.pos AS author_pos,
+               a.author->>'name' AS author_name,
+               a.author->>'affiliation' AS affiliation,
+               jsonb_array_length(p.authors) AS author_count,
+               p.citation_count,
+               p.categories,
+               p.published_date
+        FROM papers p,
+             jsonb_array_elements(p.authors) WITH ORDINALITY AS a(author, pos)
+        WHERE p.authors IS NOT NULL
+          AND jsonb_typeof(p.authors) = 'array'
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        "idx_paper_authors_mv_paper_pos",
+        "paper_authors_mv",
+        ["paper_id", "author_pos"],
+        unique=True,
+    )
+    op.create_index("idx_paper_authors_mv_name", "paper_authors_mv", ["author_name"])
+    op.create_index("idx_paper_authors_mv_affiliation", "paper_authors_mv", ["affiliation"])
+    op.create_index(
+        "idx_paper_authors_mv_categories",
+        "paper_authors_mv",
+        ["categories"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS paper_authors_mv")
@@ -0,0 +1,50 @@
+"""add partial indexes for paper processing and listing filters
+
+Revision ID: s3t4u5v6w7x8
+Revises: r2s3t4u5v6w7
+Create Date: 2026-10-15 11:20:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "s3t4u5v6w7x8"
+down_revision = "r2s3t4u5v6w7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_papers_unprocessed",
+        "papers",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_processed = false"),
+    )
+    op.create_index(
+        "idx_papers_vietnamese_published",
+        "papers",
+        [sa.text("published_date DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_vietnamese = true"),
+    )
+    op.create_index(
+        "idx_papers_relevant_published",
+        "papers",
+        [sa.text("published_date DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_relevant = true"),
+    )
+    op.create_index(
+        "idx_papers_source_published",
+        "papers",
+        ["source", sa.text("published_date DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_papers_source_published", table_name="papers")
+    op.drop_index("idx_papers_relevant_published", table_name="papers")
+    op.drop_index("idx_papers_vietnamese_published", table_name="papers")
+    op.drop_index("idx_papers_unprocessed", table_name="papers")
@@ -0,0 +1,36 @@
+"""replace papers published_date index with (published_date, id) listing index
+
+Revision ID: t4u5v6w7x8y9
+Revises: s3t4u5v6w7x8
+Create Date: 2026-10-15 11:30:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "t4u5v6w7x8y9"
+down_revision = "s3t4u5v6w7x8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches list_papers' default order and keyset seek; its leading column
+    # also serves the date-range filters the old single-column index did
+    op.create_index(
+        "idx_papers_published_id",
+        "papers",
+        [sa.text("published_date DESC NULLS LAST"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_papers_published_date", table_name="papers", postgresql_using="btree")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_papers_published_date",
+        "papers",
+        ["published_date"],
+        unique=False,
+        postgresql_using="btree",
+    )
+    op.drop_index("idx_papers_published_id", table_name="papers")
@@ -0,0 +1,28 @@
+"""add partial GIN index on papers.topics for the research landscape
+
+Revision ID: v6w7x8y9z0a1
+Revises: t4u5v6w7x8y9
+Create Date: 2026-10-15 12:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "v6w7x8y9z0a1"
+down_revision = "t4u5v6w7x8y9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_papers_topics_landscape",
+        "papers",
+        ["topics"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_where=sa.text("topics IS NOT NULL AND published_date IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_papers_topics_landscape", table_name="papers")
@@ -0,0 +1,27 @@
+"""add partial index for the unprocessed repositories queue
+
+Revision ID: x8y9z0a1b2c3
+Revises: v6w7x8y9z0a1
+Create Date: 2026-10-15 12:40:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "x8y9z0a1b2c3"
+down_revision = "v6w7x8y9z0a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_repos_unprocessed",
+        "repositories",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("is_processed = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_repos_unprocessed", table_name="repositories")
@@ -0,0 +1,57 @@
+"""add reporting_tag_counts materialized view
+
+Revision ID: y9z0a1b2c3d4
+Revises: x8y9z0a1b2c3
+Create Date: 2026-10-15 13:00:00.000000
+"""
+from alembic import op
+
+revision = "y9z0a1b2c3d4"
+down_revision = "x8y9z0a1b2c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tag frequencies behind the weekly report and tech radar, so those tasks
+    # read a top-N off an index instead of unnesting every array column
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW reporting_tag_counts AS
+        SELECT 'framework' AS kind, tag, COUNT(*) AS count,
+               AVG(r.stars_count)::float AS avg_stars
+        FROM repositories r, unnest(r.frameworks) AS tag
+        WHERE r.frameworks IS NOT NULL
+        GROUP BY tag
+        UNION ALL
+        SELECT 'repo_topic', tag, COUNT(*), AVG(r.stars_count)::float
+        FROM repositories r, unnest(r.topics) AS tag
+        WHERE r.topics IS NOT NULL
+        GROUP BY tag
+        UNION ALL
+        SELECT 'paper_keyword', tag, COUNT(*), NULL
+        FROM papers p, unnest(p.keywords) AS tag
+        WHERE p.keywords IS NOT NULL
+        GROUP BY tag
+        UNION ALL
+        SELECT 'paper_topic', tag, COUNT(*), NULL
+        FROM papers p, unnest(p.topics) AS tag
+        WHERE p.topics IS NOT NULL
+        GROUP BY tag
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        "idx_reporting_tag_counts_kind_tag",
+        "reporting_tag_counts",
+        ["kind", "tag"],
+        unique=True,
+    )
+    op.execute(
+        "CREATE INDEX idx_reporting_tag_counts_kind_count "
+        "ON reporting_tag_counts (kind, count DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS reporting_tag_counts")
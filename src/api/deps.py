@@ -1,5 +1,6 @@
 """FastAPI dependencies for dependency injection."""
 
+from functools import lru_cache
 from typing import Annotated, Generic, TypeVar
 
 from fastapi import Depends, HTTPException, status
@@ -10,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import Settings, get_settings
 from src.core.security import decode_token
+from src.storage.cache.redis_client import RedisCache
 from src.storage.database import get_session
 
 T = TypeVar("T")
@@ -19,9 +21,12 @@ bearer_scheme = HTTPBearer(auto_error=False)
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    # None for keyset (cursor) pages, which skip the count
+    total: int | None
     skip: int
     limit: int
+    # Opaque cursor for the next page on endpoints with keyset pagination
+    next_cursor: str | None = None
 
 
 async def get_db() -> AsyncSession:
@@ -33,6 +38,12 @@ def get_config() -> Settings:
     return get_settings()
 
 
+@lru_cache
+def get_cache() -> RedisCache:
+    """Process-wide Redis cache; its connection pool is shared across requests."""
+    return RedisCache()
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
     db: AsyncSession = Depends(get_db),
@@ -77,5 +88,6 @@ async def get_optional_user(
 
 SettingsDep = Annotated[Settings, Depends(get_config)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+CacheDep = Annotated[RedisCache, Depends(get_cache)]
 get_current_user_dep = Annotated[object, Depends(get_current_user)]
 get_optional_user_dep = Annotated[object | None, Depends(get_optional_user)]
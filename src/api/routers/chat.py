@@ -1,7 +1,7 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -67,37 +67,34 @@ async def list_conversations(
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # Preview of each conversation's latest message, fetched in the same query
+    # via a LATERAL subquery instead of one query per conversation
+    last_message = (
+        select(func.left(ChatMessage.content, 100).label("preview"))
+        .where(ChatMessage.conversation_id == Conversation.id)
+        .order_by(ChatMessage.created_at.desc())
+        .limit(1)
+        .lateral("last_message")
+    )
     result = await db.execute(
-        select(Conversation)
+        select(Conversation, last_message.c.preview)
+        .outerjoin(last_message, true())
         .where(Conversation.user_id == user.id)
         .order_by(Conversation.updated_at.desc())
     )
-    conversations = result.scalars().all()
-
-    items = []
-    for conv in conversations:
-        # Get last message preview
-        msg_result = await db.execute(
-            select(ChatMessage)
-            .where(ChatMessage.conversation_id == conv.id)
-            .order_by(ChatMessage.created_at.desc())
-            .limit(1)
-        )
-        last_msg = msg_result.scalar_one_or_none()
-        preview = last_msg.content[:100] if last_msg else None
-
-        items.append(
-            ConversationResponse(
-                id=str(conv.id),
-                title=conv.title,
-                mode=conv.chat_mode,
-                context_mode=conv.context_mode,
-                created_at=conv.created_at,
-                updated_at=conv.updated_at,
-                last_message_preview=preview,
-            )
+
+    return [
+        ConversationResponse(
+            id=str(conv.id),
+            title=conv.title,
+            mode=conv.chat_mode,
+            context_mode=conv.context_mode,
+            created_at=conv.created_at,
+            updated_at=conv.updated_at,
+            last_message_preview=preview,
         )
-    return items
+        for conv, preview in result.all()
+    ]
 
 
 @router.post("/conversations", response_model=ConversationResponse, status_code=201)
@@ -1,5 +1,6 @@
 """Document Chat API — embed user documents, manage conversation sources."""
 
+import asyncio
 import uuid
 
 from fastapi import APIRouter, Depends, Query
@@ -516,8 +517,8 @@ async def embed_repos(
                 emb_record.error_message = None
                 await db.flush()
 
-            # Chunk repo content
-            chunks_data = chunk_repo_content(repo_content)
+            # Chunk repo content off the event loop; dumps can be several MB
+            chunks_data = await asyncio.to_thread(chunk_repo_content, repo_content)
             if not chunks_data:
                 emb_record.status = "failed"
                 emb_record.error_message = "No content chunks produced"
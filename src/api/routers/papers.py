@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException, Query, UploadFile
 
 from fastapi import Body
 
-from src.api.deps import DbSession, PaginatedResponse
+from src.api.deps import CacheDep, DbSession, PaginatedResponse
 from src.api.schemas.paper import (
     AuthorAnalyticsResponse,
     AuthorComparisonResponse,
@@ -77,12 +77,13 @@ async def list_papers(
 @router.get("/stats", response_model=PaperStatsResponse)
 async def get_paper_stats(
     db: DbSession,
+    cache: CacheDep,
     category: str | None = None,
     topic: str | None = None,
     search: str | None = None,
     source: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     stats = await repo.get_stats(
         category=category,
         topic=topic,
@@ -93,9 +94,9 @@ async def get_paper_stats(
 
 
 @router.get("/categories")
-async def list_paper_categories(db: DbSession):
+async def list_paper_categories(db: DbSession, cache: CacheDep):
     """Return all known paper categories from the database."""
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     stats = await repo.get_stats()
     categories = sorted(stats["category_distribution"].keys())
     return {"categories": categories}
@@ -133,10 +134,11 @@ def _normalize_title(title: str) -> str:
 @router.get("/analytics/authors", response_model=AuthorAnalyticsResponse)
 async def get_author_analytics(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(20, ge=1, le=100),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_author_analytics(limit=limit, category=category)
     return AuthorAnalyticsResponse(**data)
 
@@ -144,11 +146,12 @@ async def get_author_analytics(
 @router.get("/analytics/keywords", response_model=KeywordAnalyticsResponse)
 async def get_keyword_analytics(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(50, ge=1, le=200),
     category: str | None = None,
     year: int | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_keyword_analytics(limit=limit, category=category, year=year)
     return KeywordAnalyticsResponse(**data)
 
@@ -156,11 +159,12 @@ async def get_keyword_analytics(
 @router.get("/analytics/network", response_model=CoAuthorNetworkResponse)
 async def get_coauthor_network(
     db: DbSession,
+    cache: CacheDep,
     min_collabs: int = Query(2, ge=1),
     limit: int = Query(100, ge=1, le=500),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_coauthor_network(
         min_collabs=min_collabs, limit=limit, category=category
     )
@@ -170,10 +174,11 @@ async def get_coauthor_network(
 @router.get("/analytics/trends", response_model=KeywordTrendResponse)
 async def get_keyword_trends(
     db: DbSession,
+    cache: CacheDep,
     top_n: int = Query(10, ge=1, le=30),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_keyword_trends(top_n=top_n, category=category)
     return KeywordTrendResponse(**data)
 
@@ -181,11 +186,12 @@ async def get_keyword_trends(
 @router.get("/analytics/topic-network", response_model=TopicCoOccurrenceResponse)
 async def get_topic_cooccurrence(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(80, ge=1, le=300),
     min_cooccurrence: int = Query(5, ge=1),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_topic_cooccurrence(
         limit=limit, min_cooccurrence=min_cooccurrence, category=category
     )
@@ -195,10 +201,11 @@ async def get_topic_cooccurrence(
 @router.get("/analytics/citation-timeline", response_model=CitationTimelineResponse)
 async def get_citation_timeline(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(8, ge=1, le=20),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_citation_timeline(limit=limit, category=category)
     return CitationTimelineResponse(**data)
 
@@ -206,9 +213,10 @@ async def get_citation_timeline(
 @router.get("/analytics/category-heatmap", response_model=CategoryHeatmapResponse)
 async def get_category_heatmap(
     db: DbSession,
+    cache: CacheDep,
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_category_heatmap(category=category)
     return CategoryHeatmapResponse(**data)
 
@@ -216,11 +224,12 @@ async def get_category_heatmap(
 @router.get("/analytics/topic-correlation", response_model=TopicCorrelationResponse)
 async def get_topic_correlation(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(15, ge=5, le=30),
     min_cooccurrence: int = Query(10, ge=1),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_topic_correlation(
         limit=limit, min_cooccurrence=min_cooccurrence, category=category
     )
@@ -230,10 +239,11 @@ async def get_topic_correlation(
 @router.get("/analytics/institutions", response_model=InstitutionRankingResponse)
 async def get_institution_ranking(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(30, ge=1, le=100),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_institution_ranking(limit=limit, category=category)
     return InstitutionRankingResponse(**data)
 
@@ -241,11 +251,12 @@ async def get_institution_ranking(
 @router.post("/analytics/author-comparison", response_model=AuthorComparisonResponse)
 async def compare_authors(
     db: DbSession,
+    cache: CacheDep,
     author_names: list[str] = Body(..., embed=True),
 ):
     if len(author_names) > 5:
         raise HTTPException(400, "Maximum 5 authors for comparison")
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_author_comparison(author_names)
     return AuthorComparisonResponse(**data)
 
@@ -253,10 +264,11 @@ async def compare_authors(
 @router.get("/analytics/landscape", response_model=ResearchLandscapeResponse)
 async def get_research_landscape(
     db: DbSession,
+    cache: CacheDep,
     limit: int = Query(50, ge=10, le=100),
     category: str | None = None,
 ):
-    repo = PaperRepository(db)
+    repo = PaperRepository(db, cache=cache)
     data = await repo.get_research_landscape(limit=limit, category=category)
     return ResearchLandscapeResponse(**data)
 
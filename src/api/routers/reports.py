@@ -2,6 +2,7 @@ from datetime import date, timedelta
 
 from fastapi import APIRouter, Query, Response
 from sqlalchemy import select
+from sqlalchemy.orm import defer
 
 from src.api.deps import DbSession
 from src.api.schemas.report import (
@@ -68,6 +69,13 @@ async def get_report_history(
     """Get past weekly reports."""
     result = await db.execute(
         select(WeeklyReport)
+        .options(
+            # The history list shows only headline fields; skip the large blobs
+            defer(WeeklyReport.content),
+            defer(WeeklyReport.top_papers),
+            defer(WeeklyReport.top_repos),
+            defer(WeeklyReport.trending_topics),
+        )
         .order_by(WeeklyReport.created_at.desc())
         .limit(limit)
     )
@@ -110,7 +118,13 @@ async def download_report(
 ):
     """Download a specific report as markdown."""
     result = await db.execute(
-        select(WeeklyReport).where(WeeklyReport.id == report_id)
+        select(WeeklyReport)
+        .options(
+            defer(WeeklyReport.top_papers),
+            defer(WeeklyReport.top_repos),
+            defer(WeeklyReport.trending_topics),
+        )
+        .where(WeeklyReport.id == report_id)
     )
     report = result.scalar_one_or_none()
 
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Query
+import base64
+import uuid
+
+from fastapi import APIRouter, HTTPException, Query
 from sqlalchemy import select
 
-from src.api.deps import DbSession, PaginatedResponse
+from src.api.deps import CacheDep, DbSession, PaginatedResponse
 from src.api.schemas.search import (
     HFFiltersResponse,
     HFKeywordTrend,
@@ -19,14 +22,31 @@ from src.storage.models.paper import Paper
 from src.storage.models.repository import Repository
 from src.storage.models.tech_radar import TechRadarSnapshot
 from src.storage.repositories.hf_repo import HFModelRepository, HFPaperRepository
-from src.storage.repositories.metrics_repo import MetricsRepository
+from src.storage.repositories.metrics_repo import MetricsRepository, TrendingCursor
 
 router = APIRouter(prefix="/trending", tags=["Trending"])
 
 
+def _encode_cursor(cursor: TrendingCursor | None) -> str | None:
+    if cursor is None:
+        return None
+    score, entity_id = cursor
+    return base64.urlsafe_b64encode(f"{score!r}:{entity_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str | None) -> TrendingCursor | None:
+    if not cursor:
+        return None
+    try:
+        score, entity_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return float(score), uuid.UUID(entity_id)
+    except ValueError:
+        raise HTTPException(400, "Invalid cursor")
+
+
 @router.get("/filters", response_model=TrendingFiltersResponse)
-async def get_trending_filters(db: DbSession):
-    metrics = MetricsRepository(db)
+async def get_trending_filters(db: DbSession, cache: CacheDep):
+    metrics = MetricsRepository(db, cache=cache)
     filters = await metrics.get_trending_filters()
     return TrendingFiltersResponse(**filters)
 
@@ -39,12 +59,14 @@ async def get_trending_papers(
     search: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    after: str | None = Query(None, description="next_cursor of the previous page"),
 ):
     metrics = MetricsRepository(db)
+    after_key = _decode_cursor(after)
 
     if search:
-        rows, total = await metrics.get_trending_papers_with_search(
-            category=category, search=search, skip=skip, limit=limit
+        rows, total, next_key = await metrics.get_trending_papers_with_search(
+            category=category, search=search, skip=skip, limit=limit, after=after_key
         )
         if not rows:
             return PaginatedResponse(items=[], total=total, skip=skip, limit=limit)
@@ -61,10 +83,13 @@ async def get_trending_papers(
             )
             for t, paper in rows
         ]
-        return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+        return PaginatedResponse(
+            items=items, total=total, skip=skip, limit=limit,
+            next_cursor=_encode_cursor(next_key),
+        )
 
-    trending, total = await metrics.get_trending(
-        entity_type="paper", category=category, skip=skip, limit=limit
+    trending, total, next_key = await metrics.get_trending(
+        entity_type="paper", category=category, skip=skip, limit=limit, after=after_key
     )
 
     if not trending:
@@ -93,7 +118,10 @@ async def get_trending_papers(
                 primary_category=primary_category,
             )
         )
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse(
+        items=items, total=total, skip=skip, limit=limit,
+        next_cursor=_encode_cursor(next_key),
+    )
 
 
 @router.get("/repos", response_model=PaginatedResponse[TrendingRepoResponse])
@@ -105,13 +133,16 @@ async def get_trending_repos(
     search: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    after: str | None = Query(None, description="next_cursor of the previous page"),
 ):
     metrics = MetricsRepository(db)
+    after_key = _decode_cursor(after)
     topics_list = [t.strip() for t in topic.split(",") if t.strip()] if topic else None
 
     if language or topics_list or search:
-        rows, total = await metrics.get_trending_with_language(
-            language=language, topics=topics_list, search=search, skip=skip, limit=limit
+        rows, total, next_key = await metrics.get_trending_with_language(
+            language=language, topics=topics_list, search=search,
+            skip=skip, limit=limit, after=after_key,
         )
         if not rows:
             return PaginatedResponse(items=[], total=total, skip=skip, limit=limit)
@@ -128,10 +159,13 @@ async def get_trending_repos(
             )
             for t, repo in rows
         ]
-        return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+        return PaginatedResponse(
+            items=items, total=total, skip=skip, limit=limit,
+            next_cursor=_encode_cursor(next_key),
+        )
 
-    trending, total = await metrics.get_trending(
-        entity_type="repository", skip=skip, limit=limit
+    trending, total, next_key = await metrics.get_trending(
+        entity_type="repository", skip=skip, limit=limit, after=after_key
     )
 
     if not trending:
@@ -159,7 +193,10 @@ async def get_trending_repos(
                 primary_language=repo.primary_language,
             )
         )
-    return PaginatedResponse(items=items, total=total, skip=skip, limit=limit)
+    return PaginatedResponse(
+        items=items, total=total, skip=skip, limit=limit,
+        next_cursor=_encode_cursor(next_key),
+    )
 
 
 @router.get("/tech-radar", response_model=TechRadarResponse)
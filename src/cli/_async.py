@@ -1,16 +1,57 @@
 """Async runner helper for CLI commands."""
 
 import asyncio
-from collections.abc import Coroutine
+import atexit
+from collections.abc import Awaitable, Callable, Coroutine
 from typing import TypeVar
 
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
 T = TypeVar("T")
 
+_loop: asyncio.AbstractEventLoop | None = None
+_shutdown_hooks: list[Callable[[], Awaitable[None]]] = []
 
-def run(coro: Coroutine[None, None, T]) -> T:
-    """Run an async coroutine synchronously."""
-    loop = asyncio.new_event_loop()
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide CLI event loop, creating it on first use.
+
+    Keeping one loop alive for the whole process lets shared clients
+    (HTTP pools, LLM clients) survive across ``run()`` calls.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        atexit.register(_shutdown)
+    return _loop
+
+
+def on_shutdown(hook: Callable[[], Awaitable[None]]) -> None:
+    """Register an async cleanup callback run on the CLI loop at process exit."""
+    _shutdown_hooks.append(hook)
+
+
+def _shutdown() -> None:
+    loop = _loop
+    if loop is None or loop.is_closed():
+        return
     try:
-        return loop.run_until_complete(coro)
+        while _shutdown_hooks:
+            hook = _shutdown_hooks.pop()
+            try:
+                loop.run_until_complete(hook())
+            except Exception:
+                logger.warning(
+                    "CLI shutdown hook failed",
+                    hook=getattr(hook, "__qualname__", repr(hook)),
+                    exc_info=True,
+                )
     finally:
         loop.close()
+
+
+def run(coro: Coroutine[None, None, T]) -> T:
+    """Run an async coroutine synchronously."""
+    return _get_loop().run_until_complete(coro)
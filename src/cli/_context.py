@@ -1,10 +1,12 @@
 """Factory functions for CLI dependencies."""
 
+import functools
 import socket
 from urllib.parse import urlparse, urlunparse
 
 from rich.console import Console
 
+from src.cli._async import on_shutdown
 from src.core.config import Settings, get_settings
 
 console = Console(stderr=True)
@@ -48,11 +50,39 @@ def get_cli_settings() -> Settings:
     return get_settings()
 
 
+def _memoize_success(func):
+    """Cache a factory's result per arguments, but only when it isn't None.
+
+    Unlike lru_cache, a failed construction (None) is not remembered, so the
+    next call in the same process retries instead of reusing the failure.
+    """
+    results: dict = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in results:
+            value = func(*args, **kwargs)
+            if value is None:
+                return None
+            results[key] = value
+        return results[key]
+
+    return wrapper
+
+
+@_memoize_success
 def get_session_factory():
-    """Create async session factory. Returns None if DB is unavailable."""
+    """Get the process-wide async session factory. Returns None if DB is unavailable.
+
+    The engine and its connection pool are shared by every command in the
+    process and disposed at process exit.
+    """
     try:
         from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+        from src.storage.database import ASYNCPG_CONNECT_ARGS
+
         settings = get_cli_settings()
         db_url = _localize_url(settings.DATABASE_URL)
         _engine = create_async_engine(
@@ -61,7 +91,9 @@ def get_session_factory():
             pool_size=5,
             max_overflow=5,
             pool_pre_ping=True,
+            connect_args=ASYNCPG_CONNECT_ARGS,
         )
+        on_shutdown(_engine.dispose)
         return async_sessionmaker(
             _engine,
             class_=AsyncSession,
@@ -72,8 +104,13 @@ def get_session_factory():
         return None
 
 
+@_memoize_success
 def get_llm_client(cloud: bool = False):
-    """Get LLM client. Returns None if unavailable."""
+    """Get the process-wide LLM client. Returns None if unavailable.
+
+    Clients are cached per ``cloud`` flag so every command in the process
+    shares one HTTP connection pool; they are closed at process exit.
+    """
     settings = get_cli_settings()
     try:
         if cloud:
@@ -82,7 +119,7 @@ def get_llm_client(cloud: bool = False):
                 return None
             from src.llm.openai_client import OpenAIClient
 
-            return OpenAIClient(
+            llm = OpenAIClient(
                 api_key=settings.OPENAI_API_KEY,
                 model=settings.CLOUD_LLM_MODEL,
             )
@@ -90,13 +127,15 @@ def get_llm_client(cloud: bool = False):
             from src.llm.ollama_client import OllamaClient
 
             base_url = _localize_url(settings.LOCAL_LLM_URL)
-            return OllamaClient(
+            llm = OllamaClient(
                 base_url=base_url,
                 model=settings.LOCAL_LLM_MODEL,
             )
     except Exception as e:
         console.print(f"[yellow]Warning: LLM client unavailable ({e})[/yellow]")
         return None
+    on_shutdown(llm.close)
+    return llm
 
 
 def get_vector_store():
@@ -128,3 +167,18 @@ def get_embedding_generator():
     except Exception as e:
         console.print(f"[yellow]Warning: Embedding model unavailable ({e})[/yellow]")
         return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_arxiv_collector():
+    """Get a process-wide ArxivCollector with an open HTTP client.
+
+    Reusing one collector keeps the connection to export.arxiv.org alive
+    across repeated lookups; the client is closed at process exit.
+    """
+    from src.collectors.arxiv import ArxivCollector
+
+    collector = ArxivCollector()
+    collector._open_client()
+    on_shutdown(collector.client.aclose)
+    return collector
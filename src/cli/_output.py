@@ -1,8 +1,8 @@
 """Rich formatting helpers and file writers for CLI output."""
 
-import json
 from pathlib import Path
 
+import orjson
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -164,6 +164,12 @@ def write_json(path: Path | str, data: dict | list) -> Path:
         ensure_reports_dir()
         path = REPORTS_DIR / path
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, default=str, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(
+        orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    )
     console.print(f"[green]Written:[/green] {path}")
     return path
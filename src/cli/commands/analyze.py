@@ -35,21 +35,17 @@ async def _analyze_paper(
     output: Path | None,
     save_db: bool,
 ) -> None:
-    from src.cli._context import get_llm_client
-    from src.collectors.arxiv import ArxivCollector
+    from src.cli._context import get_arxiv_collector, get_llm_client
 
     # Fetch paper by ID using ArXiv id_list parameter
     console.print(f"Fetching paper [cyan]{arxiv_id}[/cyan]...")
-    paper_data = None
-    async with ArxivCollector() as collector:
-        response = await collector._request(
-            "GET",
-            collector.BASE_URL,
-            params={"id_list": arxiv_id, "max_results": 1},
-        )
-        papers = collector._parse_response(response.text)
-        if papers:
-            paper_data = papers[0]
+    collector = get_arxiv_collector()
+    response = await collector._request(
+        "GET",
+        collector.BASE_URL,
+        params={"id_list": arxiv_id, "max_results": 1},
+    )
+    paper_data = collector._parse_one(response.text)
 
     if not paper_data:
         console.print(f"[red]Paper {arxiv_id} not found[/red]")
@@ -77,9 +73,6 @@ async def _analyze_paper(
 
     _write_analysis_report(output, arxiv_id, paper_data, analysis)
 
-    if hasattr(llm, "close"):
-        await llm.close()
-
 
 async def _run_analysis(llm, title: str, abstract: str) -> dict:
     import json as _json
@@ -291,6 +284,3 @@ async def _analyze_batch(
     else:
         write_json(f"batch_analysis_{safe_query}.json", all_analyses)
         write_markdown(f"batch_analysis_{safe_query}.md", md)
-
-    if hasattr(llm, "close"):
-        await llm.close()
@@ -1,10 +1,14 @@
 """rri chat - Interactive RAG REPL."""
 
 import sys
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Annotated, Optional
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
@@ -12,6 +16,42 @@ from src.cli._async import run
 
 console = Console()
 
+_DEFAULT_COLLECTIONS = ("papers", "repositories", "chunks")
+
+_SOURCE_ICONS = {
+    "papers": "[cyan][Paper][/cyan]",
+    "repositories": "[green][Repo][/green]",
+    "chunks": "[yellow][Chunk][/yellow]",
+}
+
+_CODE_THEME = "monokai"
+
+# Query embeddings kept for repeated/refined questions within a session
+_EMBEDDING_CACHE_SIZE = 32
+
+
+def _answer_markdown(text: str) -> Markdown:
+    """Build the Markdown renderable for an answer (parsed once, printed once)."""
+    return Markdown(text, code_theme=_CODE_THEME, hyperlinks=False)
+
+
+async def _print_streamed_answer(chunks: AsyncIterator[str]) -> str:
+    """Render an answer live as chunks arrive; returns the full text."""
+    parts: list[str] = []
+    last_render = 0.0
+    console.print()
+    with Live(console=console, refresh_per_second=15) as live:
+        async for chunk in chunks:
+            parts.append(chunk)
+            now = time.monotonic()
+            # Re-parsing the markdown on every token is wasteful; match the refresh rate
+            if now - last_render >= 1 / 15:
+                live.update(_answer_markdown("".join(parts)))
+                last_render = now
+        answer = "".join(parts)
+        live.update(_answer_markdown(answer))
+    return answer
+
 
 def chat_command(
     cloud: Annotated[bool, typer.Option(help="Use cloud LLM (OpenAI)")] = False,
@@ -25,7 +65,7 @@ def chat_command(
             "Use: [bold]docker exec -it rri-app-1 rri chat[/bold]"
         )
         raise typer.Exit(1)
-    collections = collection or ["papers", "repositories", "chunks"]
+    collections = collection or list(_DEFAULT_COLLECTIONS)
     run(_chat_loop(cloud, no_rerank, collections))
 
 
@@ -63,6 +103,30 @@ async def _chat_loop(cloud: bool, no_rerank: bool, collections: list[str]) -> No
             llm_client=llm,
         )
 
+        # Restrict retrieval to the selected collections and reuse embeddings
+        # of queries already seen in this session
+        _orig_retrieve = retriever.retrieve
+        embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+
+        async def _filtered_retrieve(query, top_k=10, filters=None, **kw):
+            query_embedding = embedding_cache.get(query)
+            if query_embedding is None:
+                query_embedding = embedding_gen.embed(query)
+                embedding_cache[query] = query_embedding
+                if len(embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                    embedding_cache.popitem(last=False)
+            else:
+                embedding_cache.move_to_end(query)
+            return await _orig_retrieve(
+                query,
+                top_k=top_k,
+                filters=filters,
+                collections=collections,
+                query_embedding=query_embedding,
+            )
+
+        retriever.retrieve = _filtered_retrieve
+
     mode = "cloud" if cloud else "local"
     rerank_status = "off" if no_rerank else "on"
     rag_status = "on" if rag_available else "[yellow]off (no vector store)[/yellow]"
@@ -86,32 +150,16 @@ async def _chat_loop(cloud: bool, no_rerank: bool, collections: list[str]) -> No
         if question.lower() in ("quit", "exit", "q"):
             break
 
-        _SOURCE_ICONS = {
-            "papers": "[cyan][Paper][/cyan]",
-            "repositories": "[green][Repo][/green]",
-            "chunks": "[yellow][Chunk][/yellow]",
-        }
-
         try:
             if pipeline and retriever:
-                # Patch retriever to use selected collections
-                _orig_retrieve = retriever.retrieve
-
-                async def _filtered_retrieve(query, top_k=10, filters=None, **kw):
-                    return await _orig_retrieve(query, top_k=top_k, filters=filters, collections=collections)
-
-                retriever.retrieve = _filtered_retrieve
-
                 response = await pipeline.query(
                     question=question,
                     top_k=10,
                     rerank_top_k=5,
                 )
 
-                retriever.retrieve = _orig_retrieve
-
                 console.print()
-                console.print(Markdown(response.answer))
+                console.print(_answer_markdown(response.answer))
 
                 if response.sources:
                     console.print("\n[dim]Sources:[/dim]")
@@ -131,19 +179,16 @@ async def _chat_loop(cloud: bool, no_rerank: bool, collections: list[str]) -> No
                 console.print(f"\n[dim]Confidence: {response.confidence:.0%}[/dim]")
             else:
                 # Direct LLM mode (no RAG)
-                answer = await llm.generate(
-                    question,
-                    max_tokens=1000,
-                    temperature=0.7,
-                    system_prompt="You are a helpful research assistant. Answer questions clearly and concisely.",
+                await _print_streamed_answer(
+                    llm.stream_generate(
+                        question,
+                        max_tokens=1000,
+                        temperature=0.7,
+                        system_prompt="You are a helpful research assistant. Answer questions clearly and concisely.",
+                    )
                 )
-                console.print()
-                console.print(Markdown(answer))
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
 
     console.print("\n[dim]Goodbye![/dim]")
-
-    if hasattr(llm, "close"):
-        await llm.close()
@@ -1,5 +1,6 @@
 """rri export - Export reports and data."""
 
+import asyncio
 import csv
 import io
 from datetime import date, timedelta
@@ -32,7 +33,7 @@ async def _export_report(
     output: Path | None,
 ) -> None:
     from src.cli._context import get_llm_client, get_session_factory
-    from src.llm.prompts.analysis import WEEKLY_REPORT_PROMPT
+    from src.llm.prompts.analysis import WEEKLY_REPORT_SYSTEM, WEEKLY_REPORT_USER
     from src.storage.repositories.paper_repo import PaperRepository
 
     factory = get_session_factory()
@@ -44,30 +45,36 @@ async def _export_report(
     period_end = date.today()
     period_start = period_end - timedelta(days=days)
 
-    # Gather data
+    # Gather data, building the LLM client while the query runs
     async with factory() as session:
         repo = PaperRepository(session)
 
-        papers, total = await repo.list_papers(
-            skip=0,
-            limit=50,
-            date_from=period_start,
-            date_to=period_end,
-            sort_by="published_date",
-            sort_order="desc",
-        )
-
+        async with asyncio.TaskGroup() as tg:
+            papers_task = tg.create_task(
+                repo.list_papers(
+                    skip=0,
+                    limit=50,
+                    date_from=period_start,
+                    date_to=period_end,
+                    sort_by="published_date",
+                    sort_order="desc",
+                )
+            )
+            llm_task = tg.create_task(asyncio.to_thread(get_llm_client, cloud=cloud))
+
+    papers, total = papers_task.result()
     if not papers:
         console.print("[yellow]No papers found for this period[/yellow]")
         raise typer.Exit(0)
 
     # Build summary
+    top = papers[:20]
+    categories = [", ".join(p.categories or ()) for p in top]
     papers_summary = "\n".join(
-        f"- {p.title} (categories: {', '.join(p.categories or [])})"
-        for p in papers[:20]
+        map("- {} (categories: {})".format, (p.title for p in top), categories)
     )
 
-    llm = get_llm_client(cloud=cloud)
+    llm = llm_task.result()
     if not llm:
         console.print("[red]LLM client required for report generation[/red]")
         raise typer.Exit(1)
@@ -75,7 +82,7 @@ async def _export_report(
     with create_progress() as progress:
         progress.add_task("Generating report...", total=None)
 
-        prompt = WEEKLY_REPORT_PROMPT.format(
+        prompt = WEEKLY_REPORT_USER.format(
             period_start=period_start,
             period_end=period_end,
             paper_count=total,
@@ -85,11 +92,21 @@ async def _export_report(
             changes_summary="N/A",
         )
 
-        report_data = await llm.generate_json(prompt, max_tokens=2000, temperature=0.3)
+        report_data = await llm.generate_json(
+            prompt,
+            max_tokens=2000,
+            temperature=0.3,
+            system_prompt=WEEKLY_REPORT_SYSTEM,
+        )
 
     if not report_data:
         # Fallback to plain text
-        report_text = await llm.generate(prompt, max_tokens=2000, temperature=0.3)
+        report_text = await llm.generate(
+            prompt,
+            max_tokens=2000,
+            temperature=0.3,
+            system_prompt=WEEKLY_REPORT_SYSTEM,
+        )
         report_data = {
             "title": f"{period.title()} Research Report: {period_start} - {period_end}",
             "content": report_text,
@@ -106,23 +123,69 @@ async def _export_report(
         else:
             write_json(f"{filename}.json", report_data)
     else:
-        md = f"# {report_data.get('title', 'Report')}\n\n"
+        buf = io.StringIO()
+        buf.write(f"# {report_data.get('title', 'Report')}\n\n")
         if report_data.get("summary"):
-            md += f"## Summary\n{report_data['summary']}\n\n"
+            buf.write(f"## Summary\n{report_data['summary']}\n\n")
         if report_data.get("highlights"):
-            md += "## Highlights\n"
+            buf.write("## Highlights\n")
             for h in report_data["highlights"]:
-                md += f"- {h}\n"
-            md += "\n"
+                buf.write(f"- {h}\n")
+            buf.write("\n")
         if report_data.get("content"):
-            md += report_data["content"]
+            buf.write(report_data["content"])
+        md = buf.getvalue()
         if output:
             write_markdown(output / f"{filename}.md", md)
         else:
             write_markdown(f"{filename}.md", md)
 
-    if hasattr(llm, "close"):
-        await llm.close()
+
+_PAPER_EXPORT_FIELDS = (
+    "id",
+    "arxiv_id",
+    "title",
+    "authors",
+    "categories",
+    "published_date",
+    "summary",
+    "source",
+)
+
+
+def _paper_export_row(p) -> dict:
+    return {
+        "id": str(p.id),
+        "arxiv_id": p.arxiv_id or "",
+        "title": p.title,
+        "authors": ", ".join(
+            a.get("name", "") if isinstance(a, dict) else str(a)
+            for a in (p.authors or [])
+        ),
+        "categories": ", ".join(p.categories or []),
+        "published_date": str(p.published_date or ""),
+        "summary": p.summary or "",
+        "source": p.source or "",
+    }
+
+
+def _write_papers_csv(out_path: Path, paper_rows) -> None:
+    """Write export rows as CSV, using polars' native writer when installed."""
+    try:
+        import polars as pl
+    except ImportError:
+        with out_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_PAPER_EXPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(paper_rows)
+        return
+
+    rows = list(paper_rows)
+    df = pl.DataFrame(
+        {field: [row[field] for row in rows] for field in _PAPER_EXPORT_FIELDS},
+        schema={field: pl.Utf8 for field in _PAPER_EXPORT_FIELDS},
+    )
+    df.write_csv(out_path)
 
 
 @app.command()
@@ -161,21 +224,8 @@ async def _export_papers(
 
     console.print(f"[green]Exporting {len(results)} papers[/green]")
 
-    paper_dicts = []
-    for p in results:
-        paper_dicts.append({
-            "id": str(p.id),
-            "arxiv_id": p.arxiv_id or "",
-            "title": p.title,
-            "authors": ", ".join(
-                a.get("name", "") if isinstance(a, dict) else str(a)
-                for a in (p.authors or [])
-            ),
-            "categories": ", ".join(p.categories or []),
-            "published_date": str(p.published_date or ""),
-            "summary": p.summary or "",
-            "source": p.source or "",
-        })
+    # Rows are built lazily so CSV/markdown output streams straight from results
+    paper_rows = map(_paper_export_row, results)
 
     from src.cli._output import ensure_reports_dir, REPORTS_DIR
 
@@ -186,29 +236,26 @@ async def _export_papers(
             ensure_reports_dir()
             out_path = REPORTS_DIR / "papers_export.csv"
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        buf = io.StringIO()
-        if paper_dicts:
-            writer = csv.DictWriter(buf, fieldnames=paper_dicts[0].keys())
-            writer.writeheader()
-            writer.writerows(paper_dicts)
-        out_path.write_text(buf.getvalue(), encoding="utf-8")
+        _write_papers_csv(out_path, paper_rows)
         console.print(f"[green]Written:[/green] {out_path}")
     elif format == "json":
         if output:
-            write_json(output, paper_dicts)
+            write_json(output, list(paper_rows))
         else:
-            write_json("papers_export.json", paper_dicts)
+            write_json("papers_export.json", list(paper_rows))
     else:
-        md = "# Papers Export\n\n"
-        for p in paper_dicts:
-            md += f"## {p['title']}\n"
-            md += f"- **ID:** {p['arxiv_id'] or p['id']}\n"
-            md += f"- **Authors:** {p['authors']}\n"
-            md += f"- **Date:** {p['published_date']}\n"
-            md += f"- **Categories:** {p['categories']}\n"
+        buf = io.StringIO()
+        buf.write("# Papers Export\n\n")
+        for p in paper_rows:
+            buf.write(f"## {p['title']}\n")
+            buf.write(f"- **ID:** {p['arxiv_id'] or p['id']}\n")
+            buf.write(f"- **Authors:** {p['authors']}\n")
+            buf.write(f"- **Date:** {p['published_date']}\n")
+            buf.write(f"- **Categories:** {p['categories']}\n")
             if p['summary']:
-                md += f"\n{p['summary']}\n"
-            md += "\n---\n\n"
+                buf.write(f"\n{p['summary']}\n")
+            buf.write("\n---\n\n")
+        md = buf.getvalue()
         if output:
             write_markdown(output, md)
         else:
@@ -5,6 +5,7 @@ API Docs: https://info.arxiv.org/help/api/index.html
 Rate Limit: 1 request per 3 seconds
 """
 
+import io
 import xml.etree.ElementTree as ET
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
@@ -125,56 +126,65 @@ class ArxivCollector(BaseCollector):
 
         return " AND ".join(parts) if parts else "all:*"
 
+    _NS = {
+        "atom": "http://www.w3.org/2005/Atom",
+        "arxiv": "http://arxiv.org/schemas/atom",
+    }
+    _ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
+
     def _parse_response(self, xml_content: str) -> list[ArxivPaper]:
         root = ET.fromstring(xml_content)
-        ns = {
-            "atom": "http://www.w3.org/2005/Atom",
-            "arxiv": "http://arxiv.org/schemas/atom",
-        }
-
-        papers = []
-        for entry in root.findall("atom:entry", ns):
-            id_url = entry.find("atom:id", ns).text
-            arxiv_id = id_url.split("/abs/")[-1]
-
-            authors = []
-            for author in entry.findall("atom:author", ns):
-                name = author.find("atom:name", ns).text
-                affiliation = author.find("arxiv:affiliation", ns)
-                authors.append(
-                    {
-                        "name": name,
-                        "affiliation": affiliation.text
-                        if affiliation is not None
-                        else None,
-                    }
-                )
-
-            categories = [
-                cat.get("term") for cat in entry.findall("atom:category", ns)
-            ]
-
-            comment_el = entry.find("arxiv:comment", ns)
-
-            papers.append(
-                ArxivPaper(
-                    arxiv_id=arxiv_id,
-                    title=entry.find("atom:title", ns).text.strip(),
-                    abstract=entry.find("atom:summary", ns).text.strip(),
-                    authors=authors,
-                    categories=categories,
-                    published_date=_parse_date(
-                        entry.find("atom:published", ns).text
-                    ),
-                    updated_date=_parse_date(
-                        entry.find("atom:updated", ns).text
-                    ),
-                    pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
-                    comment=comment_el.text if comment_el is not None else None,
-                )
+        return [
+            self._parse_entry(entry)
+            for entry in root.findall("atom:entry", self._NS)
+        ]
+
+    def _parse_one(self, xml_content: str) -> ArxivPaper | None:
+        """Parse only the first entry of a feed, stopping as soon as it closes."""
+        for _, elem in ET.iterparse(io.StringIO(xml_content), events=("end",)):
+            if elem.tag == self._ENTRY_TAG:
+                return self._parse_entry(elem)
+        return None
+
+    def _parse_entry(self, entry: ET.Element) -> ArxivPaper:
+        ns = self._NS
+        id_url = entry.find("atom:id", ns).text
+        arxiv_id = id_url.split("/abs/")[-1]
+
+        authors = []
+        for author in entry.findall("atom:author", ns):
+            name = author.find("atom:name", ns).text
+            affiliation = author.find("arxiv:affiliation", ns)
+            authors.append(
+                {
+                    "name": name,
+                    "affiliation": affiliation.text
+                    if affiliation is not None
+                    else None,
+                }
             )
 
-        return papers
+        categories = [
+            cat.get("term") for cat in entry.findall("atom:category", ns)
+        ]
+
+        comment_el = entry.find("arxiv:comment", ns)
+
+        return ArxivPaper(
+            arxiv_id=arxiv_id,
+            title=entry.find("atom:title", ns).text.strip(),
+            abstract=entry.find("atom:summary", ns).text.strip(),
+            authors=authors,
+            categories=categories,
+            published_date=_parse_date(
+                entry.find("atom:published", ns).text
+            ),
+            updated_date=_parse_date(
+                entry.find("atom:updated", ns).text
+            ),
+            pdf_url=f"https://arxiv.org/pdf/{arxiv_id}.pdf",
+            comment=comment_el.text if comment_el is not None else None,
+        )
 
     async def health_check(self) -> bool:
         try:
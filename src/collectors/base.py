@@ -92,12 +92,15 @@ class BaseCollector(ABC):
             failure_threshold=5, recovery_timeout=60
         )
 
-    async def __aenter__(self):
+    def _open_client(self) -> None:
         self.client = httpx.AsyncClient(
             timeout=self.config.timeout_seconds,
             headers=self._get_headers(),
             follow_redirects=True,
         )
+
+    async def __aenter__(self):
+        self._open_client()
         return self
 
     async def __aexit__(self, *args):
@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     # Vector DB
     QDRANT_URL: str = "http://localhost:6333"
     QDRANT_API_KEY: str | None = None
+    # gRPC sends vectors as packed floats instead of JSON number text
+    QDRANT_PREFER_GRPC: bool = True
+    QDRANT_GRPC_PORT: int = 6334
 
     # API Keys
     GITHUB_TOKEN: str = ""
@@ -30,11 +33,15 @@ class Settings(BaseSettings):
     # LLM Settings
     LOCAL_LLM_URL: str = "http://localhost:11434"
     LOCAL_LLM_MODEL: str = "llama3:8b-instruct-q4_K_M"
+    # How long Ollama keeps the model loaded after a request (Ollama duration string)
+    LOCAL_LLM_KEEP_ALIVE: str = "30m"
     CLOUD_LLM_MODEL: str = "gpt-4o"
 
     # Embedding Settings
     EMBEDDING_MODEL: str = "BAAI/bge-base-en-v1.5"
     EMBEDDING_DIMENSION: int = 768
+    # Skip warming the embedding model at API startup (tests, short-lived processes)
+    SKIP_EMBEDDING_PRELOAD: bool = False
 
     # Collection Settings
     ARXIV_CATEGORIES: list[str] = ["cs.AI", "cs.CL", "cs.CV", "cs.LG"]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 
 
@@ -22,12 +23,31 @@ class BaseLLMClient(ABC):
     ) -> str:
         pass
 
+    async def stream_generate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the response in chunks as it is produced.
+
+        Clients without native streaming yield the full response once.
+        """
+        yield await self.generate(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt,
+        )
+
     @abstractmethod
     async def generate_json(
         self,
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.1,
+        system_prompt: str | None = None,
     ) -> dict:
         pass
 
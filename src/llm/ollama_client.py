@@ -1,20 +1,68 @@
-import json
+from collections.abc import AsyncIterator
 
 import httpx
+import orjson
 
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
+from src.llm.response_cache import SemanticResponseCache
 
 logger = get_logger(__name__)
 
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Generation can take minutes, but a local server that doesn't accept the
+# connection within a few seconds is down
+_TIMEOUT = httpx.Timeout(300.0, connect=5.0)
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=4,
+    max_connections=8,
+    keepalive_expiry=60.0,
+)
+
 
 class OllamaClient(BaseLLMClient):
     """Local LLM client using Ollama."""
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3:8b-instruct-q4_K_M"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "llama3:8b-instruct-q4_K_M",
+        response_cache: SemanticResponseCache | None = None,
+        keep_alive: str | None = None,
+    ):
         self.base_url = base_url
         self.model = model
-        self.client = httpx.AsyncClient(timeout=300)
+        # Sent with every request so back-to-back jobs reuse the loaded model
+        # instead of paying a reload; None leaves Ollama's default (5m)
+        self.keep_alive = keep_alive
+        self.client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=_TIMEOUT,
+            limits=_LIMITS,
+        )
+        self.response_cache = response_cache
+
+    def _chat_payload(
+        self, messages: list[dict], max_tokens: int, temperature: float, stream: bool
+    ) -> dict:
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature,
+            },
+            "stream": stream,
+        }
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+        return payload
 
     async def generate(
         self,
@@ -23,6 +71,14 @@ class OllamaClient(BaseLLMClient):
         temperature: float = 0.7,
         system_prompt: str | None = None,
     ) -> str:
+        use_cache = self.response_cache is not None and self.response_cache.is_cacheable(
+            temperature
+        )
+        if use_cache:
+            cached = await self.response_cache.get(system_prompt, prompt, self.model, temperature)
+            if cached is not None:
+                return cached
+
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -30,31 +86,64 @@ class OllamaClient(BaseLLMClient):
 
         response = await self.client.post(
             f"{self.base_url}/api/chat",
-            json={
-                "model": self.model,
-                "messages": messages,
-                "options": {
-                    "num_predict": max_tokens,
-                    "temperature": temperature,
-                },
-                "stream": False,
-            },
+            json=self._chat_payload(messages, max_tokens, temperature, stream=False),
         )
         response.raise_for_status()
         data = response.json()
-        return data.get("message", {}).get("content", "")
+        content = data.get("message", {}).get("content", "")
+        if use_cache and content:
+            await self.response_cache.set(
+                system_prompt, prompt, self.model, temperature, content
+            )
+        return content
+
+    async def stream_generate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/api/chat",
+            json=self._chat_payload(messages, max_tokens, temperature, stream=True),
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = orjson.loads(line)
+                content = data.get("message", {}).get("content", "")
+                if content:
+                    yield content
+                if data.get("done"):
+                    break
 
     async def generate_json(
         self,
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.1,
+        system_prompt: str | None = None,
     ) -> dict:
+        # Task instructions go ahead of the JSON directive so the system
+        # message is a stable prefix across calls with the same instructions
+        json_directive = "You must respond with valid JSON only. No other text."
         text = await self.generate(
             prompt,
             max_tokens=max_tokens,
             temperature=temperature,
-            system_prompt="You must respond with valid JSON only. No other text.",
+            system_prompt=(
+                f"{system_prompt.strip()}\n\n{json_directive}"
+                if system_prompt
+                else json_directive
+            ),
         )
         # Try to extract JSON from response
         text = text.strip()
@@ -62,8 +151,8 @@ class OllamaClient(BaseLLMClient):
             lines = text.split("\n")
             text = "\n".join(lines[1:-1])
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse LLM JSON response", response=text[:200])
             return {}
 
@@ -1,5 +1,6 @@
-import json
+from collections.abc import AsyncIterator
 
+import orjson
 from openai import AsyncOpenAI
 
 from src.core.logging import get_logger
@@ -35,25 +36,56 @@ class OpenAIClient(BaseLLMClient):
         )
         return response.choices[0].message.content or ""
 
+    async def stream_generate(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.7,
+        system_prompt: str | None = None,
+    ) -> AsyncIterator[str]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
     async def generate_json(
         self,
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.1,
+        system_prompt: str | None = None,
     ) -> dict:
+        # Task instructions go ahead of the JSON directive so the system
+        # message is a stable prefix across calls with the same instructions
+        json_directive = "You must respond with valid JSON only."
         text = await self.generate(
             prompt,
             max_tokens=max_tokens,
             temperature=temperature,
-            system_prompt="You must respond with valid JSON only.",
+            system_prompt=(
+                f"{system_prompt.strip()}\n\n{json_directive}"
+                if system_prompt
+                else json_directive
+            ),
         )
         text = text.strip()
         if text.startswith("```"):
             lines = text.split("\n")
             text = "\n".join(lines[1:-1])
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             logger.warning("Failed to parse OpenAI JSON response", response=text[:200])
             return {}
 
@@ -63,3 +95,6 @@ class OpenAIClient(BaseLLMClient):
             return True
         except Exception:
             return False
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -1,25 +1,18 @@
-WEEKLY_REPORT_PROMPT = """
-Generate a weekly research digest based on the following data:
+# Each prompt is split into a static system part (instructions, schema, rules)
+# and a dynamic user part (the per-run data). The system part is sent first and
+# never changes, so provider and Ollama prefix caches can reuse it across runs.
 
-Period: {period_start} to {period_end}
-
-New Papers ({paper_count} total):
-{papers_summary}
-
-Trending Repositories ({repo_count} total):
-{repos_summary}
-
-Notable Changes:
-{changes_summary}
+WEEKLY_REPORT_SYSTEM = """
+You generate weekly research digests from the data provided by the user.
 
 You MUST respond with valid JSON only (no markdown, no explanation).
 The JSON must have this exact structure:
-{{
-    "title": "Weekly AI Research Digest: {period_start} - {period_end}",
+{
+    "title": "Weekly AI Research Digest: <period start> - <period end>",
     "summary": "A 2-3 sentence overview of the most important developments this week",
     "highlights": ["highlight 1", "highlight 2", "highlight 3"],
     "content": "A detailed markdown report covering:\\n1. Key highlights\\n2. Trending topics and emerging technologies\\n3. Notable new papers and their implications\\n4. Active repositories and community momentum"
-}}
+}
 
 Rules:
 - "highlights" must be an array of 3-5 short strings (1 sentence each)
@@ -29,8 +22,21 @@ Rules:
 - Use \\n for newlines in the content field
 """
 
-TECH_RADAR_PROMPT = """
-You are an AI/ML technology analyst. Based on the data below from research papers and open-source repositories,
+WEEKLY_REPORT_USER = """
+Period: {period_start} to {period_end}
+
+New Papers ({paper_count} total):
+{papers_summary}
+
+Trending Repositories ({repo_count} total):
+{repos_summary}
+
+Notable Changes:
+{changes_summary}
+"""
+
+TECH_RADAR_SYSTEM = """
+You are an AI/ML technology analyst. Based on the data provided by the user from research papers and open-source repositories,
 create a Tech Radar that categorizes SPECIFIC TECHNOLOGIES, FRAMEWORKS, LIBRARIES, and TOOLS (NOT programming languages).
 
 IMPORTANT RULES:
@@ -41,9 +47,6 @@ IMPORTANT RULES:
 - Aim for 4-6 items per ring (16-24 total)
 - Base your analysis on the evidence in the data: repo stars, growth, paper citations, and research trends
 
-Data:
-{data}
-
 Ring definitions:
 - ADOPT: Mature, widely used, strong community. High stars, many repos, active development. Recommended for production.
 - TRIAL: Gaining traction, promising results. Growing stars/citations. Worth investing time to evaluate.
@@ -51,10 +54,15 @@ Ring definitions:
 - HOLD: Declining activity, being superseded. Fewer new repos/papers, stagnant growth.
 
 Respond ONLY with valid JSON (no markdown, no explanation):
-{{
-    "adopt": [{{"name": "technology name", "reason": "1-sentence evidence-based reason"}}],
-    "trial": [{{"name": "technology name", "reason": "1-sentence evidence-based reason"}}],
-    "assess": [{{"name": "technology name", "reason": "1-sentence evidence-based reason"}}],
-    "hold": [{{"name": "technology name", "reason": "1-sentence evidence-based reason"}}]
-}}
+{
+    "adopt": [{"name": "technology name", "reason": "1-sentence evidence-based reason"}],
+    "trial": [{"name": "technology name", "reason": "1-sentence evidence-based reason"}],
+    "assess": [{"name": "technology name", "reason": "1-sentence evidence-based reason"}],
+    "hold": [{"name": "technology name", "reason": "1-sentence evidence-based reason"}]
+}
+"""
+
+TECH_RADAR_USER = """
+Data:
+{data}
 """
@@ -0,0 +1,116 @@
+"""Response cache for LLM completions.
+
+Two tiers:
+1. Exact match in Redis, keyed by a hash of (system prompt, prompt, model, temperature).
+2. Optional semantic match in Qdrant: if an embedder and vector store are given,
+   a miss in Redis falls back to the nearest cached prompt above a cosine threshold.
+
+Only low-temperature calls are cached; sampled output is not meant to repeat.
+"""
+
+import asyncio
+import hashlib
+import uuid
+
+import orjson
+
+from src.core.logging import get_logger
+from src.storage.cache.redis_client import RedisCache
+
+logger = get_logger(__name__)
+
+RESPONSE_CACHE_COLLECTION = "llm_response_cache"
+
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+
+class SemanticResponseCache:
+    """Caches LLM responses by exact prompt and, optionally, by prompt similarity."""
+
+    def __init__(
+        self,
+        redis: RedisCache | None = None,
+        vector_store=None,
+        embedder=None,
+        ttl: int = 3600,
+        similarity_threshold: float = 0.95,
+    ):
+        self.redis = redis or RedisCache()
+        self.vector_store = vector_store
+        self.embedder = embedder
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.vector_store is not None and self.embedder is not None
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        return temperature <= MAX_CACHEABLE_TEMPERATURE
+
+    @staticmethod
+    def make_key(
+        system_prompt: str | None, prompt: str, model: str, temperature: float
+    ) -> str:
+        raw = orjson.dumps(
+            {"sys": system_prompt, "p": prompt, "m": model, "t": round(temperature, 2)}
+        )
+        return hashlib.sha256(raw).hexdigest()
+
+    @staticmethod
+    def _scope(system_prompt: str | None, model: str) -> str:
+        """Semantic matches are only valid for the same model and system prompt."""
+        raw = f"{model}\x00{system_prompt or ''}".encode()
+        return hashlib.sha256(raw).hexdigest()
+
+    async def get(
+        self, system_prompt: str | None, prompt: str, model: str, temperature: float
+    ) -> str | None:
+        key = self.make_key(system_prompt, prompt, model, temperature)
+        try:
+            cached = await self.redis.get(f"llm_response:{key}")
+            if isinstance(cached, dict) and "response" in cached:
+                return cached["response"]
+
+            if not self.semantic_enabled:
+                return None
+
+            vector = await asyncio.to_thread(self.embedder.embed, prompt)
+            hits = await asyncio.to_thread(
+                self.vector_store.search,
+                RESPONSE_CACHE_COLLECTION,
+                vector,
+                1,
+                {"scope": self._scope(system_prompt, model)},
+            )
+            if hits and hits[0]["score"] >= self.similarity_threshold:
+                logger.debug("LLM semantic cache hit", score=hits[0]["score"])
+                return hits[0]["payload"].get("response")
+        except Exception as e:
+            logger.warning("LLM response cache lookup failed", error=str(e))
+        return None
+
+    async def set(
+        self,
+        system_prompt: str | None,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response: str,
+    ) -> None:
+        key = self.make_key(system_prompt, prompt, model, temperature)
+        try:
+            await self.redis.set(f"llm_response:{key}", {"response": response}, ttl=self.ttl)
+
+            if self.semantic_enabled:
+                vector = await asyncio.to_thread(self.embedder.embed, prompt)
+                await asyncio.to_thread(
+                    self.vector_store.upsert,
+                    RESPONSE_CACHE_COLLECTION,
+                    str(uuid.UUID(key[:32])),
+                    vector,
+                    {"scope": self._scope(system_prompt, model), "response": response},
+                )
+        except Exception as e:
+            logger.warning("LLM response cache store failed", error=str(e))
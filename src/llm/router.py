@@ -65,17 +65,24 @@ class LLMRouter(BaseLLMClient):
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.1,
+        system_prompt: str | None = None,
     ) -> dict:
         try:
             return await self.local_llm.generate_json(
-                prompt, max_tokens=max_tokens, temperature=temperature
+                prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
             )
         except Exception as e:
             logger.warning("Local LLM JSON failed, attempting fallback", error=str(e))
             if self.cloud_llm:
                 logger.info("Falling back to cloud LLM for JSON")
                 return await self.cloud_llm.generate_json(
-                    prompt, max_tokens=max_tokens, temperature=temperature
+                    prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system_prompt=system_prompt,
                 )
             raise
 
@@ -4,31 +4,6 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
-from src.api.routers import (
-    alerts,
-    auth,
-    bookmarks,
-    chat,
-    community,
-    document_chat,
-    documents,
-    folders,
-    health,
-    papers,
-    reports,
-    repositories,
-    search,
-    trending,
-)
-from src.api.routers.user_alerts import router as user_alerts_router
-from src.api.routers.user_feed import router as user_feed_router
-from src.api.routers.saved_searches import router as saved_searches_router
-from src.api.routers.user_digest import router as user_digest_router
-from src.api.routers.paper_notes import router as paper_notes_router
-from src.api.routers.notifications import router as notifications_router
-from src.api.routers.authors import router as authors_router
-from src.api.routers.intelligence import router as intelligence_router
-from src.api.routers.research_assistant import router as research_assistant_router
 from src.core.config import get_settings
 from src.core.logging import setup_logging
 
@@ -38,15 +13,44 @@ async def lifespan(app: FastAPI):
     setup_logging()
     from src.storage.vector.qdrant_client import VectorStore
     VectorStore().init_collections()
-    import threading
-    def _preload():
-        from src.processors.embedding import EmbeddingGenerator
-        EmbeddingGenerator().model
-    threading.Thread(target=_preload, daemon=True).start()
+    if not get_settings().SKIP_EMBEDDING_PRELOAD:
+        import threading
+        def _preload():
+            from src.processors.embedding import EmbeddingGenerator
+            EmbeddingGenerator().model
+        threading.Thread(target=_preload, daemon=True).start()
     yield
 
 
 def create_app() -> FastAPI:
+    # Routers pull in the DB, vector store and ML stacks; import them only
+    # when an app is actually built
+    from src.api.routers import (
+        alerts,
+        auth,
+        bookmarks,
+        chat,
+        community,
+        document_chat,
+        documents,
+        folders,
+        health,
+        papers,
+        reports,
+        repositories,
+        search,
+        trending,
+    )
+    from src.api.routers.user_alerts import router as user_alerts_router
+    from src.api.routers.user_feed import router as user_feed_router
+    from src.api.routers.saved_searches import router as saved_searches_router
+    from src.api.routers.user_digest import router as user_digest_router
+    from src.api.routers.paper_notes import router as paper_notes_router
+    from src.api.routers.notifications import router as notifications_router
+    from src.api.routers.authors import router as authors_router
+    from src.api.routers.intelligence import router as intelligence_router
+    from src.api.routers.research_assistant import router as research_assistant_router
+
     settings = get_settings()
 
     app = FastAPI(
@@ -97,4 +101,11 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+def __getattr__(name: str):
+    # `src.main:app` keeps working for existing callers, but the app (and
+    # the router imports behind it) is only built on first access
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
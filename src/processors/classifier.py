@@ -1,9 +1,10 @@
 """Topic Classification Processor."""
 
 import asyncio
-import json
 from dataclasses import dataclass
 
+import orjson
+
 from src.core.constants import Topic
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
@@ -36,7 +37,7 @@ class TopicClassifier:
         )
 
         try:
-            result = json.loads(response)
+            result = orjson.loads(response)
             return ClassificationResult(
                 primary_topic=Topic(result["primary_topic"]),
                 secondary_topics=[
@@ -45,7 +46,7 @@ class TopicClassifier:
                 confidence=result.get("confidence", 0.5),
                 keywords=result.get("keywords", []),
             )
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+        except (orjson.JSONDecodeError, ValueError, KeyError) as e:
             logger.warning("Failed to parse classification", error=str(e))
             return ClassificationResult(
                 primary_topic=Topic.OTHER,
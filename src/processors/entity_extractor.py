@@ -1,8 +1,9 @@
 """Entity Extraction Processor - extracts methods, datasets, tools from papers."""
 
-import json
 from dataclasses import dataclass, field
 
+import orjson
+
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
 from src.llm.prompts.extraction import ENTITY_EXTRACTION_PROMPT
@@ -38,13 +39,13 @@ class EntityExtractor:
             if text.startswith("```"):
                 lines = text.split("\n")
                 text = "\n".join(lines[1:-1])
-            data = json.loads(text)
+            data = orjson.loads(text)
             return ExtractedEntities(
                 methods=data.get("methods", []),
                 datasets=data.get("datasets", []),
                 metrics=data.get("metrics", []),
                 tools=data.get("tools", []),
             )
-        except (json.JSONDecodeError, KeyError) as e:
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.warning("Failed to parse entity extraction", error=str(e))
             return ExtractedEntities()
@@ -1,6 +1,6 @@
 """Technology Stack Analyzer for repositories."""
 
-import json
+import orjson
 
 from src.core.logging import get_logger
 from src.llm.base import BaseLLMClient
@@ -38,8 +38,8 @@ class TechAnalyzer:
             if text.startswith("```"):
                 lines = text.split("\n")
                 text = "\n".join(lines[1:-1])
-            return json.loads(text)
-        except (json.JSONDecodeError, KeyError) as e:
+            return orjson.loads(text)
+        except (orjson.JSONDecodeError, KeyError) as e:
             logger.warning("Failed to parse tech analysis", error=str(e))
             return {
                 "frameworks": [],
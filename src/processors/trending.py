@@ -3,7 +3,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
+
 from src.core.logging import get_logger
+from src.storage.models.metrics import MetricsHistory
 from src.storage.repositories.metrics_repo import MetricsRepository
 
 logger = get_logger(__name__)
@@ -18,6 +21,20 @@ class TrendingScores:
     total_score: float
 
 
+def days_since(moments) -> np.ndarray:
+    """Whole days from each datetime to now, NaN where the datetime is None."""
+    now = datetime.utcnow()
+    return np.fromiter(
+        ((now - m).days if m is not None else np.nan for m in moments),
+        dtype=np.float64,
+    )
+
+
+def snapshot_stars(metrics: dict, default: float) -> float:
+    """Star count from a metrics snapshot; repo snapshots store it as stars_count."""
+    return metrics.get("stars_count", metrics.get("stars", default))
+
+
 class TrendingCalculator:
     """
     Calculates trending scores for papers and repositories.
@@ -27,6 +44,9 @@ class TrendingCalculator:
     - Community (30%): Star/fork velocity
     - Academic (20%): Citation velocity
     - Recency (10%): Time since last update
+
+    The ``*_scores_vec`` methods score many entities at once from NumPy arrays;
+    the per-entity methods are single-element wrappers around them.
     """
 
     W_ACTIVITY = 0.40
@@ -34,7 +54,7 @@ class TrendingCalculator:
     W_ACADEMIC = 0.20
     W_RECENCY = 0.10
 
-    def __init__(self, metrics_repo: MetricsRepository):
+    def __init__(self, metrics_repo: MetricsRepository | None = None):
         self.metrics = metrics_repo
 
     async def calculate_repo_score(
@@ -48,53 +68,22 @@ class TrendingCalculator:
         citation_count: int = 0,
         period_days: int = 7,
     ) -> TrendingScores:
-        history = await self.metrics.get_history(
-            entity_type="repository", entity_id=repo_id, days=period_days
+        history_count, latest = await self._history_summary(
+            "repository", repo_id, period_days
         )
-
-        # Activity Score
-        activity = 0.0
-        if commit_count_30d:
-            activity += min(1.0, commit_count_30d / 30) * 0.5
-        if open_issues_count > 0:
-            activity += min(1.0, open_issues_count / 50) * 0.3
-        if last_commit_at:
-            days_since = (datetime.utcnow() - last_commit_at).days
-            if days_since < 7:
-                activity += 0.2
-            elif days_since < 30:
-                activity += 0.1
-        activity = min(1.0, activity)
-
-        # Community Score
-        if not history or len(history) < 2:
-            community = min(1.0, stars_count / 10000)
-        else:
-            old_stars = history[-1].metrics.get("stars", stars_count)
-            new_stars = stars_count - old_stars
-            velocity = new_stars / stars_count if stars_count > 0 else 0.0
-            community = min(1.0, velocity * 10)
-
-        # Academic Score
-        academic = min(1.0, citation_count / 100) if citation_count else 0.5
-
-        # Recency Score
-        recency = self._calculate_recency(last_commit_at)
-
-        total = (
-            activity * self.W_ACTIVITY
-            + community * self.W_COMMUNITY
-            + academic * self.W_ACADEMIC
-            + recency * self.W_RECENCY
-        )
-
-        return TrendingScores(
-            activity_score=activity,
-            community_score=community,
-            academic_score=academic,
-            recency_score=recency,
-            total_score=total,
+        scores = self.calculate_repo_scores_vec(
+            stars=np.array([stars_count or 0], dtype=np.float64),
+            open_issues=np.array([open_issues_count or 0], dtype=np.float64),
+            commits_30d=np.array([commit_count_30d or 0], dtype=np.float64),
+            days_since_commit=days_since([last_commit_at]),
+            history_counts=np.array([history_count], dtype=np.float64),
+            prev_stars=np.array(
+                [snapshot_stars(latest.metrics, stars_count or 0) if latest else stars_count or 0],
+                dtype=np.float64,
+            ),
+            citations=np.array([citation_count or 0], dtype=np.float64),
         )
+        return self._single(scores)
 
     async def calculate_paper_score(
         self,
@@ -104,53 +93,127 @@ class TrendingCalculator:
         published_date: datetime | None,
         period_days: int = 30,
     ) -> TrendingScores:
-        history = await self.metrics.get_history(
-            entity_type="paper", entity_id=paper_id, days=period_days
+        history_count, latest = await self._history_summary("paper", paper_id, period_days)
+        scores = self.calculate_paper_scores_vec(
+            citations=np.array([citation_count or 0], dtype=np.float64),
+            influential=np.array([influential_citation_count or 0], dtype=np.float64),
+            days_since_published=days_since([published_date]),
+            history_counts=np.array([history_count], dtype=np.float64),
+            prev_citations=np.array(
+                [
+                    latest.metrics.get("citations", citation_count)
+                    if latest
+                    else citation_count or 0
+                ],
+                dtype=np.float64,
+            ),
         )
+        return self._single(scores)
 
-        activity = 0.5
-        community = 0.5
+    def calculate_repo_scores_vec(
+        self,
+        stars: np.ndarray,
+        open_issues: np.ndarray,
+        commits_30d: np.ndarray,
+        days_since_commit: np.ndarray,
+        history_counts: np.ndarray,
+        prev_stars: np.ndarray,
+        citations: np.ndarray | None = None,
+    ) -> dict[str, np.ndarray]:
+        # Activity Score
+        activity = np.minimum(1.0, commits_30d / 30) * 0.5
+        activity += np.where(open_issues > 0, np.minimum(1.0, open_issues / 50) * 0.3, 0.0)
+        activity += np.select(
+            [days_since_commit < 7, days_since_commit < 30], [0.2, 0.1], default=0.0
+        )
+        activity = np.minimum(1.0, activity)
+
+        # Community Score: star velocity once there are two snapshots
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = np.where(stars > 0, (stars - prev_stars) / stars, 0.0)
+        community = np.where(
+            history_counts < 2,
+            np.minimum(1.0, stars / 10000),
+            np.minimum(1.0, velocity * 10),
+        )
 
-        # Academic Score (citation velocity)
-        if not history or len(history) < 2:
-            academic = min(1.0, citation_count / 100)
+        # Academic Score
+        if citations is None:
+            academic = np.full_like(stars, 0.5)
         else:
-            old_citations = history[-1].metrics.get("citations", citation_count)
-            new_citations = citation_count - old_citations
-            velocity_score = min(1.0, new_citations / 10)
-            influential_ratio = (
-                influential_citation_count / citation_count
-                if citation_count > 0
-                else 0
-            )
-            quality_boost = influential_ratio * 0.5
-            academic = min(1.0, velocity_score + quality_boost)
-
-        recency = self._calculate_recency(published_date)
+            academic = np.where(citations > 0, np.minimum(1.0, citations / 100), 0.5)
+
+        # Recency Score
+        recency = self._recency_vec(days_since_commit)
+
+        return self._combine(activity, community, academic, recency)
 
+    def calculate_paper_scores_vec(
+        self,
+        citations: np.ndarray,
+        influential: np.ndarray,
+        days_since_published: np.ndarray,
+        history_counts: np.ndarray,
+        prev_citations: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        activity = np.full_like(citations, 0.5)
+        community = np.full_like(citations, 0.5)
+
+        # Academic Score (citation velocity)
+        velocity_score = np.minimum(1.0, (citations - prev_citations) / 10)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            influential_ratio = np.where(citations > 0, influential / citations, 0.0)
+        academic = np.where(
+            history_counts < 2,
+            np.minimum(1.0, citations / 100),
+            np.minimum(1.0, velocity_score + influential_ratio * 0.5),
+        )
+
+        recency = self._recency_vec(days_since_published)
+
+        return self._combine(activity, community, academic, recency)
+
+    def _combine(self, activity, community, academic, recency) -> dict[str, np.ndarray]:
         total = (
             activity * self.W_ACTIVITY
             + community * self.W_COMMUNITY
             + academic * self.W_ACADEMIC
             + recency * self.W_RECENCY
         )
-
-        return TrendingScores(
-            activity_score=activity,
-            community_score=community,
-            academic_score=academic,
-            recency_score=recency,
-            total_score=total,
+        return {
+            "activity_score": activity,
+            "community_score": community,
+            "academic_score": academic,
+            "recency_score": recency,
+            "total_score": total,
+        }
+
+    @staticmethod
+    def _single(scores: dict[str, np.ndarray]) -> TrendingScores:
+        return TrendingScores(**{name: float(values[0]) for name, values in scores.items()})
+
+    async def _history_summary(
+        self, entity_type: str, entity_id, days: int
+    ) -> tuple[int, MetricsHistory | None]:
+        """Count the snapshots in the window and return the most recent one.
+
+        Scores only need these two facts, so rows are streamed rather than
+        held as a list.
+        """
+        count = 0
+        latest = None
+        async for record in self.metrics.stream_history(
+            entity_type=entity_type, entity_id=entity_id, days=days
+        ):
+            count += 1
+            latest = record
+        return count, latest
+
+    @staticmethod
+    def _recency_vec(days_ago: np.ndarray) -> np.ndarray:
+        """Piecewise decay by age in days; 0 where the age is unknown (NaN)."""
+        return np.select(
+            [np.isnan(days_ago), days_ago <= 0, days_ago <= 7, days_ago <= 30],
+            [0.0, 1.0, 1.0 - days_ago / 14, 0.5 - (days_ago - 7) / 46],
+            default=np.maximum(0.0, 0.2 - (days_ago - 30) / 150),
         )
-
-    def _calculate_recency(self, last_activity: datetime | None) -> float:
-        if not last_activity:
-            return 0.0
-        days_ago = (datetime.utcnow() - last_activity).days
-        if days_ago <= 0:
-            return 1.0
-        elif days_ago <= 7:
-            return 1.0 - (days_ago / 14)
-        elif days_ago <= 30:
-            return 0.5 - ((days_ago - 7) / 46)
-        return max(0.0, 0.2 - ((days_ago - 30) / 150))
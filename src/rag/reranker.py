@@ -1,6 +1,8 @@
 """Cross-encoder Reranker for improving retrieval quality."""
 
-import math
+import heapq
+
+import numpy as np
 
 from src.core.logging import get_logger
 from src.rag.retriever import RetrievedDocument
@@ -33,6 +35,9 @@ class CrossEncoderReranker:
             device = self._get_device()
             logger.info("Loading reranker model", model=self.model_name, device=device)
             self._model = CrossEncoder(self.model_name, device=device)
+            if device in ("cuda", "mps"):
+                # Half-precision weights halve memory traffic on GPU inference
+                self._model.model.half()
         return self._model
 
     async def rerank(
@@ -43,17 +48,26 @@ class CrossEncoderReranker:
     ) -> list[RetrievedDocument]:
         if not documents:
             return []
+        # Nothing to select: keep retrieval order and skip the model forward pass
+        if len(documents) <= top_k:
+            return documents[:top_k]
 
-        pairs = [(query, doc.content[:512]) for doc in documents]
-        scores = self.model.predict(pairs)
-
-        scored_docs = list(zip(documents, scores))
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
+        pairs = [
+            (query, doc.content if len(doc.content) <= 512 else doc.content[:512])
+            for doc in documents
+        ]
+        logits = self.model.predict(
+            pairs,
+            batch_size=64,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        # Normalize raw logits to 0-1 via sigmoid
+        scores = 1.0 / (1.0 + np.exp(-np.asarray(logits, dtype=np.float32)))
 
         result = []
-        for doc, score in scored_docs[:top_k]:
-            # Normalize raw logit to 0-1 via sigmoid
-            doc.score = 1.0 / (1.0 + math.exp(-float(score)))
+        for doc, score in heapq.nlargest(top_k, zip(documents, scores), key=lambda x: x[1]):
+            doc.score = float(score)
             result.append(doc)
 
         return result
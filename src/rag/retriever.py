@@ -36,8 +36,10 @@ class HybridRetriever:
         top_k: int = 10,
         filters: dict | None = None,
         collections: list[str] | None = None,
+        query_embedding: list[float] | None = None,
     ) -> list[RetrievedDocument]:
-        query_embedding = self.embeddings.embed(query)
+        if query_embedding is None:
+            query_embedding = self.embeddings.embed(query)
         target_collections = collections or ["papers", "repositories", "chunks"]
 
         all_results = []
@@ -1,9 +1,15 @@
 """GitHub repository ingestion service using gitingest."""
 
 import asyncio
-import re
 from dataclasses import dataclass
 
+try:
+    # RE2 matches in linear time with no backtracking, which matters on
+    # multi-megabyte gitingest dumps
+    import re2 as re
+except ImportError:
+    import re
+
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -56,10 +62,8 @@ async def ingest_repo(url: str) -> RepoContent:
 # ================================================
 # File: path/to/file.py
 # ================================================
-_FILE_BOUNDARY_RE = re.compile(
-    r"^={4,}\nFile:\s*(.+?)\n={4,}$",
-    re.MULTILINE,
-)
+# The inline (?m) flag keeps the pattern portable between re and re2.
+_FILE_BOUNDARY_RE = re.compile(r"(?m)^={4,}\nFile:\s*(.+?)\n={4,}$")
 
 
 def chunk_repo_content(
@@ -74,43 +78,42 @@ def chunk_repo_content(
     chunks: list[dict] = []
     idx = 0
 
-    # First chunk: overview (summary + tree structure)
-    overview = f"# Repository Overview: {repo.repo_name}\n\n"
+    # First chunk: overview (summary + tree structure). The heading is always
+    # present, so the overview is never empty and needs a single strip.
+    parts = [f"# Repository Overview: {repo.repo_name}\n\n"]
     if repo.summary:
-        overview += f"## Summary\n{repo.summary}\n\n"
+        parts.append(f"## Summary\n{repo.summary}\n\n")
     if repo.tree:
-        overview += f"## File Structure\n{repo.tree}\n"
+        parts.append(f"## File Structure\n{repo.tree}\n")
 
-    if overview.strip():
-        chunks.append({
-            "content": overview.strip(),
-            "file_path": "OVERVIEW",
-            "chunk_index": idx,
-        })
-        idx += 1
+    chunks.append({
+        "content": "".join(parts).strip(),
+        "file_path": "OVERVIEW",
+        "chunk_index": idx,
+    })
+    idx += 1
 
     if not repo.content:
         return chunks
 
-    # Split content by file boundary markers
-    splits = _FILE_BOUNDARY_RE.split(repo.content)
+    content = repo.content
 
-    # splits alternates between: [pre-text, filepath1, filecontent1, filepath2, filecontent2, ...]
-    # First element is text before any file marker (usually empty)
-    file_pairs: list[tuple[str, str]] = []
-    i = 1  # skip pre-text
-    while i < len(splits) - 1:
-        file_path = splits[i].strip()
-        file_content = splits[i + 1].strip()
-        if file_content:
-            file_pairs.append((file_path, file_content))
-        i += 2
+    # Locate file boundary markers and keep (path, start, end) offsets into the
+    # original content rather than copying each file body out of it
+    matches = list(_FILE_BOUNDARY_RE.finditer(content))
+    body_ends = [m.start() for m in matches[1:]]
+    body_ends.append(len(content))
+    file_spans: list[tuple[str, int, int]] = []
+    for match, body_end in zip(matches, body_ends):
+        body_start, body_end = _strip_span(content, match.end(), body_end)
+        if body_start < body_end:
+            file_spans.append((match.group(1).strip(), body_start, body_end))
 
     # If no file boundaries found, treat entire content as one block
-    if not file_pairs:
-        for sub in _sub_chunk(repo.content, chunk_size, overlap):
+    if not file_spans:
+        for sub_start, sub_end in _sub_chunk(content, 0, len(content), chunk_size, overlap):
             chunks.append({
-                "content": sub,
+                "content": content[sub_start:sub_end],
                 "file_path": "content",
                 "chunk_index": idx,
             })
@@ -118,19 +121,21 @@ def chunk_repo_content(
         return chunks
 
     # Process each file
-    for file_path, file_content in file_pairs:
+    for file_path, body_start, body_end in file_spans:
         header = f"# File: {file_path}\n\n"
-        if len(file_content) <= chunk_size:
+        if body_end - body_start <= chunk_size:
             chunks.append({
-                "content": header + file_content,
+                "content": header + content[body_start:body_end],
                 "file_path": file_path,
                 "chunk_index": idx,
             })
             idx += 1
         else:
-            for sub in _sub_chunk(file_content, chunk_size, overlap):
+            for sub_start, sub_end in _sub_chunk(
+                content, body_start, body_end, chunk_size, overlap
+            ):
                 chunks.append({
-                    "content": header + sub,
+                    "content": header + content[sub_start:sub_end],
                     "file_path": file_path,
                     "chunk_index": idx,
                 })
@@ -139,24 +144,36 @@ def chunk_repo_content(
     return chunks
 
 
-def _sub_chunk(text: str, chunk_size: int, overlap: int) -> list[str]:
-    """Split text into overlapping sub-chunks."""
-    results = []
-    start = 0
-    text_len = len(text)
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """Narrow [start, end) to exclude leading/trailing whitespace, like str.strip."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
 
-    while start < text_len:
+def _sub_chunk(
+    text: str, start: int, stop: int, chunk_size: int, overlap: int
+) -> list[tuple[int, int]]:
+    """Split text[start:stop] into overlapping sub-chunks.
+
+    Returns (start, end) offsets into ``text`` with surrounding whitespace
+    trimmed; callers slice only the chunks they keep.
+    """
+    results = []
+    while start < stop:
         end = start + chunk_size
-        if end < text_len:
+        if end < stop:
             # Try to break at newline
             last_nl = text.rfind("\n", start + chunk_size // 2, end)
             if last_nl > start:
                 end = last_nl + 1
-        chunk = text[start:end].strip()
-        if chunk:
-            results.append(chunk)
+        chunk_start, chunk_end = _strip_span(text, start, min(end, stop))
+        if chunk_start < chunk_end:
+            results.append((chunk_start, chunk_end))
         start = end - overlap
-        if start >= text_len:
+        if start >= stop:
             break
 
     return results
@@ -111,18 +111,19 @@ class TextExtractor:
         return "\n\n".join(slides_text)
 
     def _extract_csv(self, file_path: str) -> str:
-        rows = []
+        buf = io.StringIO()
         with open(file_path, "r", encoding="utf-8", errors="replace") as f:
             reader = csv.reader(f)
             for i, row in enumerate(reader):
                 if i == 0:
-                    rows.append("Headers: " + " | ".join(row))
+                    buf.write("Headers: ")
                 else:
-                    rows.append(" | ".join(row))
+                    buf.write("\n")
+                buf.write(" | ".join(row))
                 if i >= 500:  # Limit rows to avoid huge text
-                    rows.append(f"... (truncated, {i}+ rows)")
+                    buf.write(f"\n... (truncated, {i}+ rows)")
                     break
-        return "\n".join(rows)
+        return buf.getvalue()
 
     def _extract_text(self, file_path: str) -> str:
         with open(file_path, "r", encoding="utf-8", errors="replace") as f:
@@ -12,9 +12,10 @@ class TrendingService:
     async def get_trending_papers(
         self, period: str = "week", category: str | None = None, limit: int = 20
     ):
-        return await self.metrics.get_trending(
+        trending, total, _ = await self.metrics.get_trending(
             entity_type="paper", category=category, limit=limit
         )
+        return trending, total
 
     async def get_trending_repos(
         self,
@@ -23,6 +24,7 @@ class TrendingService:
         topic: str | None = None,
         limit: int = 20,
     ):
-        return await self.metrics.get_trending(
+        trending, total, _ = await self.metrics.get_trending(
             entity_type="repository", category=topic, limit=limit
         )
+        return trending, total
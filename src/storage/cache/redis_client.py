@@ -1,6 +1,6 @@
-import json
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 from src.core.config import get_settings
@@ -22,13 +22,13 @@ class RedisCache:
         if value is None:
             return None
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
             return value
 
     async def set(self, key: str, value: Any, ttl: int = 3600) -> None:
         if isinstance(value, (dict, list)):
-            value = json.dumps(value)
+            value = orjson.dumps(value)
         await self.client.set(key, value, ex=ttl)
 
     async def delete(self, key: str) -> None:
@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Float, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy import Float, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -29,8 +29,15 @@ class Conversation(Base):
         default=func.now(), server_default=func.now(), onupdate=func.now()
     )
 
+    # Must be eager-loaded explicitly (selectinload); lazy access in async code
+    # would be an implicit per-conversation query. Deletes rely on the FK's
+    # ON DELETE CASCADE instead of loading the collection.
     messages: Mapped[list["ChatMessage"]] = relationship(
-        back_populates="conversation", cascade="all, delete-orphan", order_by="ChatMessage.created_at"
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        order_by="ChatMessage.created_at",
+        lazy="raise",
+        passive_deletes=True,
     )
 
 
@@ -45,7 +52,7 @@ class ChatMessage(Base):
     )
     role: Mapped[str] = mapped_column(String(20), nullable=False)  # "user" | "assistant"
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    citations: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    citations: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -53,3 +60,8 @@ class ChatMessage(Base):
     )
 
     conversation: Mapped["Conversation"] = relationship(back_populates="messages")
+
+    __table_args__ = (
+        # Latest-message lookups per conversation (list previews, ordered loads)
+        Index("idx_chat_messages_conversation_created", "conversation_id", "created_at"),
+    )
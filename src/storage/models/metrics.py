@@ -1,7 +1,7 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Date, Float, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Date, Float, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -30,8 +30,8 @@ class MetricsHistory(Base):
     recorded_at: Mapped[date] = mapped_column(Date, nullable=False)
 
     __table_args__ = (
+        # Also serves per-entity lookups and latest-before-date scans (read backwards)
         UniqueConstraint("entity_type", "entity_id", "recorded_at", name="uq_metrics_entity_date"),
-        Index("idx_metrics_entity", "entity_type", "entity_id"),
         Index("idx_metrics_date", "recorded_at"),
     )
 
@@ -55,6 +55,12 @@ class TrendingScore(Base):
     # Combined score
     total_score: Mapped[float] = mapped_column(Float, nullable=False)
 
+    # Star velocities copied from the entity's latest metrics snapshot, so
+    # trending lists don't need to join metrics_history
+    velocity_1d: Mapped[float | None] = mapped_column(Float)
+    velocity_7d: Mapped[float | None] = mapped_column(Float)
+    velocity_30d: Mapped[float | None] = mapped_column(Float)
+
     # Ranking
     category: Mapped[str | None] = mapped_column(String(100))
     rank_in_category: Mapped[int | None] = mapped_column(Integer)
@@ -73,6 +79,18 @@ class TrendingScore(Base):
         ),
         Index("idx_trending_score", "total_score"),
         Index("idx_trending_category", "category", "rank_in_category"),
+        # Serve get_trending* filters + ORDER BY total_score DESC, id DESC (the
+        # keyset order) without a sort; entity_id is included for the joins to
+        # papers/repositories
+        Index(
+            "idx_trending_type_score", "entity_type", text("total_score DESC"), text("id DESC"),
+            postgresql_include=["entity_id"],
+        ),
+        Index(
+            "idx_trending_type_category_score",
+            "entity_type", "category", text("total_score DESC"), text("id DESC"),
+            postgresql_include=["entity_id"],
+        ),
     )
 
 
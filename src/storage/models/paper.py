@@ -1,8 +1,8 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, Float, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy import Boolean, Computed, Date, Float, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -27,6 +27,20 @@ class Paper(Base):
     abstract: Mapped[str | None] = mapped_column(Text)
     summary: Mapped[str | None] = mapped_column(Text)
 
+    # Full-text search document (generated by Postgres; never loaded, and
+    # accessing it raises instead of issuing a per-row lazy SELECT)
+    search_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english'::regconfig, coalesce(abstract, '')), 'B') || "
+            "setweight(to_tsvector('simple'::regconfig, coalesce(arxiv_id, '')), 'A')",
+            persisted=True,
+        ),
+        deferred=True,
+        deferred_raiseload=True,
+    )
+
     # Authors (JSONB array)
     authors: Mapped[dict | None] = mapped_column(JSONB, default=list)
 
@@ -66,7 +80,46 @@ class Paper(Base):
     )
 
     __table_args__ = (
-        Index("idx_papers_published_date", "published_date", postgresql_using="btree"),
+        # Listing order (newest first, id as tiebreak) and keyset seeks
+        Index(
+            "idx_papers_published_id",
+            text("published_date DESC NULLS LAST"), text("id DESC"),
+        ),
         Index("idx_papers_categories", "categories", postgresql_using="gin"),
         Index("idx_papers_topics", "topics", postgresql_using="gin"),
+        Index("idx_papers_search_tsv", "search_tsv", postgresql_using="gin"),
+        # Topic scans for the research landscape only touch dated, tagged papers
+        Index(
+            "idx_papers_topics_landscape", "topics",
+            postgresql_using="gin",
+            postgresql_where=text("topics IS NOT NULL AND published_date IS NOT NULL"),
+        ),
+        # Partial indexes for the hot boolean filters: the unprocessed queue is
+        # read oldest-first, the flagged listings newest-first
+        Index(
+            "idx_papers_unprocessed", "created_at",
+            postgresql_where=text("is_processed = false"),
+        ),
+        Index(
+            "idx_papers_vietnamese_published", text("published_date DESC"),
+            postgresql_where=text("is_vietnamese = true"),
+        ),
+        Index(
+            "idx_papers_relevant_published", text("published_date DESC"),
+            postgresql_where=text("is_relevant = true"),
+        ),
+        Index("idx_papers_source_published", "source", text("published_date DESC")),
+        # Trigram indexes for unanchored ILIKE '%term%' search (pg_trgm)
+        Index(
+            "idx_papers_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_papers_abstract_trgm", "abstract",
+            postgresql_using="gin", postgresql_ops={"abstract": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_papers_arxiv_id_trgm", "arxiv_id",
+            postgresql_using="gin", postgresql_ops={"arxiv_id": "gin_trgm_ops"},
+        ),
     )
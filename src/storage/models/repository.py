@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Boolean, Index, Integer, String, Text
+from sqlalchemy import BigInteger, Boolean, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -78,4 +78,18 @@ class Repository(Base):
         Index("idx_repos_language", "primary_language"),
         Index("idx_repos_topics", "topics", postgresql_using="gin"),
         Index("idx_repos_frameworks", "frameworks", postgresql_using="gin"),
+        # The unprocessed queue is read oldest-first by the embedding task
+        Index(
+            "idx_repos_unprocessed", "created_at",
+            postgresql_where=text("is_processed = false"),
+        ),
+        # Trigram indexes for unanchored ILIKE '%term%' search (pg_trgm)
+        Index(
+            "idx_repos_full_name_trgm", "full_name",
+            postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_repos_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
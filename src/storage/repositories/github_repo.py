@@ -1,6 +1,7 @@
 import uuid
 
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import and_, any_, bindparam, case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.storage.models.repository import Repository
@@ -179,3 +180,40 @@ class GitHubRepository:
             .limit(limit)
         )
         return list(result.scalars().all())
+
+    async def get_unprocessed_light(self, limit: int = 100) -> list:
+        """Like get_unprocessed, but returns only the columns embedding needs.
+
+        The README is cut to its first 2000 characters in SQL, so the full
+        TOASTed value never leaves the database.
+        """
+        result = await self.session.execute(
+            select(
+                Repository.id,
+                Repository.name,
+                Repository.full_name,
+                Repository.description,
+                func.substring(Repository.readme_content, 1, 2000).label("readme_content"),
+                Repository.primary_language,
+                Repository.topics,
+                Repository.frameworks,
+                Repository.stars_count,
+                Repository.html_url,
+            )
+            .where(Repository.is_processed == False)  # noqa: E712
+            .order_by(Repository.created_at.asc())
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def mark_processed_many(self, repo_ids: list[uuid.UUID]) -> None:
+        if not repo_ids:
+            return
+        await self.session.execute(
+            update(Repository)
+            .where(
+                Repository.id == any_(bindparam("ids", repo_ids, type_=ARRAY(UUID(as_uuid=True))))
+            )
+            .values(is_processed=True)
+            .execution_options(synchronize_session=False)
+        )
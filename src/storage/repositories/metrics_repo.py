@@ -1,17 +1,49 @@
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import date, timedelta
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Date, Float, Row, and_, func, literal, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.logging import get_logger
+from src.storage.cache.redis_client import RedisCache
 from src.storage.models.metrics import MetricsHistory, TrendingScore
 from src.storage.models.paper import Paper
 from src.storage.models.repository import Repository
 
+logger = get_logger(__name__)
+
+TRENDING_FILTERS_CACHE_KEY = "trending:filters:v1"
+TRENDING_FILTERS_CACHE_TTL = 300
+
+# Metrics snapshots label repositories "repo" while trending scores use "repository"
+_SNAPSHOT_ENTITY_TYPES = {"repository": ("repo", "repository")}
+
+# Keyset cursor for trending pages: the (total_score, id) of a page's last row
+TrendingCursor = tuple[float, uuid.UUID]
+
 
 class MetricsRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: RedisCache | None = None):
         self.session = session
+        self.cache = cache
+
+    def _history_query(self, entity_type: str, entity_id: uuid.UUID, days: int):
+        cutoff = date.today() - timedelta(days=days)
+        return (
+            select(MetricsHistory)
+            .where(
+                and_(
+                    MetricsHistory.entity_type.in_(
+                        _SNAPSHOT_ENTITY_TYPES.get(entity_type, (entity_type,))
+                    ),
+                    MetricsHistory.entity_id == entity_id,
+                    MetricsHistory.recorded_at >= cutoff,
+                )
+            )
+            .order_by(MetricsHistory.recorded_at.asc())
+        )
 
     async def get_history(
         self,
@@ -19,19 +51,55 @@ class MetricsRepository:
         entity_id: uuid.UUID,
         days: int = 30,
     ) -> list[MetricsHistory]:
+        result = await self.session.execute(self._history_query(entity_type, entity_id, days))
+        return list(result.scalars().all())
+
+    async def stream_history(
+        self,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        days: int = 30,
+    ) -> AsyncIterator[MetricsHistory]:
+        """Like get_history, but fetches rows in batches from a server-side cursor."""
+        result = await self.session.stream_scalars(
+            self._history_query(entity_type, entity_id, days).execution_options(yield_per=200)
+        )
+        async for record in result:
+            yield record
+
+    async def history_summaries(
+        self,
+        entity_type: str,
+        entity_ids: list[uuid.UUID],
+        days: int = 30,
+    ) -> dict[uuid.UUID, tuple[int, dict]]:
+        """Snapshot count and latest snapshot metrics in the window, per entity.
+
+        One DISTINCT ON query; the window count is evaluated before DISTINCT ON
+        keeps each entity's newest row. Entities without snapshots are absent.
+        """
+        if not entity_ids:
+            return {}
         cutoff = date.today() - timedelta(days=days)
         result = await self.session.execute(
-            select(MetricsHistory)
+            select(
+                MetricsHistory.entity_id,
+                func.count().over(partition_by=MetricsHistory.entity_id),
+                MetricsHistory.metrics,
+            )
             .where(
                 and_(
-                    MetricsHistory.entity_type == entity_type,
-                    MetricsHistory.entity_id == entity_id,
+                    MetricsHistory.entity_type.in_(
+                        _SNAPSHOT_ENTITY_TYPES.get(entity_type, (entity_type,))
+                    ),
+                    MetricsHistory.entity_id.in_(entity_ids),
                     MetricsHistory.recorded_at >= cutoff,
                 )
             )
-            .order_by(MetricsHistory.recorded_at.asc())
+            .distinct(MetricsHistory.entity_id)
+            .order_by(MetricsHistory.entity_id, MetricsHistory.recorded_at.desc())
         )
-        return list(result.scalars().all())
+        return {entity_id: (count, metrics or {}) for entity_id, count, metrics in result.all()}
 
     async def record_metrics(
         self,
@@ -46,88 +114,177 @@ class MetricsRepository:
             metrics=metrics,
             recorded_at=recorded_at or date.today(),
         )
+        # Written with the caller's next flush/commit
         self.session.add(record)
-        await self.session.flush()
         return record
 
+    async def record_metrics_bulk(self, records: list[dict]) -> None:
+        """Insert many snapshots in one multi-row INSERT.
+
+        Each dict has entity_type, entity_id, metrics and optionally recorded_at
+        (defaults to today).
+        """
+        if not records:
+            return
+        today = date.today()
+        await self.session.execute(
+            insert(MetricsHistory),
+            [{"recorded_at": today, **record} for record in records],
+        )
+
     async def upsert_daily_snapshot(
         self,
         entity_type: str,
         entity_id: uuid.UUID,
         metrics: dict,
     ) -> MetricsHistory:
-        """Record or update today's snapshot, and compute velocity fields."""
-        today = date.today()
-
-        # Check if today's snapshot already exists
-        result = await self.session.execute(
-            select(MetricsHistory).where(
-                and_(
-                    MetricsHistory.entity_type == entity_type,
-                    MetricsHistory.entity_id == entity_id,
-                    MetricsHistory.recorded_at == today,
-                )
-            )
-        )
-        existing = result.scalar_one_or_none()
+        """Record or update today's snapshot, and compute velocity fields.
 
-        # Calculate velocities from historical data
-        velocity_1d = await self._calc_velocity(entity_type, entity_id, days=1, current_metrics=metrics)
-        velocity_7d = await self._calc_velocity(entity_type, entity_id, days=7, current_metrics=metrics)
-        velocity_30d = await self._calc_velocity(entity_type, entity_id, days=30, current_metrics=metrics)
-
-        if existing:
-            existing.metrics = metrics
-            existing.velocity_1d = velocity_1d
-            existing.velocity_7d = velocity_7d
-            existing.velocity_30d = velocity_30d
-            await self.session.flush()
-            return existing
+        The velocities are scalar subqueries inside a single
+        INSERT ... ON CONFLICT DO UPDATE, so the whole upsert is one round-trip.
+        """
+        today = date.today()
+        new_stars = metrics.get("stars_count", 0)
 
-        record = MetricsHistory(
+        stmt = insert(MetricsHistory).values(
             entity_type=entity_type,
             entity_id=entity_id,
             metrics=metrics,
             recorded_at=today,
-            velocity_1d=velocity_1d,
-            velocity_7d=velocity_7d,
-            velocity_30d=velocity_30d,
+            velocity_1d=self._velocity_subquery(entity_type, entity_id, today, 1, new_stars),
+            velocity_7d=self._velocity_subquery(entity_type, entity_id, today, 7, new_stars),
+            velocity_30d=self._velocity_subquery(entity_type, entity_id, today, 30, new_stars),
         )
-        self.session.add(record)
-        await self.session.flush()
-        return record
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_metrics_entity_date",
+            set_={
+                "metrics": stmt.excluded.metrics,
+                "velocity_1d": stmt.excluded.velocity_1d,
+                "velocity_7d": stmt.excluded.velocity_7d,
+                "velocity_30d": stmt.excluded.velocity_30d,
+            },
+        ).returning(MetricsHistory)
 
-    async def _calc_velocity(
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
+
+    async def upsert_daily_snapshots_bulk(
         self,
+        entity_type: str,
+        snapshots: dict[uuid.UUID, dict],
+    ) -> int:
+        """Record or update today's snapshot for many entities at once.
+
+        Velocities follow the same rule as upsert_daily_snapshot but come from
+        one calc_velocities_bulk query, and all rows are written with a single
+        multi-row INSERT ... ON CONFLICT DO UPDATE. Returns the rows written.
+        """
+        if not snapshots:
+            return 0
+        today = date.today()
+        velocities = await self.calc_velocities_bulk(entity_type, list(snapshots), snapshots)
+        values = [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "metrics": metrics,
+                "recorded_at": today,
+                **dict(
+                    zip(("velocity_1d", "velocity_7d", "velocity_30d"), velocities[entity_id])
+                ),
+            }
+            for entity_id, metrics in snapshots.items()
+        ]
+
+        stmt = insert(MetricsHistory).values(values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_metrics_entity_date",
+            set_={
+                "metrics": stmt.excluded.metrics,
+                "velocity_1d": stmt.excluded.velocity_1d,
+                "velocity_7d": stmt.excluded.velocity_7d,
+                "velocity_30d": stmt.excluded.velocity_30d,
+            },
+        )
+        await self.session.execute(stmt)
+        return len(values)
+
+    @staticmethod
+    def _velocity_subquery(
         entity_type: str,
         entity_id: uuid.UUID,
+        today: date,
         days: int,
-        current_metrics: dict,
-    ) -> float | None:
-        """Calculate star velocity (stars gained per day) over a period."""
-        target_date = date.today() - timedelta(days=days)
-        result = await self.session.execute(
-            select(MetricsHistory)
+        new_stars: int,
+    ):
+        """Star velocity (stars gained per day) against the latest snapshot at least
+        ``days`` old, as a scalar subquery; NULL when there is no such snapshot."""
+        old_stars = func.coalesce(
+            MetricsHistory.metrics["stars_count"].astext.cast(Float), 0
+        )
+        actual_days = literal(today, Date) - MetricsHistory.recorded_at
+        return (
+            select((literal(new_stars, Float) - old_stars) / func.nullif(actual_days, 0))
             .where(
                 and_(
                     MetricsHistory.entity_type == entity_type,
                     MetricsHistory.entity_id == entity_id,
-                    MetricsHistory.recorded_at <= target_date,
+                    MetricsHistory.recorded_at <= today - timedelta(days=days),
                 )
             )
             .order_by(MetricsHistory.recorded_at.desc())
             .limit(1)
+            .scalar_subquery()
         )
-        old = result.scalar_one_or_none()
-        if not old:
-            return None
 
-        old_stars = old.metrics.get("stars_count", 0)
-        new_stars = current_metrics.get("stars_count", 0)
-        actual_days = (date.today() - old.recorded_at).days
-        if actual_days == 0:
-            return None
-        return (new_stars - old_stars) / actual_days
+    async def calc_velocities_bulk(
+        self,
+        entity_type: str,
+        entity_ids: list[uuid.UUID],
+        current: dict[uuid.UUID, dict],
+    ) -> dict[uuid.UUID, tuple[float | None, float | None, float | None]]:
+        """Star velocities (1d, 7d, 30d) for many entities in one query.
+
+        Same rule as upsert_daily_snapshot: compare ``current[entity_id]`` with
+        the latest snapshot at least N days old. The three anchors per entity
+        come from DISTINCT ON scans of the unique index, combined with UNION ALL.
+        """
+        if not entity_ids:
+            return {}
+        today = date.today()
+        horizons = (1, 7, 30)
+        stars = func.coalesce(MetricsHistory.metrics["stars_count"].astext.cast(Float), 0)
+        anchors = [
+            select(
+                literal(days).label("horizon"),
+                MetricsHistory.entity_id,
+                MetricsHistory.recorded_at,
+                stars.label("stars"),
+            )
+            .where(
+                and_(
+                    MetricsHistory.entity_type == entity_type,
+                    MetricsHistory.entity_id.in_(entity_ids),
+                    MetricsHistory.recorded_at <= today - timedelta(days=days),
+                )
+            )
+            .distinct(MetricsHistory.entity_id)
+            .order_by(MetricsHistory.entity_id, MetricsHistory.recorded_at.desc())
+            .subquery()
+            for days in horizons
+        ]
+        result = await self.session.execute(union_all(*(select(a) for a in anchors)))
+
+        velocities = {entity_id: [None, None, None] for entity_id in entity_ids}
+        for horizon, entity_id, recorded_at, old_stars in result.all():
+            actual_days = (today - recorded_at).days
+            if actual_days == 0:
+                continue
+            new_stars = current.get(entity_id, {}).get("stars_count", 0)
+            velocities[entity_id][horizons.index(horizon)] = (new_stars - old_stars) / actual_days
+        return {entity_id: tuple(v) for entity_id, v in velocities.items()}
 
     async def get_trending(
         self,
@@ -135,25 +292,19 @@ class MetricsRepository:
         category: str | None = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[TrendingScore], int]:
-        base_query = select(TrendingScore)
-
+        after: TrendingCursor | None = None,
+    ) -> tuple[list[TrendingScore], int | None, TrendingCursor | None]:
         filters = []
         if entity_type:
             filters.append(TrendingScore.entity_type == entity_type)
         if category:
             filters.append(TrendingScore.category == category)
-        if filters:
-            base_query = base_query.where(and_(*filters))
 
-        count_result = await self.session.execute(
-            select(func.count()).select_from(base_query.subquery())
+        rows, total, next_cursor = await self._paginate_by_score(
+            select(TrendingScore), select(func.count()).select_from(TrendingScore),
+            filters, skip, limit, after,
         )
-        total = count_result.scalar() or 0
-
-        query = base_query.order_by(TrendingScore.total_score.desc()).offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return list(result.scalars().all()), total
+        return [row[0] for row in rows], total, next_cursor
 
     async def get_trending_papers_with_search(
         self,
@@ -161,37 +312,30 @@ class MetricsRepository:
         search: str | None = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[tuple[TrendingScore, Paper]], int]:
+        after: TrendingCursor | None = None,
+    ) -> tuple[list[tuple[TrendingScore, Paper]], int | None, TrendingCursor | None]:
         """Get trending papers joined with Paper for search filtering."""
         from sqlalchemy import or_
 
-        base_query = (
-            select(TrendingScore, Paper)
-            .join(Paper, TrendingScore.entity_id == Paper.id)
-            .where(TrendingScore.entity_type == "paper")
-        )
-
+        onclause = TrendingScore.entity_id == Paper.id
+        filters = [TrendingScore.entity_type == "paper"]
         if category:
-            base_query = base_query.where(TrendingScore.category == category)
+            filters.append(TrendingScore.category == category)
         if search:
-            search_filter = f"%{search}%"
-            base_query = base_query.where(
+            # Full-text match on title/abstract/arxiv_id (GIN on search_tsv),
+            # plus arxiv_id prefixes such as "2401." that aren't whole tokens
+            filters.append(
                 or_(
-                    Paper.title.ilike(search_filter),
-                    Paper.abstract.ilike(search_filter),
-                    Paper.arxiv_id.ilike(search_filter),
+                    Paper.search_tsv.op("@@")(func.plainto_tsquery("english", search)),
+                    Paper.arxiv_id.ilike(f"{search}%"),
                 )
             )
 
-        count_result = await self.session.execute(
-            select(func.count()).select_from(base_query.subquery())
+        return await self._paginate_by_score(
+            select(TrendingScore, Paper).join(Paper, onclause),
+            select(func.count()).select_from(TrendingScore).join(Paper, onclause),
+            filters, skip, limit, after,
         )
-        total = count_result.scalar() or 0
-
-        query = base_query.order_by(TrendingScore.total_score.desc()).offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        rows = result.all()
-        return rows, total
 
     async def get_trending_with_language(
         self,
@@ -200,41 +344,157 @@ class MetricsRepository:
         search: str | None = None,
         skip: int = 0,
         limit: int = 20,
-    ) -> tuple[list[tuple[TrendingScore, Repository]], int]:
+        after: TrendingCursor | None = None,
+    ) -> tuple[list[tuple[TrendingScore, Repository]], int | None, TrendingCursor | None]:
         """Get trending repos joined with Repository for language/topic/search filtering."""
-        base_query = (
-            select(TrendingScore, Repository)
-            .join(Repository, TrendingScore.entity_id == Repository.id)
-            .where(TrendingScore.entity_type == "repository")
-        )
-
+        onclause = TrendingScore.entity_id == Repository.id
+        filters = [TrendingScore.entity_type == "repository"]
         if language:
-            base_query = base_query.where(Repository.primary_language == language)
+            filters.append(Repository.primary_language == language)
         if topics:
-            for t in topics:
-                base_query = base_query.where(Repository.topics.any(t))
+            # topics @> :topics — one probe of the idx_repos_topics GIN index
+            filters.append(Repository.topics.contains(topics))
         if search:
             search_filter = f"%{search}%"
             from sqlalchemy import or_
-            base_query = base_query.where(
+            filters.append(
                 or_(
                     Repository.full_name.ilike(search_filter),
                     Repository.description.ilike(search_filter),
                 )
             )
 
-        count_result = await self.session.execute(
-            select(func.count()).select_from(base_query.subquery())
+        return await self._paginate_by_score(
+            select(TrendingScore, Repository).join(Repository, onclause),
+            select(func.count()).select_from(TrendingScore).join(Repository, onclause),
+            filters, skip, limit, after,
         )
-        total = count_result.scalar() or 0
 
-        query = base_query.order_by(TrendingScore.total_score.desc()).offset(skip).limit(limit)
+    async def get_trending_with_entities(
+        self,
+        entity_cls: type[Paper] | type[Repository],
+        limit: int = 20,
+        columns: Sequence | None = None,
+    ) -> list[Row]:
+        """Top trending scores joined to their Paper or Repository rows.
+
+        Scores whose entity no longer exists drop out of the join, so up to
+        ``limit`` hydrated pairs come back from a single query. Rows are
+        (TrendingScore, entity) pairs, or with ``columns`` (total_score,
+        *columns) rows, readable by attribute, that skip loading the full
+        entities.
+        """
+        entity_type = "paper" if entity_cls is Paper else "repository"
+        selected = (
+            (TrendingScore.total_score, *columns) if columns else (TrendingScore, entity_cls)
+        )
+        result = await self.session.execute(
+            select(*selected)
+            .join(entity_cls, TrendingScore.entity_id == entity_cls.id)
+            .where(TrendingScore.entity_type == entity_type)
+            .order_by(TrendingScore.total_score.desc(), TrendingScore.id.desc())
+            .limit(limit)
+        )
+        # Row objects, not tuples: they unpack as pairs and also expose the
+        # selected columns (and total_score) by attribute
+        return list(result.all())
+
+    async def _paginate_by_score(
+        self,
+        base_query,
+        count_query,
+        filters: list,
+        skip: int,
+        limit: int,
+        after: TrendingCursor | None = None,
+    ) -> tuple[list[tuple], int | None, TrendingCursor | None]:
+        """Fetch one page ordered by total_score, with the total and next cursor.
+
+        With ``after`` (the cursor returned for the previous page) the page is
+        a keyset seek on (total_score DESC, id DESC): no rows are skipped and
+        no total is computed, so the total is None. ``skip`` is the legacy
+        offset mode, kept for callers that need a total.
+
+        For offset pages, COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so
+        each returned row carries the full count and one query serves both. Only
+        a page past the end, which has no rows to carry it, needs a separate
+        count; that one counts over the bare FROM/WHERE rather than wrapping the
+        entity query.
+
+        The next cursor is the last row's (total_score, id) when the page is
+        full, and None once the results are exhausted.
+        """
+        order = (TrendingScore.total_score.desc(), TrendingScore.id.desc())
+        if after is not None:
+            query = (
+                base_query.where(
+                    *filters, tuple_(TrendingScore.total_score, TrendingScore.id) < after
+                )
+                .order_by(*order)
+                .limit(limit)
+            )
+            result = await self.session.execute(query)
+            rows = [tuple(row) for row in result.all()]
+            return rows, None, self._next_cursor(rows, limit)
+
+        query = (
+            base_query.where(*filters)
+            .add_columns(func.count().over().label("_total"))
+            .order_by(*order)
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.session.execute(query)
         rows = result.all()
-        return rows, total
+        if rows:
+            page = [tuple(row[:-1]) for row in rows]
+            return page, rows[0][-1], self._next_cursor(page, limit)
+        if skip == 0:
+            return [], 0, None
+
+        return [], await self.session.scalar(count_query.where(*filters)) or 0, None
+
+    @staticmethod
+    def _next_cursor(rows: list[tuple], limit: int) -> TrendingCursor | None:
+        if len(rows) < limit:
+            return None
+        last = rows[-1][0]
+        return last.total_score, last.id
 
     async def get_trending_filters(self) -> dict:
-        """Get distinct categories and languages available in trending data."""
+        """Get distinct categories and languages available in trending data.
+
+        Served from the cache when one is configured; the entry expires after
+        TRENDING_FILTERS_CACHE_TTL and is dropped when trending scores are recalculated.
+        """
+        if self.cache:
+            try:
+                cached = await self.cache.get(TRENDING_FILTERS_CACHE_KEY)
+                if isinstance(cached, dict):
+                    return cached
+            except Exception as e:
+                logger.warning("Trending filters cache read failed", error=str(e))
+
+        filters = await self._query_trending_filters()
+
+        if self.cache:
+            try:
+                await self.cache.set(
+                    TRENDING_FILTERS_CACHE_KEY, filters, ttl=TRENDING_FILTERS_CACHE_TTL
+                )
+            except Exception as e:
+                logger.warning("Trending filters cache write failed", error=str(e))
+        return filters
+
+    async def invalidate_trending_filters(self) -> None:
+        if not self.cache:
+            return
+        try:
+            await self.cache.delete(TRENDING_FILTERS_CACHE_KEY)
+        except Exception as e:
+            logger.warning("Trending filters cache invalidation failed", error=str(e))
+
+    async def _query_trending_filters(self) -> dict:
         # Distinct categories from papers
         cat_result = await self.session.execute(
             select(TrendingScore.category)
@@ -248,55 +508,111 @@ class MetricsRepository:
         )
         categories = sorted([r[0] for r in cat_result.all()])
 
-        # Distinct languages from repos via join
-        lang_result = await self.session.execute(
-            select(Repository.primary_language)
-            .join(TrendingScore, TrendingScore.entity_id == Repository.id)
+        # Repos with trending scores, as a semi-join: a repo scored on many days
+        # is still read once, instead of once per TrendingScore row
+        has_trending = (
+            select(TrendingScore.id)
             .where(
                 and_(
                     TrendingScore.entity_type == "repository",
-                    Repository.primary_language.isnot(None),
+                    TrendingScore.entity_id == Repository.id,
                 )
             )
+            .exists()
+        )
+
+        # Distinct languages from trending repos
+        lang_result = await self.session.execute(
+            select(Repository.primary_language)
+            .where(Repository.primary_language.isnot(None), has_trending)
             .distinct()
         )
         languages = sorted([r[0] for r in lang_result.all()])
 
-        # Distinct topics from repos via join + unnest
-        topic_result = await self.session.execute(
+        # Distinct topics from trending repos: unnest each repo's topics once,
+        # then de-duplicate
+        topic_rows = (
             select(func.unnest(Repository.topics).label("topic"))
-            .join(TrendingScore, TrendingScore.entity_id == Repository.id)
-            .where(
-                and_(
-                    TrendingScore.entity_type == "repository",
-                    Repository.topics.isnot(None),
-                )
-            )
-            .distinct()
+            .where(Repository.topics.isnot(None), has_trending)
+            .subquery()
+        )
+        topic_result = await self.session.execute(
+            select(topic_rows.c.topic).distinct()
         )
         topics = sorted([r[0] for r in topic_result.all()])
 
         return {"categories": categories, "languages": languages, "topics": topics}
 
-    async def upsert_trending_score(self, score_data: dict) -> TrendingScore:
-        existing = await self.session.execute(
-            select(TrendingScore).where(
-                and_(
-                    TrendingScore.entity_type == score_data["entity_type"],
-                    TrendingScore.entity_id == score_data["entity_id"],
-                    TrendingScore.period_start == score_data["period_start"],
+    async def upsert_trending_scores_bulk(self, rows: list[dict]) -> int:
+        """Upsert many trending scores in one INSERT ... ON CONFLICT DO UPDATE.
+
+        Each row's velocities are copied from the entity's latest metrics
+        snapshot; those are looked up for all rows with one DISTINCT ON query
+        per entity type. Returns the number of rows written.
+        """
+        if not rows:
+            return 0
+
+        velocities: dict[uuid.UUID, tuple] = {}
+        ids_by_type: dict[str, list[uuid.UUID]] = {}
+        for row in rows:
+            ids_by_type.setdefault(row["entity_type"], []).append(row["entity_id"])
+        for entity_type, entity_ids in ids_by_type.items():
+            snapshot_types = _SNAPSHOT_ENTITY_TYPES.get(entity_type, (entity_type,))
+            result = await self.session.execute(
+                select(
+                    MetricsHistory.entity_id,
+                    MetricsHistory.velocity_1d,
+                    MetricsHistory.velocity_7d,
+                    MetricsHistory.velocity_30d,
+                )
+                .where(
+                    and_(
+                        MetricsHistory.entity_type.in_(snapshot_types),
+                        MetricsHistory.entity_id.in_(entity_ids),
+                    )
                 )
+                .distinct(MetricsHistory.entity_id)
+                .order_by(MetricsHistory.entity_id, MetricsHistory.recorded_at.desc())
             )
+            for entity_id, *entity_velocities in result.all():
+                velocities[entity_id] = tuple(entity_velocities)
+
+        values = [
+            {
+                **row,
+                **dict(
+                    zip(
+                        ("velocity_1d", "velocity_7d", "velocity_30d"),
+                        velocities.get(row["entity_id"], (None, None, None)),
+                    )
+                ),
+            }
+            for row in rows
+        ]
+
+        stmt = insert(TrendingScore).values(values)
+        # Entities without a snapshot keep the velocities they already have
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_trending_entity_period",
+            set_={
+                "activity_score": stmt.excluded.activity_score,
+                "community_score": stmt.excluded.community_score,
+                "academic_score": stmt.excluded.academic_score,
+                "recency_score": stmt.excluded.recency_score,
+                "total_score": stmt.excluded.total_score,
+                "category": stmt.excluded.category,
+                "period_end": stmt.excluded.period_end,
+                "velocity_1d": func.coalesce(
+                    stmt.excluded.velocity_1d, TrendingScore.velocity_1d
+                ),
+                "velocity_7d": func.coalesce(
+                    stmt.excluded.velocity_7d, TrendingScore.velocity_7d
+                ),
+                "velocity_30d": func.coalesce(
+                    stmt.excluded.velocity_30d, TrendingScore.velocity_30d
+                ),
+            },
         )
-        existing_score = existing.scalar_one_or_none()
-
-        if existing_score:
-            for key, value in score_data.items():
-                setattr(existing_score, key, value)
-            await self.session.flush()
-            return existing_score
-
-        score = TrendingScore(**score_data)
-        self.session.add(score)
-        await self.session.flush()
-        return score
+        await self.session.execute(stmt)
+        return len(values)
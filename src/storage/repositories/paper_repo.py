@@ -1,25 +1,434 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import time
 import uuid
 from datetime import date, timedelta
-
-from sqlalchemy import and_, case, func, literal_column, or_, select, text
+from functools import lru_cache
+
+import orjson
+
+from sqlalchemy import (
+    Date,
+    Integer,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    column,
+    func,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, UUID, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.logging import get_logger
+from src.storage.cache.redis_client import RedisCache
 from src.storage.models.paper import Paper
 
+logger = get_logger(__name__)
+
+# Dashboard analytics are cached in Redis for a short TTL. Entries are keyed by
+# method and arguments plus a version counter that invalidate_analytics() bumps.
+ANALYTICS_CACHE_PREFIX = "papers:analytics"
+ANALYTICS_CACHE_TTL = 60
+# Landscape and author comparison are heavy and only move with collection runs
+ANALYTICS_SLOW_CACHE_TTL = 1800
+ANALYTICS_VERSION_KEY = "papers:analytics:version"
+
+# Short-lived in-process cache of list_papers totals, keyed by the normalized
+# filter set. Paging through one listing re-asks for the same count each time.
+# Entries are never invalidated (ingest happens in other processes), so a
+# total can be up to _COUNT_CACHE_TTL seconds stale after new papers land.
+_COUNT_CACHE_TTL = 30.0
+_COUNT_CACHE_MAXSIZE = 512
+_count_cache: dict[tuple, tuple[float, int]] = {}
+# Per-key locks so concurrent API requests on the same loop that miss the
+# cache together run one COUNT(*) instead of one each
+_count_locks: dict[tuple, asyncio.Lock] = {}
+
+# One row per (paper, author), refreshed by the refresh_paper_views task
+paper_authors_mv = table(
+    "paper_authors_mv",
+    column("paper_id"),
+    column("author_name", String),
+    column("affiliation", String),
+    column("author_count", Integer),
+    column("citation_count", Integer),
+    column("categories", ARRAY(String)),
+    column("published_date", Date),
+)
+
+
+def _cached_count(key: tuple) -> int | None:
+    entry = _count_cache.get(key)
+    if entry is None:
+        return None
+    expires, total = entry
+    if expires < time.monotonic():
+        _count_cache.pop(key, None)
+        return None
+    return total
+
+
+def _store_count(key: tuple, total: int) -> None:
+    if len(_count_cache) >= _COUNT_CACHE_MAXSIZE:
+        now = time.monotonic()
+        for k in [k for k, (expires, _) in _count_cache.items() if expires < now]:
+            del _count_cache[k]
+        if len(_count_cache) >= _COUNT_CACHE_MAXSIZE:
+            _count_cache.clear()
+    _count_cache[key] = (time.monotonic() + _COUNT_CACHE_TTL, total)
+
+
+def _cached_analytics(method=None, *, ttl: int = ANALYTICS_CACHE_TTL):
+    """Serve a PaperRepository analytics method from the cache when one is set.
+
+    Usable bare or as ``@_cached_analytics(ttl=...)``.
+    """
+    if method is None:
+        return functools.partial(_cached_analytics, ttl=ttl)
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return await method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = {k: v for k, v in bound.arguments.items() if k != "self"}
+        return await self._cached(
+            method.__name__, params, lambda: method(self, *args, **kwargs), ttl=ttl
+        )
+
+    return wrapper
+
+
+@lru_cache(maxsize=256)
+def _parse_csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated filter value, dropping blanks."""
+    return tuple(v for v in (part.strip() for part in value.split(",")) if v)
+
+
+_PAPERS_RELTUPLES_SQL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'papers'::regclass"
+)
+
+
+# Raw analytics statements are built once. Each has one statement text: the
+# optional category filter is a NULL-able parameter rather than an
+# interpolated clause, so the server-side prepared statement and plan cache
+# are reused across calls. The filter is written as array containment (@>)
+# so the GIN indexes on categories can serve it.
+
+_COAUTHOR_NETWORK_SQL = text("""
+    WITH paper_authors AS (
+        -- Deduplicated up front so each paper joins once per pair and
+        -- the weight below is a plain COUNT(*) (hash aggregate)
+        SELECT DISTINCT p.paper_id, p.author_name, p.affiliation
+        FROM paper_authors_mv p
+        WHERE p.author_count > 1
+          AND p.author_name IS NOT NULL
+          AND (CAST(:category AS text) IS NULL
+               OR p.categories @> ARRAY[CAST(:category AS varchar)])
+    ),
+    pairs AS (
+        SELECT a1.author_name AS source,
+               a2.author_name AS target,
+               a1.affiliation AS source_aff,
+               a2.affiliation AS target_aff,
+               COUNT(*) AS weight
+        FROM paper_authors a1
+        JOIN paper_authors a2
+          ON a1.paper_id = a2.paper_id
+         AND a1.author_name < a2.author_name
+        GROUP BY a1.author_name, a2.author_name, a1.affiliation, a2.affiliation
+        HAVING COUNT(*) >= :min_collabs
+        ORDER BY weight DESC
+        LIMIT :limit
+    ),
+    ends AS (
+        SELECT source AS id, source_aff AS affiliation, weight FROM pairs
+        UNION ALL
+        SELECT target, target_aff, weight FROM pairs
+    ),
+    nodes AS (
+        -- Affiliation from the node's strongest edge
+        SELECT id,
+               SUM(weight) AS paper_count,
+               (array_agg(affiliation ORDER BY weight DESC))[1] AS affiliation
+        FROM ends
+        GROUP BY id
+    )
+    SELECT
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'label', id,
+                    'paper_count', paper_count, 'affiliation', affiliation
+                ) ORDER BY paper_count DESC), '[]'::json)
+         FROM nodes) AS nodes,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'source', source, 'target', target, 'weight', weight
+                ) ORDER BY weight DESC), '[]'::json)
+         FROM pairs) AS edges
+""").columns(nodes=JSON, edges=JSON)
+
+_TOPIC_COOCCURRENCE_SQL = text("""
+    WITH topic_pairs AS (
+        SELECT t1.topic AS topic_a, t2.topic AS topic_b,
+               COUNT(*) AS weight
+        FROM (SELECT p.id, unnest(p.topics) AS topic FROM papers p
+              WHERE p.topics IS NOT NULL
+                AND (CAST(:category AS text) IS NULL
+                     OR p.categories @> ARRAY[CAST(:category AS varchar)])) t1
+        JOIN (SELECT p.id, unnest(p.topics) AS topic FROM papers p
+              WHERE p.topics IS NOT NULL
+                AND (CAST(:category AS text) IS NULL
+                     OR p.categories @> ARRAY[CAST(:category AS varchar)])) t2
+          ON t1.id = t2.id AND t1.topic < t2.topic
+        GROUP BY t1.topic, t2.topic
+        HAVING COUNT(*) >= :min_co
+        ORDER BY weight DESC
+        LIMIT :limit
+    ),
+    ends AS (
+        SELECT topic_a AS id, weight FROM topic_pairs
+        UNION ALL
+        SELECT topic_b, weight FROM topic_pairs
+    ),
+    nodes AS (
+        SELECT id, SUM(weight) AS paper_count FROM ends GROUP BY id
+    )
+    SELECT
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'id', id, 'label', id, 'paper_count', paper_count
+                ) ORDER BY paper_count DESC), '[]'::json)
+         FROM nodes) AS nodes,
+        (SELECT COALESCE(json_agg(json_build_object(
+                    'source', topic_a, 'target', topic_b, 'weight', weight
+                ) ORDER BY weight DESC), '[]'::json)
+         FROM topic_pairs) AS edges
+""").columns(nodes=JSON, edges=JSON)
+
+_CITATION_TOP_AUTHORS_SQL = text("""
+    SELECT p.author_name,
+           SUM(p.citation_count) AS total_cit
+    FROM paper_authors_mv p
+    WHERE p.citation_count > 0
+      AND (CAST(:category AS text) IS NULL
+           OR p.categories @> ARRAY[CAST(:category AS varchar)])
+    GROUP BY p.author_name
+    ORDER BY total_cit DESC
+    LIMIT :limit
+""")
+
+_CITATION_TIMELINE_SQL = text("""
+    SELECT EXTRACT(YEAR FROM p.published_date)::int AS year,
+           p.author_name,
+           SUM(p.citation_count) AS citations
+    FROM paper_authors_mv p
+    WHERE p.published_date IS NOT NULL
+      AND p.author_name = ANY(:authors)
+    GROUP BY year, p.author_name
+    ORDER BY year
+""").bindparams(
+    bindparam("authors", type_=ARRAY(String)),
+)
+
+_TOP_TOPICS_SQL = text("""
+    SELECT topic, COUNT(*) AS cnt
+    FROM (SELECT unnest(p.topics) AS topic FROM papers p
+          WHERE p.topics IS NOT NULL
+            AND (CAST(:category AS text) IS NULL
+                 OR p.categories @> ARRAY[CAST(:category AS varchar)])) sub
+    GROUP BY topic ORDER BY cnt DESC LIMIT :limit
+""")
+
+_TOPIC_CORRELATION_SQL = text("""
+    SELECT t1.topic AS topic_a, t2.topic AS topic_b, COUNT(*) AS cnt
+    FROM (SELECT p.id, unnest(p.topics) AS topic FROM papers p WHERE p.topics IS NOT NULL) t1
+    JOIN (SELECT p.id, unnest(p.topics) AS topic FROM papers p WHERE p.topics IS NOT NULL) t2
+      ON t1.id = t2.id AND t1.topic < t2.topic
+    WHERE t1.topic = ANY(:topics) AND t2.topic = ANY(:topics)
+    GROUP BY t1.topic, t2.topic
+    HAVING COUNT(*) >= :min_co
+""").bindparams(
+    bindparam("topics", type_=ARRAY(String)),
+)
+
+# Topics are unnested inline in FROM and grouped directly, without an
+# intermediate subquery scan
+_RESEARCH_LANDSCAPE_SQL = text("""
+    SELECT topic,
+           AVG(EXTRACT(YEAR FROM p.published_date)) AS avg_year,
+           AVG(p.citation_count) AS avg_citations,
+           COUNT(*) AS paper_count
+    FROM papers p, unnest(p.topics) AS topic
+    WHERE p.topics IS NOT NULL
+      AND p.published_date IS NOT NULL
+      AND (CAST(:categories AS varchar[]) IS NULL
+           OR p.categories && CAST(:categories AS varchar[]))
+    GROUP BY topic
+    HAVING COUNT(*) >= 5
+    ORDER BY paper_count DESC
+    LIMIT :limit
+""").bindparams(
+    bindparam("categories", type_=ARRAY(String)),
+)
+
+# Two-stage aggregation instead of COUNT(DISTINCT ...): group per (aff, paper)
+# and (aff, author) first, then count the groups
+_INSTITUTION_RANKING_SQL = text("""
+    WITH sub AS (
+        SELECT p.paper_id,
+               p.author_name,
+               p.affiliation AS aff,
+               p.citation_count
+        FROM paper_authors_mv p
+        WHERE p.affiliation IS NOT NULL
+          AND p.affiliation != ''
+          AND (CAST(:category AS text) IS NULL
+               OR p.categories @> ARRAY[CAST(:category AS varchar)])
+    ),
+    per_paper AS (
+        SELECT aff, paper_id,
+               COUNT(*) AS n_rows,
+               SUM(citation_count) AS citations
+        FROM sub
+        GROUP BY aff, paper_id
+    ),
+    per_author AS (
+        SELECT aff, COUNT(*) AS author_count
+        FROM (
+            SELECT aff, author_name FROM sub
+            WHERE author_name IS NOT NULL
+            GROUP BY aff, author_name
+        ) s
+        GROUP BY aff
+    )
+    SELECT pp.aff,
+           COUNT(*) AS paper_count,
+           COALESCE(SUM(pp.citations), 0) AS total_citations,
+           ROUND((SUM(pp.citations)::numeric / SUM(pp.n_rows)), 1) AS avg_citations,
+           COALESCE(MAX(pa.author_count), 0) AS author_count
+    FROM per_paper pp
+    LEFT JOIN per_author pa ON pa.aff = pp.aff
+    GROUP BY pp.aff
+    ORDER BY paper_count DESC
+    LIMIT :limit
+""")
+
+# Author rows come from paper_authors_mv via its author_name index; papers is
+# joined only for topics
+_AUTHOR_COMPARISON_SQL = text("""
+    WITH exp AS (
+        SELECT pa.paper_id,
+               pa.citation_count,
+               pa.published_date,
+               p.topics,
+               pa.author_name,
+               pa.affiliation
+        FROM paper_authors_mv pa
+        JOIN papers p ON p.id = pa.paper_id
+        WHERE pa.author_name = ANY(:names)
+    ),
+    topic_counts AS (
+        SELECT author_name, t.topic, COUNT(*) AS cnt
+        FROM exp, unnest(exp.topics) AS t(topic)
+        GROUP BY author_name, t.topic
+    ),
+    top_topics AS (
+        SELECT author_name,
+               (array_agg(topic ORDER BY cnt DESC, topic))[1:5] AS topics
+        FROM topic_counts
+        GROUP BY author_name
+    )
+    SELECT e.author_name,
+           mode() WITHIN GROUP (ORDER BY e.affiliation) AS affiliation,
+           COUNT(DISTINCT e.paper_id) AS paper_count,
+           COALESCE(SUM(e.citation_count), 0) AS total_citations,
+           ROUND(AVG(e.citation_count)::numeric, 1) AS avg_citations,
+           MIN(EXTRACT(YEAR FROM e.published_date))::int AS first_year,
+           MAX(EXTRACT(YEAR FROM e.published_date))::int AS last_year,
+           tt.topics
+    FROM exp e
+    LEFT JOIN top_topics tt ON tt.author_name = e.author_name
+    GROUP BY e.author_name, tt.topics
+""").bindparams(
+    bindparam("names", type_=ARRAY(String)),
+)
+
 
 class PaperRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: RedisCache | None = None):
         self.session = session
+        self.cache = cache
+        # (column, value) -> id for unique-key lookups already resolved on this
+        # session, so repeats go through the identity map instead of a SELECT
+        self._ids_by_key: dict[tuple[str, str], uuid.UUID] = {}
+
+    async def _cached(
+        self, name: str, params: dict, compute, ttl: int = ANALYTICS_CACHE_TTL
+    ):
+        key = None
+        try:
+            version = await self.cache.get(ANALYTICS_VERSION_KEY) or 0
+            digest = hashlib.sha1(
+                orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str)
+            ).hexdigest()
+            key = f"{ANALYTICS_CACHE_PREFIX}:{name}:v{version}:{digest}"
+            cached = await self.cache.get(key)
+            if isinstance(cached, dict):
+                return cached
+        except Exception as e:
+            logger.warning("Paper analytics cache read failed", method=name, error=str(e))
+
+        data = await compute()
+
+        if key is not None:
+            try:
+                await self.cache.set(key, data, ttl=ttl)
+            except Exception as e:
+                logger.warning("Paper analytics cache write failed", method=name, error=str(e))
+        return data
+
+    async def invalidate_analytics(self) -> None:
+        """Orphan every cached analytics entry by bumping the version counter."""
+        if not self.cache:
+            return
+        try:
+            await self.cache.incr(ANALYTICS_VERSION_KEY)
+        except Exception as e:
+            logger.warning("Paper analytics cache invalidation failed", error=str(e))
 
     async def get_by_id(self, paper_id: uuid.UUID) -> Paper | None:
-        result = await self.session.execute(select(Paper).where(Paper.id == paper_id))
-        return result.scalar_one_or_none()
+        return await self.session.get(Paper, paper_id)
+
+    async def _get_by_unique(self, column, value: str) -> Paper | None:
+        key = (column.key, value)
+        paper_id = self._ids_by_key.get(key)
+        if paper_id is not None:
+            paper = await self.session.get(Paper, paper_id)
+            # The key may have been changed by an upsert since it was cached
+            if paper is not None and getattr(paper, column.key) == value:
+                return paper
+            del self._ids_by_key[key]
+
+        result = await self.session.execute(select(Paper).where(column == value))
+        paper = result.scalar_one_or_none()
+        if paper is not None:
+            self._ids_by_key[key] = paper.id
+        return paper
 
     async def get_by_arxiv_id(self, arxiv_id: str) -> Paper | None:
-        result = await self.session.execute(
-            select(Paper).where(Paper.arxiv_id == arxiv_id)
-        )
-        return result.scalar_one_or_none()
+        return await self._get_by_unique(Paper.arxiv_id, arxiv_id)
 
     def _build_filters(
         self,
@@ -33,18 +442,15 @@ class PaperRepository:
         source: str | None = None,
     ) -> list:
         filters = []
+        # Array overlap (&&) is served directly by the GIN indexes
         if category:
-            cats = [c.strip() for c in category.split(",") if c.strip()]
-            if len(cats) == 1:
-                filters.append(Paper.categories.any(cats[0]))
-            elif len(cats) > 1:
-                filters.append(or_(*(Paper.categories.any(c) for c in cats)))
+            cats = _parse_csv(category)
+            if cats:
+                filters.append(Paper.categories.overlap(list(cats)))
         if topic:
-            topics = [t.strip() for t in topic.split(",") if t.strip()]
-            if len(topics) == 1:
-                filters.append(Paper.topics.any(topics[0]))
-            elif len(topics) > 1:
-                filters.append(or_(*(Paper.topics.any(t) for t in topics)))
+            topics = _parse_csv(topic)
+            if topics:
+                filters.append(Paper.topics.overlap(list(topics)))
         if date_from:
             filters.append(Paper.published_date >= date_from)
         if date_to:
@@ -56,14 +462,29 @@ class PaperRepository:
         if source:
             filters.append(Paper.source == source)
         if search:
-            term = f"%{search}%"
-            filters.append(
-                or_(
-                    Paper.title.ilike(term),
-                    Paper.abstract.ilike(term),
-                    Paper.arxiv_id.ilike(term),
+            search = search.strip()
+            if len(search) < 3:
+                # Too short for a useful tsquery; trigram GIN indexes still
+                # back the unanchored ILIKE
+                term = f"%{search}%"
+                filters.append(
+                    or_(
+                        Paper.title.ilike(term),
+                        Paper.abstract.ilike(term),
+                        Paper.arxiv_id.ilike(term),
+                    )
+                )
+            else:
+                # Full-text match via the GIN index on search_tsv, plus arxiv_id
+                # prefixes such as "2401." that aren't whole tokens
+                filters.append(
+                    or_(
+                        Paper.search_tsv.op("@@")(
+                            func.websearch_to_tsquery("english", search)
+                        ),
+                        Paper.arxiv_id.ilike(f"{search}%"),
+                    )
                 )
-            )
         return filters
 
     async def list_papers(
@@ -80,7 +501,14 @@ class PaperRepository:
         source: str | None = None,
         sort_by: str = "published_date",
         sort_order: str = "desc",
-    ) -> tuple[list[Paper], int]:
+        after: tuple | None = None,
+    ) -> tuple[list[Paper], int | None]:
+        """List papers a page at a time.
+
+        Pass ``after=(sort_value, id)`` from the last row of the previous page
+        to seek instead of skipping rows; the total is then not computed and
+        comes back as None.
+        """
         filters = self._build_filters(
             category=category, topic=topic, date_from=date_from,
             date_to=date_to, has_code=has_code, is_vietnamese=is_vietnamese,
@@ -95,22 +523,77 @@ class PaperRepository:
             query = query.where(where)
             count_query = count_query.where(where)
 
+        # id breaks ties so pages are deterministic and seekable; NULL sort
+        # values go last in both directions
         sort_column = getattr(Paper, sort_by, Paper.published_date)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+        descending = sort_order == "desc"
+        if descending:
+            query = query.order_by(sort_column.desc().nulls_last(), Paper.id.desc())
         else:
-            query = query.order_by(sort_column.asc())
+            query = query.order_by(sort_column.asc().nulls_last(), Paper.id.asc())
+
+        if after is not None:
+            last_value, last_id = after
+            if last_value is None:
+                seek = and_(
+                    sort_column.is_(None),
+                    Paper.id < last_id if descending else Paper.id > last_id,
+                )
+            else:
+                key = tuple_(sort_column, Paper.id)
+                bound = tuple_(last_value, last_id)
+                seek = or_(key < bound if descending else key > bound, sort_column.is_(None))
+            result = await self.session.execute(query.where(seek).limit(limit))
+            return list(result.scalars().all()), None
 
         query = query.offset(skip).limit(limit)
 
         result = await self.session.execute(query)
         papers = list(result.scalars().all())
 
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar() or 0
+        # A short page that isn't past the end already tells us the total
+        if len(papers) < limit and (papers or skip == 0):
+            return papers, skip + len(papers)
+
+        cache_key = (
+            category, topic, date_from, date_to,
+            has_code, is_vietnamese, search, source,
+        )
+        total = _cached_count(cache_key)
+        if total is not None:
+            return papers, total
+
+        lock = _count_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                # A request that held the lock before us may have filled it
+                total = _cached_count(cache_key)
+                if total is None and not filters:
+                    # Unfiltered listings only drive a pager, so the planner's
+                    # row estimate stands in for a full COUNT(*) of papers
+                    total = await self._estimated_total()
+                if total is None:
+                    total = await self.session.scalar(count_query) or 0
+                _store_count(cache_key, total)
+        finally:
+            # Waiters keep their reference; later arrivals hit the cache
+            if not lock.locked():
+                _count_locks.pop(cache_key, None)
 
         return papers, total
 
+    async def _estimated_total(self) -> int | None:
+        """Row estimate for papers kept by autovacuum/ANALYZE, or None if unknown."""
+        estimate = (
+            await self.session.execute(_PAPERS_RELTUPLES_SQL)
+        ).scalar()
+        # reltuples is -1 (or 0 before the first VACUUM on old servers) until
+        # the table has been analyzed
+        if estimate is None or estimate <= 0:
+            return None
+        return int(estimate)
+
+    @_cached_analytics
     async def get_stats(
         self,
         category: str | None = None,
@@ -123,52 +606,81 @@ class PaperRepository:
 
         thirty_days_ago = date.today() - timedelta(days=30)
 
-        # Summary
-        summary_q = select(
-            func.count().label("total_papers"),
-            func.coalesce(func.sum(Paper.citation_count), 0).label("total_citations"),
-            func.coalesce(func.avg(Paper.citation_count), 0).label("avg_citations"),
-            func.sum(case((Paper.published_date >= thirty_days_ago, 1), else_=0)).label("recent_papers"),
-        ).where(where_clause)
-        summary = (await self.session.execute(summary_q)).one()
+        # Scan the filtered set once and derive every section from it
+        filtered = (
+            select(
+                Paper.citation_count,
+                Paper.published_date,
+                Paper.categories,
+                Paper.source,
+            )
+            .where(where_clause)
+            .cte("filtered")
+            .prefix_with("MATERIALIZED")
+        )
+
+        def _pairs(key, value, order_by):
+            """json_agg of [key, value] pairs, preserving order for dict()."""
+            return func.json_agg(
+                aggregate_order_by(func.json_build_array(key, value), order_by),
+                type_=JSON,
+            )
 
         # Category distribution (unnest ARRAY)
-        cat_unnest = func.unnest(Paper.categories).label("category")
-        cat_subq = (
-            select(Paper.id, cat_unnest)
-            .where(where_clause)
-            .where(Paper.categories.isnot(None))
+        cats = (
+            select(func.unnest(filtered.c.categories).label("category"))
+            .where(filtered.c.categories.isnot(None))
             .subquery()
         )
-        cat_q = (
-            select(cat_subq.c.category, func.count().label("cnt"))
-            .group_by(cat_subq.c.category)
-            .order_by(func.count().desc())
+        cat_counts = (
+            select(cats.c.category, func.count().label("cnt"))
+            .group_by(cats.c.category)
+            .subquery()
         )
-        cat_result = await self.session.execute(cat_q)
-        category_distribution = {row.category: row.cnt for row in cat_result.all()}
+        cat_json = select(
+            _pairs(cat_counts.c.category, cat_counts.c.cnt, cat_counts.c.cnt.desc())
+        ).scalar_subquery()
 
         # Source distribution
-        source_q = (
-            select(Paper.source, func.count().label("cnt"))
-            .where(where_clause)
-            .group_by(Paper.source)
-            .order_by(func.count().desc())
+        src_counts = (
+            select(filtered.c.source, func.count().label("cnt"))
+            .group_by(filtered.c.source)
+            .subquery()
         )
-        source_result = await self.session.execute(source_q)
-        source_distribution = {row.source: row.cnt for row in source_result.all()}
+        source_json = select(
+            _pairs(src_counts.c.source, src_counts.c.cnt, src_counts.c.cnt.desc())
+        ).scalar_subquery()
 
         # Year distribution
-        year_expr = func.extract("year", Paper.published_date).label("year")
-        year_q = (
-            select(year_expr, func.count().label("cnt"))
-            .where(where_clause)
-            .where(Paper.published_date.isnot(None))
+        year_expr = func.extract("year", filtered.c.published_date)
+        year_counts = (
+            select(year_expr.label("year"), func.count().label("cnt"))
+            .where(filtered.c.published_date.isnot(None))
             .group_by(year_expr)
-            .order_by(year_expr.desc())
+            .subquery()
         )
-        year_result = await self.session.execute(year_q)
-        year_distribution = {str(int(row.year)): row.cnt for row in year_result.all() if row.year}
+        year_json = select(
+            _pairs(year_counts.c.year, year_counts.c.cnt, year_counts.c.year.desc())
+        ).scalar_subquery()
+
+        stats_q = select(
+            func.count().label("total_papers"),
+            func.coalesce(func.sum(filtered.c.citation_count), 0).label("total_citations"),
+            func.coalesce(func.avg(filtered.c.citation_count), 0).label("avg_citations"),
+            func.sum(
+                case((filtered.c.published_date >= thirty_days_ago, 1), else_=0)
+            ).label("recent_papers"),
+            cat_json.label("categories"),
+            source_json.label("sources"),
+            year_json.label("years"),
+        ).select_from(filtered)
+        summary = (await self.session.execute(stats_q)).one()
+
+        category_distribution = dict(summary.categories or ())
+        source_distribution = dict(summary.sources or ())
+        year_distribution = {
+            str(int(year)): cnt for year, cnt in (summary.years or ()) if year
+        }
 
         return {
             "total_papers": summary.total_papers or 0,
@@ -199,17 +711,72 @@ class PaperRepository:
         await self.session.flush()
         return paper
 
+    async def upsert_many_by_arxiv_id(self, papers: list[dict]) -> int:
+        """Bulk form of upsert_by_arxiv_id as INSERT ... ON CONFLICT (arxiv_id).
+
+        As with the single-row version, only non-null incoming values overwrite
+        an existing row, and rows whose values wouldn't change are left alone.
+        Returns the number of distinct arxiv_ids applied.
+        """
+        # One statement can't touch the same row twice, so merge duplicates
+        merged: dict[str, dict] = {}
+        for paper_data in papers:
+            arxiv_id = paper_data.get("arxiv_id")
+            if not arxiv_id:
+                continue
+            if arxiv_id in merged:
+                merged[arxiv_id].update(
+                    {k: v for k, v in paper_data.items() if v is not None}
+                )
+            else:
+                merged[arxiv_id] = dict(paper_data)
+        if not merged:
+            return 0
+
+        # Rows sharing a key set share a statement (multi-row VALUES needs it)
+        groups: dict[tuple[str, ...], list[dict]] = {}
+        for paper_data in merged.values():
+            groups.setdefault(tuple(sorted(paper_data)), []).append(paper_data)
+
+        table = Paper.__table__
+        for columns, rows in groups.items():
+            # Stay well under asyncpg's 32767 bind-parameter limit
+            chunk_size = max(1, 30000 // len(columns))
+            updatable = [c for c in columns if c != "arxiv_id"]
+            for start in range(0, len(rows), chunk_size):
+                stmt = pg_insert(Paper).values(rows[start:start + chunk_size])
+                excluded = stmt.excluded
+                if not updatable:
+                    stmt = stmt.on_conflict_do_nothing(index_elements=["arxiv_id"])
+                else:
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["arxiv_id"],
+                        set_={
+                            **{
+                                c: func.coalesce(excluded[c], table.c[c])
+                                for c in updatable
+                            },
+                            "updated_at": func.now(),
+                        },
+                        where=or_(
+                            *(
+                                and_(
+                                    excluded[c].isnot(None),
+                                    table.c[c].is_distinct_from(excluded[c]),
+                                )
+                                for c in updatable
+                            )
+                        ),
+                    )
+                await self.session.execute(stmt)
+
+        return len(merged)
+
     async def get_by_s2_id(self, s2_id: str) -> Paper | None:
-        result = await self.session.execute(
-            select(Paper).where(Paper.semantic_scholar_id == s2_id)
-        )
-        return result.scalar_one_or_none()
+        return await self._get_by_unique(Paper.semantic_scholar_id, s2_id)
 
     async def _get_by_doi(self, doi: str) -> Paper | None:
-        result = await self.session.execute(
-            select(Paper).where(Paper.doi == doi)
-        )
-        return result.scalar_one_or_none()
+        return await self._get_by_unique(Paper.doi, doi)
 
     async def upsert_by_s2_id(self, paper_data: dict) -> Paper | None:
         arxiv_id = paper_data.get("arxiv_id")
@@ -240,6 +807,63 @@ class PaperRepository:
             await self.session.rollback()
             return None
 
+    async def upsert_many(self, papers: list[dict]) -> int:
+        """Batch form of upsert_by_s2_id: one lookup for the whole batch.
+
+        Existing rows are matched by arxiv_id, then semantic_scholar_id, then
+        doi, and updated with the non-null fields; the rest are inserted in a
+        single flush. Returns the number of records applied.
+        """
+        if not papers:
+            return 0
+
+        arxiv_ids = {p["arxiv_id"] for p in papers if p.get("arxiv_id")}
+        s2_ids = {p["semantic_scholar_id"] for p in papers if p.get("semantic_scholar_id")}
+        dois = {p["doi"] for p in papers if p.get("doi")}
+
+        by_arxiv: dict[str, Paper] = {}
+        by_s2: dict[str, Paper] = {}
+        by_doi: dict[str, Paper] = {}
+
+        def _index(paper: Paper) -> None:
+            if paper.arxiv_id:
+                by_arxiv[paper.arxiv_id] = paper
+            if paper.semantic_scholar_id:
+                by_s2[paper.semantic_scholar_id] = paper
+            if paper.doi:
+                by_doi[paper.doi] = paper
+
+        conditions = []
+        if arxiv_ids:
+            conditions.append(Paper.arxiv_id.in_(arxiv_ids))
+        if s2_ids:
+            conditions.append(Paper.semantic_scholar_id.in_(s2_ids))
+        if dois:
+            conditions.append(Paper.doi.in_(dois))
+        if conditions:
+            result = await self.session.execute(select(Paper).where(or_(*conditions)))
+            for paper in result.scalars():
+                _index(paper)
+
+        for paper_data in papers:
+            existing = (
+                by_arxiv.get(paper_data.get("arxiv_id") or "")
+                or by_s2.get(paper_data.get("semantic_scholar_id") or "")
+                or by_doi.get(paper_data.get("doi") or "")
+            )
+            if existing:
+                for key, value in paper_data.items():
+                    if value is not None:
+                        setattr(existing, key, value)
+            else:
+                existing = Paper(**paper_data)
+                self.session.add(existing)
+            # Later duplicates in the same batch merge into this row
+            _index(existing)
+
+        await self.session.flush()
+        return len(papers)
+
     async def get_unprocessed(self, limit: int = 100) -> list[Paper]:
         result = await self.session.execute(
             select(Paper)
@@ -249,103 +873,140 @@ class PaperRepository:
         )
         return list(result.scalars().all())
 
-    async def mark_processed(self, paper_id: uuid.UUID) -> None:
-        paper = await self.get_by_id(paper_id)
-        if paper:
-            paper.is_processed = True
-            await self.session.flush()
-
-    async def get_author_analytics(
-        self, limit: int = 20, category: str | None = None
-    ) -> dict:
-        filters = self._build_filters(category=category)
-        where_clause = and_(*filters) if filters else text("TRUE")
+    async def get_unprocessed_light(self, limit: int = 100) -> list:
+        """Like get_unprocessed, but returns only the columns embedding needs.
 
-        # Use jsonb_array_elements to unnest JSONB authors array
-        author_subq = (
+        Rows are plain tuples rather than ORM instances, so no identity map
+        entries or unused wide columns are loaded.
+        """
+        result = await self.session.execute(
             select(
-                literal_column("author->>'name'").label("author_name"),
-                literal_column("author->>'affiliation'").label("affiliation"),
+                Paper.id,
+                Paper.arxiv_id,
+                Paper.title,
+                Paper.abstract,
+                Paper.categories,
+                Paper.topics,
+                Paper.keywords,
+                Paper.published_date,
                 Paper.citation_count,
+                Paper.source_url,
             )
-            .select_from(
-                Paper.__table__.join(
-                    text("jsonb_array_elements(papers.authors) AS author"),
-                    text("TRUE"),
-                    isouter=True,
-                )
-            )
-            .where(where_clause)
-            .where(Paper.authors.isnot(None))
-            .subquery()
+            .where(Paper.is_processed == False)  # noqa: E712
+            .order_by(Paper.created_at.asc())
+            .limit(limit)
         )
+        return list(result.all())
 
-        # Top by papers
-        top_papers_q = (
-            select(
-                author_subq.c.author_name,
-                func.min(author_subq.c.affiliation).label("affiliation"),
-                func.count().label("paper_count"),
-                func.coalesce(func.sum(author_subq.c.citation_count), 0).label("total_citations"),
-            )
-            .where(author_subq.c.author_name.isnot(None))
-            .group_by(author_subq.c.author_name)
-            .order_by(func.count().desc())
-            .limit(limit)
+    async def mark_processed(self, paper_id: uuid.UUID) -> None:
+        await self.mark_processed_many([paper_id])
+
+    async def mark_processed_many(self, paper_ids: list[uuid.UUID]) -> None:
+        if not paper_ids:
+            return
+        # One uuid[] parameter rather than an expanded IN list, so the
+        # statement text (and its prepared plan) is the same for any batch size
+        await self.session.execute(
+            update(Paper)
+            .where(Paper.id == any_(bindparam("ids", paper_ids, type_=ARRAY(UUID(as_uuid=True)))))
+            .values(is_processed=True)
+            .execution_options(synchronize_session=False)
         )
-        top_papers = (await self.session.execute(top_papers_q)).all()
 
-        # Top by citations
-        top_cit_q = (
+    async def refresh_author_view(self) -> None:
+        """Rebuild paper_authors_mv without blocking readers."""
+        await self.session.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY paper_authors_mv")
+        )
+
+    @_cached_analytics
+    async def get_author_analytics(
+        self, limit: int = 20, category: str | None = None
+    ) -> dict:
+        mv = paper_authors_mv
+        author_query = select(
+            mv.c.author_name,
+            mv.c.affiliation,
+            mv.c.citation_count,
+        )
+        if category:
+            cats = _parse_csv(category)
+            if cats:
+                author_query = author_query.where(mv.c.categories.overlap(list(cats)))
+        # The author rows are read once; per-author totals are computed once
+        # and both top-N lists plus the affiliation counts are sliced from them
+        author_rows = author_query.cte("author_rows").prefix_with("MATERIALIZED")
+        authors = (
             select(
-                author_subq.c.author_name,
-                func.min(author_subq.c.affiliation).label("affiliation"),
+                author_rows.c.author_name,
+                func.min(author_rows.c.affiliation).label("affiliation"),
                 func.count().label("paper_count"),
-                func.coalesce(func.sum(author_subq.c.citation_count), 0).label("total_citations"),
+                func.coalesce(func.sum(author_rows.c.citation_count), 0).label("total_citations"),
             )
-            .where(author_subq.c.author_name.isnot(None))
-            .group_by(author_subq.c.author_name)
-            .order_by(func.coalesce(func.sum(author_subq.c.citation_count), 0).desc())
-            .limit(limit)
+            .where(author_rows.c.author_name.isnot(None))
+            .group_by(author_rows.c.author_name)
+            .cte("authors")
+            .prefix_with("MATERIALIZED")
         )
-        top_citations = (await self.session.execute(top_cit_q)).all()
 
-        # Affiliation distribution
-        aff_q = (
-            select(
-                author_subq.c.affiliation,
-                func.count().label("cnt"),
+        def _top_authors(order_by: str):
+            top = (
+                select(authors)
+                .order_by(authors.c[order_by].desc())
+                .limit(limit)
+                .subquery()
+            )
+            entry = func.json_build_object(
+                "name", top.c.author_name,
+                "affiliation", top.c.affiliation,
+                "paper_count", top.c.paper_count,
+                "total_citations", top.c.total_citations,
             )
-            .where(author_subq.c.affiliation.isnot(None))
-            .where(author_subq.c.affiliation != "")
-            .group_by(author_subq.c.affiliation)
+            return select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(entry, top.c[order_by].desc())),
+                    text("'[]'::json"),
+                    type_=JSON,
+                )
+            ).scalar_subquery()
+
+        # Affiliation distribution
+        aff_counts = (
+            select(author_rows.c.affiliation, func.count().label("cnt"))
+            .where(author_rows.c.affiliation.isnot(None))
+            .where(author_rows.c.affiliation != "")
+            .group_by(author_rows.c.affiliation)
             .order_by(func.count().desc())
             .limit(20)
+            .subquery()
         )
-        aff_result = (await self.session.execute(aff_q)).all()
+        aff_json = select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_array(aff_counts.c.affiliation, aff_counts.c.cnt),
+                    aff_counts.c.cnt.desc(),
+                ),
+                type_=JSON,
+            )
+        ).scalar_subquery()
+
+        row = (
+            await self.session.execute(
+                select(
+                    _top_authors("paper_count").label("top_by_papers"),
+                    _top_authors("total_citations").label("top_by_citations"),
+                    aff_json.label("affiliations"),
+                )
+            )
+        ).one()
 
         return {
-            "top_by_papers": [
-                {
-                    "name": r.author_name,
-                    "affiliation": r.affiliation,
-                    "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                }
-                for r in top_papers
-            ],
-            "top_by_citations": [
-                {
-                    "name": r.author_name,
-                    "affiliation": r.affiliation,
-                    "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                }
-                for r in top_citations
-            ],
-            "affiliation_distribution": {r.affiliation: r.cnt for r in aff_result},
+            "top_by_papers": row.top_by_papers,
+            "top_by_citations": row.top_by_citations,
+            "affiliation_distribution": dict(row.affiliations or ()),
         }
 
+    @_cached_analytics
     async def get_keyword_analytics(
         self,
         limit: int = 50,
@@ -394,72 +1055,20 @@ class PaperRepository:
             "topics": [{"keyword": r.topic, "count": r.cnt} for r in tp_result],
         }
 
+    @_cached_analytics
     async def get_coauthor_network(
         self,
         min_collabs: int = 2,
         limit: int = 100,
         category: str | None = None,
     ) -> dict:
-        # Build category filter clause for raw SQL
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params = {"min_collabs": min_collabs, "limit": limit, "category": category}
-        else:
-            cat_clause = ""
-            params = {"min_collabs": min_collabs, "limit": limit}
-
-        # Build co-author pairs using raw SQL for JSONB cross join
-        query = text(f"""
-            WITH paper_authors AS (
-                SELECT p.id AS paper_id,
-                       a->>'name' AS author_name,
-                       a->>'affiliation' AS affiliation
-                FROM papers p,
-                     jsonb_array_elements(p.authors) AS a
-                WHERE p.authors IS NOT NULL
-                  AND jsonb_typeof(p.authors) = 'array'
-                  AND jsonb_array_length(p.authors) > 1
-                  {cat_clause}
-            ),
-            pairs AS (
-                SELECT a1.author_name AS source,
-                       a2.author_name AS target,
-                       a1.affiliation AS source_aff,
-                       a2.affiliation AS target_aff,
-                       COUNT(DISTINCT a1.paper_id) AS weight
-                FROM paper_authors a1
-                JOIN paper_authors a2
-                  ON a1.paper_id = a2.paper_id
-                 AND a1.author_name < a2.author_name
-                WHERE a1.author_name IS NOT NULL
-                  AND a2.author_name IS NOT NULL
-                GROUP BY a1.author_name, a2.author_name, a1.affiliation, a2.affiliation
-                HAVING COUNT(DISTINCT a1.paper_id) >= :min_collabs
-                ORDER BY weight DESC
-                LIMIT :limit
-            )
-            SELECT * FROM pairs
-        """)
-        result = (await self.session.execute(query, params)).all()
-
-        # Collect unique nodes
-        node_map: dict[str, dict] = {}
-        edges = []
-        for row in result:
-            src, tgt, src_aff, tgt_aff, w = row
-            if src not in node_map:
-                node_map[src] = {"id": src, "label": src, "paper_count": 0, "affiliation": src_aff}
-            if tgt not in node_map:
-                node_map[tgt] = {"id": tgt, "label": tgt, "paper_count": 0, "affiliation": tgt_aff}
-            node_map[src]["paper_count"] += w
-            node_map[tgt]["paper_count"] += w
-            edges.append({"source": src, "target": tgt, "weight": w})
+        params = {"min_collabs": min_collabs, "limit": limit, "category": category}
 
-        return {
-            "nodes": list(node_map.values()),
-            "edges": edges,
-        }
+        # Pairs, and per-node totals over them, come back as one JSON row
+        row = (await self.session.execute(_COAUTHOR_NETWORK_SQL, params)).one()
+        return {"nodes": row.nodes, "edges": row.edges}
 
+    @_cached_analytics
     async def get_keyword_trends(
         self, top_n: int = 10, category: str | None = None
     ) -> dict:
@@ -467,12 +1076,12 @@ class PaperRepository:
         where_clause = and_(*filters) if filters else text("TRUE")
 
         # Use keywords if available, fall back to topics
-        # Check which field has data
-        kw_count = (await self.session.execute(
-            select(func.count()).select_from(Paper).where(Paper.keywords.isnot(None))
-        )).scalar() or 0
+        # Check which field has data (first match is enough)
+        has_keywords = (await self.session.execute(
+            select(Paper.id).where(Paper.keywords.isnot(None)).limit(1)
+        )).scalar() is not None
 
-        if kw_count > 0:
+        if has_keywords:
             field = Paper.keywords
             field_label = "keyword"
         else:
@@ -519,24 +1128,23 @@ class PaperRepository:
         recent_years = [current_year, current_year - 1]
         previous_years = [current_year - 2, current_year - 3]
 
-        recent_q = (
-            select(kw_subq.c.keyword, func.count().label("cnt"))
-            .where(func.extract("year", kw_subq.c.published_date).in_(recent_years))
-            .group_by(kw_subq.c.keyword)
-            .having(func.count() >= 2)
-        )
-        recent_result = {r.keyword: r.cnt for r in (await self.session.execute(recent_q)).all()}
-
-        prev_q = (
-            select(kw_subq.c.keyword, func.count().label("cnt"))
-            .where(func.extract("year", kw_subq.c.published_date).in_(previous_years))
+        # Both windows counted in one pass with conditional aggregation
+        kw_year = func.extract("year", kw_subq.c.published_date)
+        recent_cnt_expr = func.count().filter(kw_year.in_(recent_years))
+        window_q = (
+            select(
+                kw_subq.c.keyword,
+                recent_cnt_expr.label("recent"),
+                func.count().filter(kw_year.in_(previous_years)).label("previous"),
+            )
+            .where(kw_year.in_(recent_years + previous_years))
             .group_by(kw_subq.c.keyword)
+            .having(recent_cnt_expr >= 2)
         )
-        prev_result = {r.keyword: r.cnt for r in (await self.session.execute(prev_q)).all()}
+        window_result = (await self.session.execute(window_q)).all()
 
         emerging = []
-        for kw, recent_cnt in recent_result.items():
-            prev_cnt = prev_result.get(kw, 0)
+        for kw, recent_cnt, prev_cnt in window_result:
             if prev_cnt == 0:
                 growth = float(recent_cnt) * 100.0
             else:
@@ -562,93 +1170,32 @@ class PaperRepository:
         )
         return result.scalar_one_or_none()
 
+    @_cached_analytics
     async def get_topic_cooccurrence(
         self, limit: int = 80, min_cooccurrence: int = 5, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "min_co": min_cooccurrence, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit, "min_co": min_cooccurrence}
-
-        query = text(f"""
-            WITH topic_pairs AS (
-                SELECT t1.topic AS topic_a, t2.topic AS topic_b,
-                       COUNT(*) AS weight
-                FROM (SELECT p.id, unnest(p.topics) AS topic FROM papers p
-                      WHERE p.topics IS NOT NULL {cat_clause}) t1
-                JOIN (SELECT p.id, unnest(p.topics) AS topic FROM papers p
-                      WHERE p.topics IS NOT NULL {cat_clause}) t2
-                  ON t1.id = t2.id AND t1.topic < t2.topic
-                GROUP BY t1.topic, t2.topic
-                HAVING COUNT(*) >= :min_co
-                ORDER BY weight DESC
-                LIMIT :limit
-            )
-            SELECT * FROM topic_pairs
-        """)
-        result = (await self.session.execute(query, params)).all()
-
-        node_map: dict[str, dict] = {}
-        edges = []
-        for row in result:
-            ta, tb, w = row
-            if ta not in node_map:
-                node_map[ta] = {"id": ta, "label": ta, "paper_count": 0}
-            if tb not in node_map:
-                node_map[tb] = {"id": tb, "label": tb, "paper_count": 0}
-            node_map[ta]["paper_count"] += w
-            node_map[tb]["paper_count"] += w
-            edges.append({"source": ta, "target": tb, "weight": w})
-
-        return {"nodes": list(node_map.values()), "edges": edges}
+        params = {"limit": limit, "min_co": min_cooccurrence, "category": category}
+
+        row = (await self.session.execute(_TOPIC_COOCCURRENCE_SQL, params)).one()
+        return {"nodes": row.nodes, "edges": row.edges}
 
+    @_cached_analytics
     async def get_citation_timeline(
         self, limit: int = 8, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit}
+        params = {"limit": limit, "category": category}
 
         # First get top authors by total citations
-        top_q = text(f"""
-            SELECT a->>'name' AS author_name,
-                   SUM(p.citation_count) AS total_cit
-            FROM papers p, jsonb_array_elements(p.authors) AS a
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND p.citation_count > 0
-              {cat_clause}
-            GROUP BY a->>'name'
-            ORDER BY total_cit DESC
-            LIMIT :limit
-        """)
-        top_authors = [r.author_name for r in (await self.session.execute(top_q, params)).all()]
+        top_result = await self.session.execute(_CITATION_TOP_AUTHORS_SQL, params)
+        top_authors = [r.author_name for r in top_result.all()]
 
         if not top_authors:
             return {"data": [], "authors": []}
 
         # Get per-year citation sums for these authors
-        placeholders = ", ".join(f":a{i}" for i in range(len(top_authors)))
-        author_params = {f"a{i}": name for i, name in enumerate(top_authors)}
-
-        timeline_q = text(f"""
-            SELECT EXTRACT(YEAR FROM p.published_date)::int AS year,
-                   a->>'name' AS author_name,
-                   SUM(p.citation_count) AS citations
-            FROM papers p, jsonb_array_elements(p.authors) AS a
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND p.published_date IS NOT NULL
-              AND a->>'name' IN ({placeholders})
-            GROUP BY year, author_name
-            ORDER BY year
-        """)
-        result = (await self.session.execute(timeline_q, author_params)).all()
+        result = (
+            await self.session.execute(_CITATION_TIMELINE_SQL, {"authors": top_authors})
+        ).all()
 
         data = [
             {"year": str(r.year), "author": r.author_name, "citations": int(r.citations)}
@@ -656,6 +1203,7 @@ class PaperRepository:
         ]
         return {"data": data, "authors": top_authors}
 
+    @_cached_analytics
     async def get_category_heatmap(self, category: str | None = None) -> dict:
         filters = self._build_filters(category=category)
         where_clause = and_(*filters) if filters else text("TRUE")
@@ -699,80 +1247,36 @@ class PaperRepository:
 
         return {"cells": cells, "categories": top_cats, "years": years}
 
+    @_cached_analytics
     async def get_topic_correlation(
         self, limit: int = 15, min_cooccurrence: int = 10, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "min_co": min_cooccurrence, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit, "min_co": min_cooccurrence}
+        params = {"limit": limit, "min_co": min_cooccurrence, "category": category}
 
         # Get top topics first
-        top_q = text(f"""
-            SELECT topic, COUNT(*) AS cnt
-            FROM (SELECT unnest(topics) AS topic FROM papers
-                  WHERE topics IS NOT NULL {cat_clause}) sub
-            GROUP BY topic ORDER BY cnt DESC LIMIT :limit
-        """)
-        top_topics = [r.topic for r in (await self.session.execute(top_q, params)).all()]
+        top_result = await self.session.execute(_TOP_TOPICS_SQL, params)
+        top_topics = [r.topic for r in top_result.all()]
 
         if not top_topics:
             return {"cells": [], "topics": []}
 
         # Get co-occurrence counts for these topics
-        placeholders = ", ".join(f":t{i}" for i in range(len(top_topics)))
-        topic_params = {f"t{i}": t for i, t in enumerate(top_topics)}
-        topic_params["min_co"] = min_cooccurrence
-
-        corr_q = text(f"""
-            SELECT t1.topic AS topic_a, t2.topic AS topic_b, COUNT(*) AS cnt
-            FROM (SELECT p.id, unnest(p.topics) AS topic FROM papers p WHERE p.topics IS NOT NULL) t1
-            JOIN (SELECT p.id, unnest(p.topics) AS topic FROM papers p WHERE p.topics IS NOT NULL) t2
-              ON t1.id = t2.id AND t1.topic < t2.topic
-            WHERE t1.topic IN ({placeholders}) AND t2.topic IN ({placeholders})
-            GROUP BY t1.topic, t2.topic
-            HAVING COUNT(*) >= :min_co
-        """)
-        result = (await self.session.execute(corr_q, topic_params)).all()
+        result = (
+            await self.session.execute(
+                _TOPIC_CORRELATION_SQL,
+                {"topics": top_topics, "min_co": min_cooccurrence},
+            )
+        ).all()
 
         cells = [{"topic_a": r.topic_a, "topic_b": r.topic_b, "count": r.cnt} for r in result]
         return {"cells": cells, "topics": top_topics}
 
+    @_cached_analytics
     async def get_institution_ranking(
         self, limit: int = 30, category: str | None = None
     ) -> dict:
-        if category:
-            cat_clause = "AND :category = ANY(p.categories)"
-            params: dict = {"limit": limit, "category": category}
-        else:
-            cat_clause = ""
-            params = {"limit": limit}
-
-        query = text(f"""
-            SELECT aff,
-                   COUNT(DISTINCT paper_id) AS paper_count,
-                   COALESCE(SUM(citation_count), 0) AS total_citations,
-                   ROUND(AVG(citation_count)::numeric, 1) AS avg_citations,
-                   COUNT(DISTINCT author_name) AS author_count
-            FROM (
-                SELECT p.id AS paper_id,
-                       a->>'name' AS author_name,
-                       a->>'affiliation' AS aff,
-                       p.citation_count
-                FROM papers p, jsonb_array_elements(p.authors) AS a
-                WHERE p.authors IS NOT NULL
-                  AND jsonb_typeof(p.authors) = 'array'
-                  AND a->>'affiliation' IS NOT NULL
-                  AND a->>'affiliation' != ''
-                  {cat_clause}
-            ) sub
-            GROUP BY aff
-            ORDER BY paper_count DESC
-            LIMIT :limit
-        """)
-        result = (await self.session.execute(query, params)).all()
+        params = {"limit": limit, "category": category}
+        result = (await self.session.execute(_INSTITUTION_RANKING_SQL, params)).all()
 
         return {
             "institutions": [
@@ -787,105 +1291,48 @@ class PaperRepository:
             ]
         }
 
+    @_cached_analytics(ttl=ANALYTICS_SLOW_CACHE_TTL)
     async def get_author_comparison(self, author_names: list[str]) -> dict:
         if not author_names:
             return {"authors": []}
 
-        placeholders = ", ".join(f":a{i}" for i in range(len(author_names)))
-        params = {f"a{i}": name for i, name in enumerate(author_names)}
-
-        query = text(f"""
-            SELECT a->>'name' AS author_name,
-                   a->>'affiliation' AS affiliation,
-                   COUNT(DISTINCT p.id) AS paper_count,
-                   COALESCE(SUM(p.citation_count), 0) AS total_citations,
-                   ROUND(AVG(p.citation_count)::numeric, 1) AS avg_citations,
-                   MIN(EXTRACT(YEAR FROM p.published_date))::int AS first_year,
-                   MAX(EXTRACT(YEAR FROM p.published_date))::int AS last_year
-            FROM papers p, jsonb_array_elements(p.authors) AS a
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND a->>'name' IN ({placeholders})
-            GROUP BY a->>'name', a->>'affiliation'
-        """)
-        rows = (await self.session.execute(query, params)).all()
-
-        # Also get topics per author
-        topics_q = text(f"""
-            SELECT a->>'name' AS author_name, t.topic, COUNT(*) AS cnt
-            FROM papers p,
-                 jsonb_array_elements(p.authors) AS a,
-                 unnest(p.topics) AS t(topic)
-            WHERE p.authors IS NOT NULL
-              AND jsonb_typeof(p.authors) = 'array'
-              AND p.topics IS NOT NULL
-              AND a->>'name' IN ({placeholders})
-            GROUP BY a->>'name', t.topic
-            ORDER BY a->>'name', cnt DESC
-        """)
-        topics_result = (await self.session.execute(topics_q, params)).all()
-
-        # Group topics by author (top 5 each)
-        author_topics: dict[str, list[str]] = {}
-        for r in topics_result:
-            if r.author_name not in author_topics:
-                author_topics[r.author_name] = []
-            if len(author_topics[r.author_name]) < 5:
-                author_topics[r.author_name].append(r.topic)
-
-        # Merge rows (author may have multiple affiliations)
-        merged: dict[str, dict] = {}
-        for r in rows:
-            name = r.author_name
-            if name not in merged:
-                merged[name] = {
-                    "name": name,
-                    "affiliation": r.affiliation,
-                    "paper_count": r.paper_count,
-                    "total_citations": int(r.total_citations),
-                    "avg_citations": float(r.avg_citations),
-                    "first_year": r.first_year,
-                    "last_year": r.last_year,
-                    "topics": author_topics.get(name, []),
-                }
-            else:
-                merged[name]["paper_count"] += r.paper_count
-                merged[name]["total_citations"] += int(r.total_citations)
-
-        return {"authors": list(merged.values())}
-
+        rows = (
+            await self.session.execute(_AUTHOR_COMPARISON_SQL, {"names": author_names})
+        ).all()
+        by_name = {r.author_name: r for r in rows}
+
+        authors = []
+        for name in dict.fromkeys(author_names):
+            r = by_name.get(name)
+            if r is None:
+                continue
+            authors.append({
+                "name": name,
+                "affiliation": r.affiliation,
+                "paper_count": r.paper_count,
+                "total_citations": int(r.total_citations),
+                "avg_citations": float(r.avg_citations),
+                "first_year": r.first_year,
+                "last_year": r.last_year,
+                "topics": list(r.topics or []),
+            })
+
+        return {"authors": authors}
+
+    @_cached_analytics(ttl=ANALYTICS_SLOW_CACHE_TTL)
     async def get_research_landscape(
         self, limit: int = 50, category: str | None = None
     ) -> dict:
-        filters = self._build_filters(category=category)
-        where_clause = and_(*filters) if filters else text("TRUE")
-
-        tp_unnest = func.unnest(Paper.topics).label("topic")
-        subq = (
-            select(
-                tp_unnest,
-                func.extract("year", Paper.published_date).label("year"),
-                Paper.citation_count,
+        result = (
+            await self.session.execute(
+                _RESEARCH_LANDSCAPE_SQL,
+                {
+                    # Comma-separated categories overlap, as in _build_filters
+                    "categories": list(_parse_csv(category or "")) or None,
+                    "limit": limit,
+                },
             )
-            .where(where_clause)
-            .where(Paper.topics.isnot(None))
-            .where(Paper.published_date.isnot(None))
-            .subquery()
-        )
-
-        landscape_q = (
-            select(
-                subq.c.topic,
-                func.avg(subq.c.year).label("avg_year"),
-                func.avg(subq.c.citation_count).label("avg_citations"),
-                func.count().label("paper_count"),
-            )
-            .group_by(subq.c.topic)
-            .having(func.count() >= 5)
-            .order_by(func.count().desc())
-            .limit(limit)
-        )
-        result = (await self.session.execute(landscape_q)).all()
+        ).all()
 
         return {
             "points": [
@@ -902,23 +1349,24 @@ class PaperRepository:
     async def get_similar_papers(
         self, paper_id: uuid.UUID, limit: int = 10
     ) -> list[Paper]:
-        paper = await self.get_by_id(paper_id)
-        if not paper:
-            return []
-
-        filters = []
-        filters.append(Paper.id != paper_id)
-
-        if paper.topics:
-            filters.append(Paper.topics.overlap(paper.topics))
-        elif paper.categories:
-            filters.append(Paper.categories.overlap(paper.categories))
-        else:
-            return []
+        # The seed paper's arrays are read by scalar subqueries in the same
+        # statement, so the GIN overlap probe needs no prior round-trip. Topics
+        # are matched when the seed has any, categories otherwise.
+        seed_topics = select(Paper.topics).where(Paper.id == paper_id).scalar_subquery()
+        seed_categories = (
+            select(Paper.categories).where(Paper.id == paper_id).scalar_subquery()
+        )
+        has_topics = func.coalesce(func.cardinality(seed_topics), 0) > 0
 
         query = (
             select(Paper)
-            .where(and_(*filters))
+            .where(
+                Paper.id != paper_id,
+                or_(
+                    and_(has_topics, Paper.topics.overlap(seed_topics)),
+                    and_(~has_topics, Paper.categories.overlap(seed_categories)),
+                ),
+            )
             .order_by(Paper.citation_count.desc())
             .limit(limit)
         )
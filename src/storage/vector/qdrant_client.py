@@ -30,15 +30,25 @@ COLLECTIONS_CONFIG = {
         "size": 768,
         "distance": Distance.COSINE,
     },
+    "llm_response_cache": {
+        "size": 768,
+        "distance": Distance.COSINE,
+    },
 }
 
 
+# Points per upsert request; keeps each gRPC message well under the size limit
+UPSERT_BATCH_SIZE = 256
+
+
 class VectorStore:
     def __init__(self):
         settings = get_settings()
         self.client = QdrantClient(
             url=settings.QDRANT_URL,
             api_key=settings.QDRANT_API_KEY,
+            prefer_grpc=settings.QDRANT_PREFER_GRPC,
+            grpc_port=settings.QDRANT_GRPC_PORT,
         )
 
     def init_collections(self) -> None:
@@ -79,18 +89,22 @@ class VectorStore:
         collection: str,
         points: list[dict],
     ) -> None:
-        """Upsert multiple points at once. Each dict: {id, vector, payload}."""
-        self.client.upsert(
-            collection_name=collection,
-            points=[
-                PointStruct(
-                    id=p["id"],
-                    vector=p["vector"],
-                    payload=p["payload"],
-                )
-                for p in points
-            ],
-        )
+        """Upsert multiple points at once. Each dict: {id, vector, payload}.
+
+        Large inputs are sent in requests of UPSERT_BATCH_SIZE points.
+        """
+        for start in range(0, len(points), UPSERT_BATCH_SIZE):
+            self.client.upsert(
+                collection_name=collection,
+                points=[
+                    PointStruct(
+                        id=p["id"],
+                        vector=p["vector"],
+                        payload=p["payload"],
+                    )
+                    for p in points[start:start + UPSERT_BATCH_SIZE]
+                ],
+            )
 
     def search(
         self,
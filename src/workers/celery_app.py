@@ -1,12 +1,57 @@
+import asyncio
 import os
+from functools import lru_cache
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 from src.core.config import get_settings
 
 settings = get_settings()
 
+# One event loop per worker process. Async resources bound to it (the engine's
+# asyncpg pool, HTTP clients) then survive from one task to the next instead of
+# being rebuilt on a fresh loop for every call.
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+
+@worker_process_init.connect
+def _init_worker_loop(**_) -> None:
+    global _worker_loop
+    _worker_loop = _new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def run_in_worker_loop(coro):
+    """Run a coroutine to completion on this process's persistent event loop."""
+    global _worker_loop
+    # Solo/threads pools and eager tasks never fire worker_process_init
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = _new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
+
+
+@lru_cache
+def get_worker_session_factory():
+    """Session factory shared by the tasks of one worker process.
+
+    Its pool is bound to the persistent loop, so only use it from coroutines
+    run through run_in_worker_loop.
+    """
+    from src.storage.database import create_async_session_factory
+
+    return create_async_session_factory()
+
+
 celery_app = Celery(
     "osint_research",
     broker=settings.REDIS_URL,
@@ -19,6 +64,10 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # No caller reads task results or states, so don't write them to Redis;
+    # a task that needs one can opt back in with ignore_result=False
+    task_ignore_result=True,
+    result_expires=3600,
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
@@ -27,8 +76,19 @@ celery_app.conf.update(
         "default": {"exchange": "default", "routing_key": "default"},
         "collection": {"exchange": "collection", "routing_key": "collection"},
         "processing": {"exchange": "processing", "routing_key": "processing"},
+        # Embedding tasks hold the model on the accelerator: run them on a
+        # single-process worker so CPU-bound processing doesn't queue behind them
+        "processing-gpu": {"exchange": "processing-gpu", "routing_key": "processing-gpu"},
+        "processing-cpu": {"exchange": "processing-cpu", "routing_key": "processing-cpu"},
         "reporting": {"exchange": "reporting", "routing_key": "reporting"},
     },
+    task_routes={
+        "src.workers.tasks.processing.process_unprocessed_papers": {"queue": "processing-gpu"},
+        "src.workers.tasks.processing.process_unprocessed_repos": {"queue": "processing-gpu"},
+        "src.workers.tasks.processing.*": {"queue": "processing-cpu"},
+    },
+    task_compression="zstd",
+    result_compression="zstd",
 )
 
 _beat_schedule = {
@@ -57,19 +117,25 @@ _beat_schedule = {
     "process-papers": {
         "task": "src.workers.tasks.processing.process_unprocessed_papers",
         "schedule": crontab(minute=30, hour=1),
-        "options": {"queue": "processing"},
+        "options": {"queue": "processing-gpu"},
     },
     # Process unprocessed repos (every 12 hours)
     "process-repos": {
         "task": "src.workers.tasks.processing.process_unprocessed_repos",
         "schedule": crontab(minute=0, hour="1,13"),
-        "options": {"queue": "processing"},
+        "options": {"queue": "processing-gpu"},
     },
     # Calculate trending scores daily
     "calculate-trending": {
         "task": "src.workers.tasks.processing.calculate_trending_scores",
         "schedule": crontab(minute=0, hour=3),
-        "options": {"queue": "processing"},
+        "options": {"queue": "processing-cpu"},
+    },
+    # Rebuild author analytics view after the night's collection/enrichment
+    "refresh-paper-views": {
+        "task": "src.workers.tasks.processing.refresh_paper_views",
+        "schedule": crontab(minute=30, hour=3),
+        "options": {"queue": "processing-cpu"},
     },
 
     # ── HuggingFace ──
@@ -185,16 +251,17 @@ _beat_schedule = {
     },
 
     # ── Reports ──
-    # Generate weekly report on Mondays
-    "weekly-report": {
-        "task": "src.workers.tasks.reporting.generate_weekly_report",
-        "schedule": crontab(minute=0, hour=8, day_of_week=1),
+    # Rebuild tag counts read by the weekly report and tech radar. Daily, so a
+    # radar requested from the API between Mondays is at most a day stale
+    "refresh-reporting-views": {
+        "task": "src.workers.tasks.reporting.refresh_reporting_views",
+        "schedule": crontab(minute=30, hour=7),
         "options": {"queue": "reporting"},
     },
-    # Generate tech radar on Mondays (after weekly report)
-    "generate-tech-radar": {
-        "task": "src.workers.tasks.reporting.generate_tech_radar",
-        "schedule": crontab(minute=30, hour=8, day_of_week=1),
+    # Generate weekly report and tech radar together on Mondays
+    "weekly-report-bundle": {
+        "task": "src.workers.tasks.reporting.generate_weekly_bundle",
+        "schedule": crontab(minute=0, hour=8, day_of_week=1),
         "options": {"queue": "reporting"},
     },
 }
@@ -41,28 +41,27 @@ async def _collect_arxiv(categories: list[str] | None, max_results: int):
     async with ArxivCollector() as collector:
         async with async_session_factory() as session:
             repo = PaperRepository(session)
+            batch: list[dict] = []
             async for result in collector.collect(
                 categories=cats,
                 date_from=date_from,
                 max_results=max_results,
             ):
                 paper = result.data
-                await repo.upsert_by_arxiv_id(
-                    {
-                        "arxiv_id": paper.arxiv_id,
-                        "title": paper.title,
-                        "abstract": paper.abstract,
-                        "authors": paper.authors,
-                        "categories": paper.categories,
-                        "published_date": paper.published_date,
-                        "updated_date": paper.updated_date,
-                        "pdf_url": paper.pdf_url,
-                        "source": "arxiv",
-                        "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
-                    }
-                )
-                collected += 1
-
+                batch.append({
+                    "arxiv_id": paper.arxiv_id,
+                    "title": paper.title,
+                    "abstract": paper.abstract,
+                    "authors": paper.authors,
+                    "categories": paper.categories,
+                    "published_date": paper.published_date,
+                    "updated_date": paper.updated_date,
+                    "pdf_url": paper.pdf_url,
+                    "source": "arxiv",
+                    "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
+                })
+
+            collected = await repo.upsert_many_by_arxiv_id(batch)
             await session.commit()
 
     logger.info("ArXiv collection completed", collected=collected)
@@ -347,6 +346,8 @@ async def _update_existing_repos():
             async with async_session_factory() as session:
                 repo_store = GitHubRepository(session)
                 metrics_repo = MetricsRepository(session)
+                # Today's metrics per repo, written together after the batch
+                snapshots: dict = {}
 
                 for full_name in batch:
                     try:
@@ -379,18 +380,13 @@ async def _update_existing_repos():
                             }
                         )
 
-                        # Record daily metrics snapshot for trend analysis
-                        await metrics_repo.upsert_daily_snapshot(
-                            entity_type="repo",
-                            entity_id=existing.id,
-                            metrics={
-                                "stars_count": gh_repo.stars_count,
-                                "forks_count": gh_repo.forks_count,
-                                "watchers_count": gh_repo.watchers_count,
-                                "open_issues_count": gh_repo.open_issues_count,
-                            },
-                        )
-                        snapshots_recorded += 1
+                        # Daily metrics snapshot for trend analysis
+                        snapshots[existing.id] = {
+                            "stars_count": gh_repo.stars_count,
+                            "forks_count": gh_repo.forks_count,
+                            "watchers_count": gh_repo.watchers_count,
+                            "open_issues_count": gh_repo.open_issues_count,
+                        }
 
                         if stars_changed or forks_changed:
                             existing.is_processed = False
@@ -399,6 +395,11 @@ async def _update_existing_repos():
                     except Exception:
                         logger.exception("Error updating repo", repo=full_name)
 
+                # One velocity query and one upsert for the whole batch
+                snapshots_recorded += await metrics_repo.upsert_daily_snapshots_bulk(
+                    "repo", snapshots
+                )
+
                 await session.commit()
 
             logger.info(
@@ -717,7 +718,7 @@ async def _collect_papers_arxiv():
         for idx, q in enumerate(arxiv_queries, 1):
             batch_collected = 0
             batch_skipped = 0
-            pending = 0
+            pending: list[dict] = []
             try:
                 async with async_session_factory() as session:
                     repo = PaperRepository(session)
@@ -727,26 +728,24 @@ async def _collect_papers_arxiv():
                             batch_skipped += 1
                             continue
                         seen_arxiv_ids.add(paper.arxiv_id)
-                        await repo.upsert_by_arxiv_id(
-                            {
-                                "arxiv_id": paper.arxiv_id,
-                                "title": paper.title,
-                                "abstract": paper.abstract,
-                                "authors": paper.authors,
-                                "categories": paper.categories,
-                                "published_date": paper.published_date,
-                                "updated_date": paper.updated_date,
-                                "pdf_url": paper.pdf_url,
-                                "source": "arxiv",
-                                "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
-                            }
-                        )
-                        batch_collected += 1
-                        pending += 1
-                        if pending >= commit_every:
+                        pending.append({
+                            "arxiv_id": paper.arxiv_id,
+                            "title": paper.title,
+                            "abstract": paper.abstract,
+                            "authors": paper.authors,
+                            "categories": paper.categories,
+                            "published_date": paper.published_date,
+                            "updated_date": paper.updated_date,
+                            "pdf_url": paper.pdf_url,
+                            "source": "arxiv",
+                            "source_url": f"https://arxiv.org/abs/{paper.arxiv_id}",
+                        })
+                        if len(pending) >= commit_every:
+                            batch_collected += await repo.upsert_many_by_arxiv_id(pending)
                             await session.commit()
-                            pending = 0
-                    if pending > 0:
+                            pending = []
+                    if pending:
+                        batch_collected += await repo.upsert_many_by_arxiv_id(pending)
                         await session.commit()
             except Exception:
                 logger.exception("Error in ArXiv query", query_idx=idx, query=q)
@@ -795,7 +794,7 @@ async def _collect_papers_s2():
     ) as collector:
         for idx, q in enumerate(s2_queries, 1):
             batch_collected = 0
-            pending = 0
+            pending: list[dict] = []
             try:
                 async with async_session_factory() as session:
                     repo = PaperRepository(session)
@@ -820,13 +819,13 @@ async def _collect_papers_s2():
                         if paper.fields_of_study:
                             paper_data["categories"] = paper.fields_of_study
 
-                        await repo.upsert_by_s2_id(paper_data)
-                        batch_collected += 1
-                        pending += 1
-                        if pending >= commit_every:
+                        pending.append(paper_data)
+                        if len(pending) >= commit_every:
+                            batch_collected += await repo.upsert_many(pending)
                             await session.commit()
-                            pending = 0
-                    if pending > 0:
+                            pending = []
+                    if pending:
+                        batch_collected += await repo.upsert_many(pending)
                         await session.commit()
             except Exception:
                 logger.exception("Error in S2 query", query_idx=idx, query=q)
@@ -1558,6 +1557,32 @@ async def _link_openreview_papers():
 # bioRxiv / medRxiv collection (P2)
 # ════════════════════════════════════════════════
 
+async def _upsert_papers_chunked(session, repo, papers: list[dict], source: str,
+                                 chunk_size: int = 50) -> int:
+    """upsert_many in committed chunks; a failing chunk is retried row by row
+    so one bad paper (e.g. a duplicate doi) doesn't discard the rest."""
+    collected = 0
+    for start in range(0, len(papers), chunk_size):
+        chunk = papers[start:start + chunk_size]
+        try:
+            collected += await repo.upsert_many(chunk)
+            await session.commit()
+            continue
+        except Exception:
+            await session.rollback()
+        for paper_data in chunk:
+            try:
+                collected += await repo.upsert_many([paper_data])
+                await session.commit()
+            except Exception as e:
+                await session.rollback()
+                logger.warning(
+                    f"{source} upsert failed", error=str(e),
+                    doi=paper_data.get("doi"), url=paper_data.get("source_url"),
+                )
+    return collected
+
+
 @celery_app.task(name="src.workers.tasks.collection.collect_biorxiv")
 def collect_biorxiv(server: str = "biorxiv", max_results: int = 200, days: int = 7):
     """Collect recent papers from bioRxiv or medRxiv."""
@@ -1576,28 +1601,23 @@ async def _collect_biorxiv(server: str, max_results: int, days: int):
     async with BiorxivCollector(server=server) as collector:
         async with factory() as session:
             repo = PaperRepository(session)
+            batch: list[dict] = []
             async for result in collector.collect(
                 date_from=date_from, max_results=max_results
             ):
                 p = result.data
-                try:
-                    await repo.upsert_by_s2_id(
-                        {
-                            "doi": p.doi,
-                            "title": p.title,
-                            "abstract": p.abstract,
-                            "authors": p.authors,
-                            "categories": p.categories,
-                            "published_date": p.published_date,
-                            "source": server,
-                            "source_url": f"https://www.{server}.org/content/{p.doi}",
-                            "pdf_url": p.pdf_url,
-                        }
-                    )
-                    collected += 1
-                except Exception as e:
-                    logger.warning(f"{server} upsert failed", error=str(e), doi=p.doi)
-            await session.commit()
+                batch.append({
+                    "doi": p.doi,
+                    "title": p.title,
+                    "abstract": p.abstract,
+                    "authors": p.authors,
+                    "categories": p.categories,
+                    "published_date": p.published_date,
+                    "source": server,
+                    "source_url": f"https://www.{server}.org/content/{p.doi}",
+                    "pdf_url": p.pdf_url,
+                })
+            collected = await _upsert_papers_chunked(session, repo, batch, server)
 
     logger.info(f"{server} collection done", collected=collected)
 
@@ -1623,25 +1643,20 @@ async def _collect_acl(year: int | None, max_results: int):
     async with ACLAnthologyCollector() as collector:
         async with factory() as session:
             repo = PaperRepository(session)
+            batch: list[dict] = []
             async for result in collector.collect(year=year, max_results=max_results):
                 p = result.data
-                try:
-                    await repo.upsert_by_s2_id(
-                        {
-                            "title": p.title,
-                            "abstract": p.abstract,
-                            "authors": p.authors,
-                            "categories": [f"acl.{p.venue.lower()}"],
-                            "published_date": date(p.year, 1, 1),
-                            "source": "acl_anthology",
-                            "source_url": f"https://aclanthology.org/{p.anthology_id}/",
-                            "pdf_url": p.pdf_url,
-                        }
-                    )
-                    collected += 1
-                except Exception as e:
-                    logger.warning("ACL upsert failed", error=str(e), aid=p.anthology_id)
-            await session.commit()
+                batch.append({
+                    "title": p.title,
+                    "abstract": p.abstract,
+                    "authors": p.authors,
+                    "categories": [f"acl.{p.venue.lower()}"],
+                    "published_date": date(p.year, 1, 1),
+                    "source": "acl_anthology",
+                    "source_url": f"https://aclanthology.org/{p.anthology_id}/",
+                    "pdf_url": p.pdf_url,
+                })
+            collected = await _upsert_papers_chunked(session, repo, batch, "ACL")
 
     logger.info("ACL Anthology collection done", collected=collected)
 
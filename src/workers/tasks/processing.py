@@ -1,88 +1,186 @@
 """Processing tasks for classifying, summarizing, and embedding."""
 
 import asyncio
-from datetime import date
+from datetime import date, datetime
+from functools import lru_cache
 
 from src.core.logging import get_logger
-from src.workers.celery_app import celery_app
+from src.workers.celery_app import (
+    celery_app,
+    get_worker_session_factory,
+    run_in_worker_loop,
+)
 
 logger = get_logger(__name__)
 
 
 def _run_async(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return run_in_worker_loop(coro)
 
 
-@celery_app.task(name="src.workers.tasks.processing.process_unprocessed_papers")
-def process_unprocessed_papers(batch_size: int = 50):
-    """Process unprocessed papers: embed + upsert to Qdrant."""
-    _run_async(_process_papers(batch_size))
+@lru_cache
+def _embedding_generator():
+    from src.processors.embedding import EmbeddingGenerator
 
+    return EmbeddingGenerator()
 
-async def _process_papers(batch_size: int):
-    from src.processors.embedding import EmbeddingGenerator
-    from src.storage.database import create_async_session_factory
-    from src.storage.repositories.paper_repo import PaperRepository
+
+@lru_cache
+def _vector_store():
     from src.storage.vector.qdrant_client import VectorStore
 
-    async_session_factory = create_async_session_factory()
-    embedding_gen = EmbeddingGenerator()
-    vector_store = VectorStore()
+    return VectorStore()
 
-    async with async_session_factory() as session:
-        repo = PaperRepository(session)
-        papers = await repo.get_unprocessed(limit=batch_size)
 
-        if not papers:
-            logger.info("No unprocessed papers found")
-            return
+# Embedding runs in chunks so each chunk's Qdrant upsert overlaps the next
+# chunk's encoding; at most _QDRANT_CONCURRENCY upserts are in flight
+_EMBED_CHUNK_SIZE = 16
+_QDRANT_CONCURRENCY = 4
 
-        logger.info("Processing papers", count=len(papers))
 
-        # Batch embed all papers at once
-        texts = [
-            f"{paper.title}\n\n{paper.abstract or ''}"
-            for paper in papers
-        ]
-        embeddings = embedding_gen.embed_batch(texts)
+async def _embed_and_upsert(
+    embedding_gen, vector_store, collection: str, rows: list, texts: list[str], build_point
+) -> list:
+    """Embed ``texts`` chunk by chunk and upsert ``build_point(row, embedding)``
+    for each row. Returns the ids of the rows whose points were stored."""
+    sem = asyncio.Semaphore(_QDRANT_CONCURRENCY)
 
-        points = []
-        for paper, embedding in zip(papers, embeddings):
-            try:
-                points.append({
-                    "id": str(paper.id),
-                    "vector": embedding,
-                    "payload": {
-                        "arxiv_id": paper.arxiv_id,
-                        "title": paper.title,
-                        "abstract": (paper.abstract or "")[:500],
-                        "categories": paper.categories or [],
-                        "topics": paper.topics or [],
-                        "keywords": paper.keywords or [],
-                        "published_date": str(paper.published_date) if paper.published_date else None,
-                        "citation_count": paper.citation_count,
-                        "source_type": "paper",
-                        "url": paper.source_url,
-                    },
-                })
-                paper.is_processed = True
-            except Exception as e:
-                logger.error(
-                    "Failed to process paper",
-                    arxiv_id=paper.arxiv_id,
-                    error=str(e),
-                )
+    async def upsert(points: list[dict]) -> None:
+        async with sem:
+            await asyncio.to_thread(vector_store.upsert_batch, collection, points)
 
+    tasks = []
+    task_ids = []
+    for start in range(0, len(rows), _EMBED_CHUNK_SIZE):
+        chunk = rows[start:start + _EMBED_CHUNK_SIZE]
+        embeddings = await asyncio.to_thread(
+            embedding_gen.embed_batch, texts[start:start + _EMBED_CHUNK_SIZE]
+        )
+        points = []
+        ids = []
+        for row, embedding in zip(chunk, embeddings):
+            point = build_point(row, embedding)
+            if point is not None:
+                points.append(point)
+                ids.append(row.id)
         if points:
-            vector_store.upsert_batch(collection="papers", points=points)
+            tasks.append(asyncio.create_task(upsert(points)))
+            task_ids.append(ids)
+
+    stored = []
+    for ids, result in zip(task_ids, await asyncio.gather(*tasks, return_exceptions=True)):
+        if isinstance(result, Exception):
+            logger.error(
+                "Failed to upsert vectors",
+                collection=collection,
+                count=len(ids),
+                error=str(result),
+            )
+        else:
+            stored.extend(ids)
+    return stored
+
+
+def _paper_point(paper, embedding) -> dict | None:
+    try:
+        return {
+            "id": str(paper.id),
+            "vector": embedding,
+            "payload": {
+                "arxiv_id": paper.arxiv_id,
+                "title": paper.title,
+                "abstract": (paper.abstract or "")[:500],
+                "categories": paper.categories or [],
+                "topics": paper.topics or [],
+                "keywords": paper.keywords or [],
+                "published_date": str(paper.published_date) if paper.published_date else None,
+                "citation_count": paper.citation_count,
+                "source_type": "paper",
+                "url": paper.source_url,
+            },
+        }
+    except Exception as e:
+        logger.error(
+            "Failed to process paper",
+            arxiv_id=paper.arxiv_id,
+            error=str(e),
+        )
+        return None
+
+
+def _repo_point(repository, embedding) -> dict | None:
+    try:
+        return {
+            "id": str(repository.id),
+            "vector": embedding,
+            "payload": {
+                "full_name": repository.full_name,
+                "title": repository.name,
+                "description": repository.description or "",
+                "content": repository.description or "",
+                "primary_language": repository.primary_language,
+                "topics": repository.topics or [],
+                "frameworks": repository.frameworks or [],
+                "stars_count": repository.stars_count,
+                "source_type": "repository",
+                "url": repository.html_url,
+            },
+        }
+    except Exception as e:
+        logger.error(
+            "Failed to process repo",
+            full_name=repository.full_name,
+            error=str(e),
+        )
+        return None
 
-        await session.commit()
 
-    logger.info("Paper processing completed", processed=len(papers))
+@celery_app.task(name="src.workers.tasks.processing.process_unprocessed_papers")
+def process_unprocessed_papers(batch_size: int = 50):
+    """Process unprocessed papers: embed + upsert to Qdrant."""
+    _run_async(_process_papers(batch_size))
+
+
+async def _process_papers(batch_size: int):
+    from src.storage.cache.redis_client import RedisCache
+    from src.storage.repositories.paper_repo import PaperRepository
+
+    async_session_factory = get_worker_session_factory()
+    embedding_gen = _embedding_generator()
+    vector_store = _vector_store()
+    cache = RedisCache()
+
+    try:
+        async with async_session_factory() as session:
+            repo = PaperRepository(session, cache=cache)
+            papers = await repo.get_unprocessed_light(limit=batch_size)
+
+            if not papers:
+                logger.info("No unprocessed papers found")
+                return
+
+            logger.info("Processing papers", count=len(papers))
+
+            texts = [
+                f"{paper.title}\n\n{paper.abstract or ''}"
+                for paper in papers
+            ]
+            processed_ids = await _embed_and_upsert(
+                embedding_gen, vector_store, "papers", papers, texts, _paper_point
+            )
+
+            # One UPDATE for the whole batch instead of dirty-tracked instances
+            await repo.mark_processed_many(processed_ids)
+            await session.commit()
+            processed = len(processed_ids)
+
+            # Newly collected papers are now visible; drop cached analytics
+            if processed:
+                await repo.invalidate_analytics()
+    finally:
+        await cache.close()
+
+    logger.info("Paper processing completed", processed=processed)
 
 
 @celery_app.task(name="src.workers.tasks.processing.process_unprocessed_repos")
@@ -92,61 +190,30 @@ def process_unprocessed_repos(batch_size: int = 50):
 
 
 async def _process_repos(batch_size: int):
-    from src.processors.embedding import EmbeddingGenerator
-    from src.storage.database import create_async_session_factory
     from src.storage.repositories.github_repo import GitHubRepository
-    from src.storage.vector.qdrant_client import VectorStore
 
-    async_session_factory = create_async_session_factory()
-    embedding_gen = EmbeddingGenerator()
-    vector_store = VectorStore()
+    async_session_factory = get_worker_session_factory()
+    embedding_gen = _embedding_generator()
+    vector_store = _vector_store()
 
     async with async_session_factory() as session:
         repo_store = GitHubRepository(session)
-        repos = await repo_store.get_unprocessed(limit=batch_size)
+        repos = await repo_store.get_unprocessed_light(limit=batch_size)
 
         if not repos:
             return
 
-        # Batch embed all repos at once
         texts = []
         for r in repos:
             parts = [r.name, r.description or ""]
             if r.readme_content:
-                parts.append(r.readme_content[:2000])
+                parts.append(r.readme_content)
             texts.append("\n\n".join(parts))
-        embeddings = embedding_gen.embed_batch(texts)
-
-        points = []
-        for repository, embedding in zip(repos, embeddings):
-            try:
-                points.append({
-                    "id": str(repository.id),
-                    "vector": embedding,
-                    "payload": {
-                        "full_name": repository.full_name,
-                        "title": repository.name,
-                        "description": repository.description or "",
-                        "content": repository.description or "",
-                        "primary_language": repository.primary_language,
-                        "topics": repository.topics or [],
-                        "frameworks": repository.frameworks or [],
-                        "stars_count": repository.stars_count,
-                        "source_type": "repository",
-                        "url": repository.html_url,
-                    },
-                })
-                repository.is_processed = True
-            except Exception as e:
-                logger.error(
-                    "Failed to process repo",
-                    full_name=repository.full_name,
-                    error=str(e),
-                )
-
-        if points:
-            vector_store.upsert_batch(collection="repositories", points=points)
+        processed_ids = await _embed_and_upsert(
+            embedding_gen, vector_store, "repositories", repos, texts, _repo_point
+        )
 
+        await repo_store.mark_processed_many(processed_ids)
         await session.commit()
 
 
@@ -156,86 +223,170 @@ def calculate_trending_scores():
     _run_async(_calculate_trending())
 
 
-async def _calculate_trending():
-    from datetime import datetime
-
-    from src.processors.trending import TrendingCalculator
-    from src.storage.database import create_async_session_factory
-    from src.storage.repositories.github_repo import GitHubRepository
+def _score_rows(entity_type: str, entities: list, scores: dict) -> list[dict]:
+    today = date.today()
+    columns = {name: values.tolist() for name, values in scores.items()}
+    return [
+        {
+            "entity_type": entity_type,
+            "entity_id": entity.id,
+            **{name: values[i] for name, values in columns.items()},
+            "category": (entity.topics[0] if entity.topics else None),
+            "period_start": today,
+            "period_end": today,
+        }
+        for i, entity in enumerate(entities)
+    ]
+
+
+async def _paper_score_rows(metrics_repo, calculator, papers: list) -> list[dict]:
+    import numpy as np
+
+    from src.processors.trending import days_since
+
+    summaries = await metrics_repo.history_summaries("paper", [p.id for p in papers], days=30)
+    citations = np.fromiter((p.citation_count or 0 for p in papers), dtype=np.float64)
+    scores = calculator.calculate_paper_scores_vec(
+        citations=citations,
+        influential=np.fromiter(
+            (p.influential_citation_count or 0 for p in papers), dtype=np.float64
+        ),
+        days_since_published=days_since(
+            datetime.combine(p.published_date, datetime.min.time()) if p.published_date else None
+            for p in papers
+        ),
+        history_counts=np.fromiter(
+            (summaries.get(p.id, (0, {}))[0] for p in papers), dtype=np.float64
+        ),
+        prev_citations=np.fromiter(
+            (
+                summaries.get(p.id, (0, {}))[1].get("citations", current)
+                for p, current in zip(papers, citations)
+            ),
+            dtype=np.float64,
+        ),
+    )
+    return _score_rows("paper", papers, scores)
+
+
+async def _repo_score_rows(metrics_repo, calculator, repos: list) -> list[dict]:
+    import numpy as np
+
+    from src.processors.trending import days_since, snapshot_stars
+
+    summaries = await metrics_repo.history_summaries(
+        "repository", [r.id for r in repos], days=7
+    )
+    stars = np.fromiter((r.stars_count or 0 for r in repos), dtype=np.float64)
+    scores = calculator.calculate_repo_scores_vec(
+        stars=stars,
+        open_issues=np.fromiter((r.open_issues_count or 0 for r in repos), dtype=np.float64),
+        commits_30d=np.fromiter((r.commit_count_30d or 0 for r in repos), dtype=np.float64),
+        days_since_commit=days_since(r.last_commit_at for r in repos),
+        history_counts=np.fromiter(
+            (summaries.get(r.id, (0, {}))[0] for r in repos), dtype=np.float64
+        ),
+        prev_stars=np.fromiter(
+            (
+                snapshot_stars(summaries.get(r.id, (0, {}))[1], current)
+                for r, current in zip(repos, stars)
+            ),
+            dtype=np.float64,
+        ),
+    )
+    return _score_rows("repository", repos, scores)
+
+
+async def _score_papers(async_session_factory, calculator) -> int:
     from src.storage.repositories.metrics_repo import MetricsRepository
     from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
     async with async_session_factory() as session:
         metrics_repo = MetricsRepository(session)
-        paper_repo = PaperRepository(session)
-        github_repo = GitHubRepository(session)
-        calculator = TrendingCalculator(metrics_repo)
-
-        # Calculate for recent papers
-        papers, _ = await paper_repo.list_papers(limit=500, sort_by="published_date")
-
-        for paper in papers:
-            try:
-                scores = await calculator.calculate_paper_score(
-                    paper_id=paper.id,
-                    citation_count=paper.citation_count,
-                    influential_citation_count=paper.influential_citation_count,
-                    published_date=datetime.combine(
-                        paper.published_date, datetime.min.time()
-                    )
-                    if paper.published_date
-                    else None,
-                )
-
-                await metrics_repo.upsert_trending_score(
-                    {
-                        "entity_type": "paper",
-                        "entity_id": paper.id,
-                        "activity_score": scores.activity_score,
-                        "community_score": scores.community_score,
-                        "academic_score": scores.academic_score,
-                        "recency_score": scores.recency_score,
-                        "total_score": scores.total_score,
-                        "category": (paper.topics[0] if paper.topics else None),
-                        "period_start": date.today(),
-                        "period_end": date.today(),
-                    }
-                )
-            except Exception as e:
-                logger.error("Failed to calculate paper trending", paper_id=str(paper.id), error=str(e))
-
-        # Calculate for repositories
-        repos, _ = await github_repo.list_repos(limit=500, sort_by="stars_count")
-
-        for repo in repos:
-            try:
-                scores = await calculator.calculate_repo_score(
-                    repo_id=repo.id,
-                    stars_count=repo.stars_count,
-                    forks_count=repo.forks_count,
-                    open_issues_count=repo.open_issues_count,
-                    commit_count_30d=repo.commit_count_30d,
-                    last_commit_at=repo.last_commit_at,
-                )
-
-                await metrics_repo.upsert_trending_score(
-                    {
-                        "entity_type": "repository",
-                        "entity_id": repo.id,
-                        "activity_score": scores.activity_score,
-                        "community_score": scores.community_score,
-                        "academic_score": scores.academic_score,
-                        "recency_score": scores.recency_score,
-                        "total_score": scores.total_score,
-                        "category": (repo.topics[0] if repo.topics else None),
-                        "period_start": date.today(),
-                        "period_end": date.today(),
-                    }
-                )
-            except Exception as e:
-                logger.error("Failed to calculate repo trending", repo_id=str(repo.id), error=str(e))
+        papers, _ = await PaperRepository(session).list_papers(
+            limit=500, sort_by="published_date"
+        )
+        rows = await _paper_score_rows(metrics_repo, calculator, papers)
+        await metrics_repo.upsert_trending_scores_bulk(rows)
+        await session.commit()
+    return len(rows)
+
+
+async def _score_repos(async_session_factory, calculator) -> int:
+    from src.storage.repositories.github_repo import GitHubRepository
+    from src.storage.repositories.metrics_repo import MetricsRepository
 
+    async with async_session_factory() as session:
+        metrics_repo = MetricsRepository(session)
+        repos, _ = await GitHubRepository(session).list_repos(
+            limit=500, sort_by="stars_count"
+        )
+        rows = await _repo_score_rows(metrics_repo, calculator, repos)
+        await metrics_repo.upsert_trending_scores_bulk(rows)
         await session.commit()
+    return len(rows)
+
+
+async def _calculate_trending():
+    from src.processors.trending import TrendingCalculator
+    from src.storage.cache.redis_client import RedisCache
+    from src.storage.repositories.metrics_repo import MetricsRepository
+
+    async_session_factory = get_worker_session_factory()
+    cache = RedisCache()
+    calculator = TrendingCalculator()
+
+    try:
+        # Papers and repos are independent: each side reads, scores and
+        # upserts in its own session and transaction, concurrently. Both are
+        # always awaited to completion, so one side failing leaves the
+        # other's committed scores in place
+        results = await asyncio.gather(
+            _score_papers(async_session_factory, calculator),
+            _score_repos(async_session_factory, calculator),
+            return_exceptions=True,
+        )
+    finally:
+        try:
+            async with async_session_factory() as session:
+                await MetricsRepository(session, cache=cache).invalidate_trending_filters()
+        finally:
+            await cache.close()
+
+    counts = {}
+    failures = []
+    for name, result in zip(("papers", "repos"), results):
+        if isinstance(result, BaseException):
+            logger.error("Trending scoring failed", entity=name, error=str(result))
+            failures.append(result)
+        else:
+            counts[name] = result
+
+    logger.info("Trending scores calculated", **counts)
+    if failures:
+        raise failures[0]
+
+
+@celery_app.task(name="src.workers.tasks.processing.refresh_paper_views")
+def refresh_paper_views():
+    """Refresh materialized views backing paper analytics."""
+    _run_async(_refresh_paper_views())
+
+
+async def _refresh_paper_views():
+    from src.storage.cache.redis_client import RedisCache
+    from src.storage.repositories.paper_repo import PaperRepository
+
+    async_session_factory = get_worker_session_factory()
+    cache = RedisCache()
+    try:
+        async with async_session_factory() as session:
+            repo = PaperRepository(session, cache=cache)
+            await repo.refresh_author_view()
+            await session.commit()
+            # Cached analytics were computed from the previous view contents
+            await repo.invalidate_analytics()
+    finally:
+        await cache.close()
 
-    logger.info("Trending scores calculated")
+    logger.info("Paper analytics views refreshed")
@@ -1,21 +1,94 @@
 """Reporting tasks for generating weekly digests and alerts."""
 
 import asyncio
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 from src.core.config import get_settings
 from src.core.logging import get_logger
-from src.workers.celery_app import celery_app
+from src.workers.celery_app import (
+    celery_app,
+    get_worker_session_factory,
+    run_in_worker_loop,
+)
 
 logger = get_logger(__name__)
 
 
 def _run_async(coro):
-    loop = asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return run_in_worker_loop(coro)
+
+
+@lru_cache
+def _llm_client():
+    """Ollama client shared by the reporting tasks of one worker process.
+
+    Its HTTP connection pool lives on the persistent worker loop, so keep-alive
+    connections to Ollama carry over between task runs.
+    """
+    from src.llm.ollama_client import OllamaClient
+    from src.llm.response_cache import SemanticResponseCache
+
+    settings = get_settings()
+    return OllamaClient(
+        base_url=settings.LOCAL_LLM_URL,
+        model=settings.LOCAL_LLM_MODEL,
+        response_cache=SemanticResponseCache(),
+        keep_alive=settings.LOCAL_LLM_KEEP_ALIVE,
+    )
+
+
+@celery_app.task(name="src.workers.tasks.reporting.generate_weekly_bundle")
+def generate_weekly_bundle():
+    """Generate the weekly report and tech radar together.
+
+    Both prompts go to Ollama concurrently on the shared client, so the model
+    is loaded once and, with OLLAMA_NUM_PARALLEL > 1, the two generations are
+    batched server-side. One failing does not stop the other.
+    """
+    _run_async(_generate_weekly_bundle())
+
+
+async def _generate_weekly_bundle():
+    # Both reports list the same trending repos: read them once so the two
+    # documents are built from identical inputs
+    trending_repos = await _fetch_trending_repos()
+    results = await asyncio.gather(
+        _generate_report(trending_repos),
+        _generate_tech_radar(trending_repos),
+        return_exceptions=True,
+    )
+    for name, result in zip(("weekly_report", "tech_radar"), results):
+        if isinstance(result, BaseException):
+            logger.error("Weekly bundle step failed", step=name, error=str(result))
+
+
+def _array_head(column, n: int, label: str):
+    """First ``n`` array elements as one comma-separated string, 'N/A' when empty."""
+    from sqlalchemy import func
+
+    joined = func.array_to_string(column[1:n], ", ")
+    return func.coalesce(func.nullif(joined, ""), "N/A").label(label)
+
+
+async def _fetch_trending_repos() -> list:
+    """Top trending repos with the columns either report formats."""
+    from src.storage.models.repository import Repository
+    from src.storage.repositories.metrics_repo import MetricsRepository
+
+    async with get_worker_session_factory()() as session:
+        return await MetricsRepository(session).get_trending_with_entities(
+            Repository,
+            limit=15,
+            columns=(
+                Repository.full_name,
+                Repository.description,
+                Repository.stars_count,
+                Repository.primary_language,
+                _array_head(Repository.frameworks, 3, "frameworks_str"),
+                _array_head(Repository.topics, 3, "topics_str"),
+            ),
+        )
 
 
 @celery_app.task(name="src.workers.tasks.reporting.generate_weekly_report")
@@ -24,161 +97,182 @@ def generate_weekly_report():
     _run_async(_generate_report())
 
 
-async def _generate_report():
-    from sqlalchemy import func, select
+async def _generate_report(trending_repos: list | None = None):
+    import httpx
+    from sqlalchemy import func, select, text
 
-    from src.llm.ollama_client import OllamaClient
-    from src.llm.prompts.analysis import WEEKLY_REPORT_PROMPT
-    from src.storage.database import create_async_session_factory
+    from src.llm.prompts.analysis import WEEKLY_REPORT_SYSTEM, WEEKLY_REPORT_USER
     from src.storage.models.paper import Paper
     from src.storage.models.repository import Repository
     from src.storage.models.weekly_report import WeeklyReport
-    from src.storage.repositories.metrics_repo import MetricsRepository
-    from src.storage.repositories.paper_repo import PaperRepository
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_worker_session_factory()
 
-    settings = get_settings()
-    llm = OllamaClient(base_url=settings.LOCAL_LLM_URL, model=settings.LOCAL_LLM_MODEL)
+    llm = _llm_client()
 
     period_end = date.today()
     period_start = period_end - timedelta(days=7)
-
-    async with async_session_factory() as session:
-        paper_repo = PaperRepository(session)
-        metrics_repo = MetricsRepository(session)
-
-        # Get papers collected this week (by created_at, not published_date)
-        from datetime import datetime as _dt
-        papers_result = await session.execute(
-            select(Paper)
-            .where(Paper.created_at >= _dt.combine(period_start, _dt.min.time()))
-            .order_by(Paper.created_at.desc())
-            .limit(100)
-        )
-        papers = list(papers_result.scalars().all())
-        paper_count_result = await session.execute(
-            select(func.count(Paper.id))
-            .where(Paper.created_at >= _dt.combine(period_start, _dt.min.time()))
-        )
-        paper_count = paper_count_result.scalar() or 0
-
-        # Build summaries for LLM
-        papers_summary = "\n".join(
-            f"- {p.title} [{', '.join(p.categories or [])}]"
-            for p in papers[:20]
-        )
-
-        # Get trending repos
-        trending, _ = await metrics_repo.get_trending(
-            entity_type="repository", limit=15
-        )
-        repos_summary = ""
-        top_repos_data = []
-        if trending:
-            repo_ids = [t.entity_id for t in trending]
-            repo_result = await session.execute(
-                select(Repository).where(Repository.id.in_(repo_ids))
+    # Papers/repos collected this week (by created_at, not published_date)
+    since = datetime.combine(period_start, datetime.min.time())
+
+    # The lookups below are independent, so each runs on its own session and
+    # they are awaited together
+    async def recent_papers():
+        async with async_session_factory() as session:
+            result = await session.execute(
+                select(Paper.title, Paper.arxiv_id, Paper.citation_count, Paper.categories)
+                .where(Paper.created_at >= since)
+                .order_by(Paper.created_at.desc())
+                .limit(20)  # only the 20 newest are summarised; the total is counted
             )
-            repos_map = {r.id: r for r in repo_result.scalars().all()}
-            repo_lines = []
-            for t in trending[:10]:
-                repo = repos_map.get(t.entity_id)
-                if repo:
-                    repo_lines.append(
-                        f"- {repo.full_name} ({repo.primary_language or 'N/A'}): "
-                        f"{repo.stars_count} stars, score={t.total_score:.1f}"
-                    )
-                    top_repos_data.append({
-                        "full_name": repo.full_name,
-                        "description": repo.description or "",
-                        "stars_count": repo.stars_count or 0,
-                        "primary_language": repo.primary_language,
-                    })
-            repos_summary = "\n".join(repo_lines)
-
-        # Build top papers data
-        top_papers_data = []
-        for p in papers[:10]:
-            top_papers_data.append({
-                "title": p.title,
-                "arxiv_id": p.arxiv_id,
-                "citation_count": p.citation_count or 0,
-                "categories": (p.categories or [])[:3],
-            })
-
-        # Build trending topics
-        trending_topics_data = []
-        topic_result = await session.execute(
-            select(
-                func.unnest(Repository.topics).label("topic"),
-                func.count().label("count"),
+            return result.all()
+
+    async def counts_created_since():
+        # Both counts as scalar subqueries of one SELECT: one round-trip
+        def created_since(model):
+            return (
+                select(func.count())
+                .select_from(model)
+                .where(model.created_at >= since)
+                .scalar_subquery()
             )
-            .where(Repository.topics.isnot(None))
-            .group_by("topic")
-            .order_by(func.count().desc())
-            .limit(10)
-        )
-        for r in topic_result.all():
-            trending_topics_data.append({
-                "name": r.topic,
-                "count": r.count,
-                "trend": "up",
-            })
 
-        # Generate report with LLM
-        prompt = WEEKLY_REPORT_PROMPT.format(
-            period_start=period_start,
-            period_end=period_end,
-            paper_count=paper_count,
-            papers_summary=papers_summary or "No new papers this week.",
-            repo_count=len(trending),
-            repos_summary=repos_summary or "No trending repos this week.",
-            changes_summary="No notable changes detected.",
-        )
+        async with async_session_factory() as session:
+            result = await session.execute(
+                select(created_since(Paper), created_since(Repository))
+            )
+            return tuple(result.one())
 
-        report_json = await llm.generate_json(
-            prompt, max_tokens=4000, temperature=0.5
-        )
+    async def trending():
+        if trending_repos is not None:
+            return trending_repos
+        return await _fetch_trending_repos()
 
-        # Extract structured data from LLM response
-        title = report_json.get("title", "")
-        summary = report_json.get("summary", "")
-        highlights = report_json.get("highlights", [])
-        content = report_json.get("content", "")
-
-        # Fallback: if JSON parse failed (empty dict), generate plain text report
-        if not title and not summary and not content:
-            logger.warning("LLM JSON parse failed, falling back to plain text generation")
-            plain_prompt = (
-                f"Write a concise weekly AI research digest for {period_start} to {period_end}.\n\n"
-                f"Papers ({paper_count} total):\n{papers_summary or 'None'}\n\n"
-                f"Repos ({len(trending)} trending):\n{repos_summary or 'None'}\n\n"
-                "Cover: key highlights, trending topics, notable papers, active repos. Format as markdown."
+    async def top_repo_topics():
+        async with async_session_factory() as session:
+            result = await session.execute(
+                text(_TOP_TAGS_SQL), {"kind": "repo_topic", "limit": 10}
             )
-            content = await llm.generate(plain_prompt, max_tokens=2000, temperature=0.5)
-            title = f"Weekly AI Research Digest: {period_start} - {period_end}"
-            summary = f"This week saw {paper_count} new papers and {len(trending)} trending repositories across AI/ML research."
-            # Auto-generate highlights from top papers
-            highlights = [p.title for p in papers[:5]]
-
-        if not title:
-            title = f"Weekly AI Research Digest: {period_start} - {period_end}"
-
-        # Ensure highlights is a list of strings
-        if not isinstance(highlights, list):
-            highlights = []
-        highlights = [str(h) for h in highlights[:10]]
-
-        # Count repos collected this week
-        repo_count_result = await session.execute(
-            select(func.count(Repository.id)).where(
-                Repository.created_at >= _dt.combine(period_start, _dt.min.time())
+            return result.all()
+
+    (
+        papers,
+        (paper_count, new_repos_count),
+        trending,
+        topic_rows,
+    ) = await asyncio.gather(
+        recent_papers(),
+        counts_created_since(),
+        trending(),
+        top_repo_topics(),
+    )
+
+    # Build summaries for LLM
+    papers_summary = "\n".join(
+        f"- {p.title} [{', '.join(p.categories or [])}]"
+        for p in papers
+    )
+
+    repos_summary = ""
+    top_repos_data = []
+    if trending:
+        repo_lines = []
+        for repo in trending[:10]:
+            repo_lines.append(
+                f"- {repo.full_name} ({repo.primary_language or 'N/A'}): "
+                f"{repo.stars_count} stars, score={repo.total_score:.1f}"
             )
+            top_repos_data.append({
+                "full_name": repo.full_name,
+                "description": repo.description or "",
+                "stars_count": repo.stars_count or 0,
+                "primary_language": repo.primary_language,
+            })
+        repos_summary = "\n".join(repo_lines)
+
+    # Build top papers data
+    top_papers_data = []
+    for p in papers[:10]:
+        top_papers_data.append({
+            "title": p.title,
+            "arxiv_id": p.arxiv_id,
+            "citation_count": p.citation_count or 0,
+            "categories": (p.categories or ())[:3],
+        })
+
+    # Build trending topics
+    trending_topics_data = []
+    for r in topic_rows:
+        trending_topics_data.append({
+            "name": r.tag,
+            "count": r.count,
+            "trend": "up",
+        })
+
+    # Generate report with LLM
+    prompt = WEEKLY_REPORT_USER.format(
+        period_start=period_start,
+        period_end=period_end,
+        paper_count=paper_count,
+        papers_summary=papers_summary or "No new papers this week.",
+        repo_count=len(trending),
+        repos_summary=repos_summary or "No trending repos this week.",
+        changes_summary="No notable changes detected.",
+    )
+
+    # The requested JSON (a 500+ word markdown body plus title, summary and
+    # highlights) fits well within 2500 tokens. The temperature stays within
+    # the response cache's limit so a retried run reuses the earlier answer
+    report_json = await llm.generate_json(
+        prompt,
+        max_tokens=2500,
+        temperature=0.3,
+        system_prompt=WEEKLY_REPORT_SYSTEM,
+    )
+
+    # Extract structured data from LLM response
+    title = report_json.get("title", "")
+    summary = report_json.get("summary", "")
+    highlights = report_json.get("highlights", [])
+    content = report_json.get("content", "")
+
+    # Fallback: if JSON parse failed (empty dict), generate plain text report
+    if not title and not summary and not content:
+        logger.warning("LLM JSON parse failed, falling back to plain text generation")
+        plain_prompt = (
+            f"Write a concise weekly AI research digest for {period_start} to {period_end}.\n\n"
+            f"Papers ({paper_count} total):\n{papers_summary or 'None'}\n\n"
+            f"Repos ({len(trending)} trending):\n{repos_summary or 'None'}\n\n"
+            "Cover: key highlights, trending topics, notable papers, active repos. Format as markdown."
         )
-        new_repos_count = repo_count_result.scalar() or 0
-
-        # Save to DB
+        # Streamed so a connection dropped mid-decode still leaves the text
+        # generated so far to save
+        parts: list[str] = []
+        try:
+            async for chunk in llm.stream_generate(
+                plain_prompt, max_tokens=2000, temperature=0.5
+            ):
+                parts.append(chunk)
+        except httpx.HTTPError as e:
+            if not parts:
+                raise
+            logger.warning("LLM stream interrupted, keeping partial report", error=str(e))
+        content = "".join(parts)
+        title = f"Weekly AI Research Digest: {period_start} - {period_end}"
+        summary = f"This week saw {paper_count} new papers and {len(trending)} trending repositories across AI/ML research."
+        # Auto-generate highlights from top papers
+        highlights = [p.title for p in papers[:5]]
+
+    if not title:
+        title = f"Weekly AI Research Digest: {period_start} - {period_end}"
+
+    # Ensure highlights is a list of at most 10 strings
+    highlights = (
+        list(map(str, highlights[:10])) if isinstance(highlights, (list, tuple)) else []
+    )
+
+    # Save to DB
+    async with async_session_factory() as session:
         report = WeeklyReport(
             title=title,
             summary=summary,
@@ -195,13 +289,57 @@ async def _generate_report():
         session.add(report)
         await session.commit()
 
-        logger.info(
-            "Weekly report generated and saved",
-            report_id=str(report.id),
-            papers=paper_count,
-            repos=new_repos_count,
-            period=f"{period_start} to {period_end}",
+    logger.info(
+        "Weekly report generated and saved",
+        report_id=str(report.id),
+        papers=paper_count,
+        repos=new_repos_count,
+        period=f"{period_start} to {period_end}",
+    )
+
+
+# Tag frequencies are precomputed in the reporting_tag_counts materialized
+# view (refreshed by refresh_reporting_views); its (kind, count DESC) index
+# serves each top-N directly
+_TOP_TAGS_SQL = """
+    SELECT tag, count, avg_stars FROM reporting_tag_counts
+    WHERE kind = :kind ORDER BY count DESC LIMIT :limit
+"""
+
+# Tech radar tag counts in one round-trip, one top-N branch per kind.
+# avg_stars is only set for frameworks.
+_RADAR_TAG_COUNTS_SQL = """
+    (SELECT kind, tag, count, avg_stars FROM reporting_tag_counts
+     WHERE kind = 'framework' ORDER BY count DESC LIMIT 25)
+    UNION ALL
+    (SELECT kind, tag, count, avg_stars FROM reporting_tag_counts
+     WHERE kind = 'repo_topic' ORDER BY count DESC LIMIT 30)
+    UNION ALL
+    (SELECT kind, tag, count, avg_stars FROM reporting_tag_counts
+     WHERE kind = 'paper_keyword' ORDER BY count DESC LIMIT 25)
+    UNION ALL
+    (SELECT kind, tag, count, avg_stars FROM reporting_tag_counts
+     WHERE kind = 'paper_topic' ORDER BY count DESC LIMIT 20)
+"""
+
+
+@celery_app.task(name="src.workers.tasks.reporting.refresh_reporting_views")
+def refresh_reporting_views():
+    """Refresh the tag-count materialized view read by the reports."""
+    _run_async(_refresh_reporting_views())
+
+
+async def _refresh_reporting_views():
+    from sqlalchemy import text
+
+    async_session_factory = get_worker_session_factory()
+    async with async_session_factory() as session:
+        await session.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY reporting_tag_counts")
         )
+        await session.commit()
+
+    logger.info("Reporting views refreshed")
 
 
 @celery_app.task(name="src.workers.tasks.reporting.generate_tech_radar")
@@ -210,177 +348,131 @@ def generate_tech_radar():
     _run_async(_generate_tech_radar())
 
 
-async def _generate_tech_radar():
-    from sqlalchemy import func, select
+async def _generate_tech_radar(trending_repos: list | None = None):
+    from sqlalchemy import text
 
-    from src.llm.ollama_client import OllamaClient
-    from src.llm.prompts.analysis import TECH_RADAR_PROMPT
-    from src.storage.database import create_async_session_factory
-    from src.storage.models.repository import Repository
+    from src.llm.prompts.analysis import TECH_RADAR_SYSTEM, TECH_RADAR_USER
+    from src.storage.models.paper import Paper
     from src.storage.models.tech_radar import TechRadarSnapshot
     from src.storage.repositories.metrics_repo import MetricsRepository
 
-    async_session_factory = create_async_session_factory()
-    settings = get_settings()
-    llm = OllamaClient(base_url=settings.LOCAL_LLM_URL, model=settings.LOCAL_LLM_MODEL)
+    async_session_factory = get_worker_session_factory()
+    llm = _llm_client()
 
     period_end = date.today()
     period_start = period_end - timedelta(days=7)
 
-    async with async_session_factory() as session:
-        from src.storage.models.paper import Paper
+    if trending_repos is None:
+        trending_repos = await _fetch_trending_repos()
 
+    # Reads happen in one short session that is closed before the LLM call,
+    # so the connection isn't held through generation
+    async with async_session_factory() as session:
         metrics_repo = MetricsRepository(session)
 
-        # Top frameworks used in repos (the most relevant signal)
-        framework_result = await session.execute(
-            select(
-                func.unnest(Repository.frameworks).label("framework"),
-                func.count().label("count"),
-                func.avg(Repository.stars_count).label("avg_stars"),
-            )
-            .where(Repository.frameworks.isnot(None))
-            .group_by("framework")
-            .order_by(func.count().desc())
-            .limit(25)
+        tag_counts: dict[str, list] = {
+            "framework": [], "repo_topic": [], "paper_keyword": [], "paper_topic": []
+        }
+        for r in (await session.execute(text(_RADAR_TAG_COUNTS_SQL))).all():
+            tag_counts[r.kind].append(r)
+        for rows in tag_counts.values():
+            rows.sort(key=lambda r: r.count, reverse=True)
+
+        trending_papers = await metrics_repo.get_trending_with_entities(
+            Paper,
+            limit=15,
+            columns=(
+                Paper.title,
+                _array_head(Paper.categories, 2, "categories_str"),
+                Paper.citation_count,
+            ),
         )
-        frameworks_data = [
-            f"- {r.framework}: used in {r.count} repos, avg {r.avg_stars:.0f} stars"
-            for r in framework_result.all()
-        ]
-
-        # Top topics from repos (technologies, not languages)
-        topic_result = await session.execute(
-            select(
-                func.unnest(Repository.topics).label("topic"),
-                func.count().label("count"),
-            )
-            .where(Repository.topics.isnot(None))
-            .group_by("topic")
-            .order_by(func.count().desc())
-            .limit(30)
-        )
-        topics_data = [
-            f"- {r.topic}: {r.count} repos"
-            for r in topic_result.all()
-        ]
-
-        # Top paper keywords/topics (research trends)
-        paper_keyword_result = await session.execute(
-            select(
-                func.unnest(Paper.keywords).label("keyword"),
-                func.count().label("count"),
-            )
-            .where(Paper.keywords.isnot(None))
-            .group_by("keyword")
-            .order_by(func.count().desc())
-            .limit(25)
-        )
-        paper_keywords_data = [
-            f"- {r.keyword}: {r.count} papers"
-            for r in paper_keyword_result.all()
-        ]
-
-        paper_topic_result = await session.execute(
-            select(
-                func.unnest(Paper.topics).label("topic"),
-                func.count().label("count"),
-            )
-            .where(Paper.topics.isnot(None))
-            .group_by("topic")
-            .order_by(func.count().desc())
-            .limit(20)
-        )
-        paper_topics_data = [
-            f"- {r.topic}: {r.count} papers"
-            for r in paper_topic_result.all()
-        ]
-
-        # Top trending repos with actual names
-        trending_repos, _ = await metrics_repo.get_trending(
-            entity_type="repository", limit=15
-        )
-        if trending_repos:
-            repo_ids = [t.entity_id for t in trending_repos]
-            repo_result = await session.execute(
-                select(Repository).where(Repository.id.in_(repo_ids))
-            )
-            repos_map = {r.id: r for r in repo_result.scalars().all()}
-            trending_repos_data = []
-            for t in trending_repos:
-                repo = repos_map.get(t.entity_id)
-                if repo:
-                    frameworks_str = ", ".join(repo.frameworks[:3]) if repo.frameworks else "N/A"
-                    topics_str = ", ".join(repo.topics[:3]) if repo.topics else "N/A"
-                    trending_repos_data.append(
-                        f"- {repo.full_name} ({repo.primary_language or 'N/A'}): "
-                        f"{repo.stars_count} stars, score={t.total_score:.1f}, "
-                        f"frameworks=[{frameworks_str}], topics=[{topics_str}]"
-                    )
-        else:
-            trending_repos_data = []
-
-        # Top trending papers with titles
-        trending_papers, _ = await metrics_repo.get_trending(
-            entity_type="paper", limit=15
-        )
-        if trending_papers:
-            paper_ids = [t.entity_id for t in trending_papers]
-            paper_result = await session.execute(
-                select(Paper).where(Paper.id.in_(paper_ids))
-            )
-            papers_map = {p.id: p for p in paper_result.scalars().all()}
-            trending_papers_data = []
-            for t in trending_papers:
-                paper = papers_map.get(t.entity_id)
-                if paper:
-                    cats = ", ".join(paper.categories[:2]) if paper.categories else "N/A"
-                    trending_papers_data.append(
-                        f"- \"{paper.title}\" [{cats}]: "
-                        f"{paper.citation_count} citations, score={t.total_score:.1f}"
-                    )
-        else:
-            trending_papers_data = []
-
-        # Format data for LLM
-        data_text = (
-            "## Frameworks & Libraries (from repositories)\n"
-            + "\n".join(frameworks_data or ["No data"])
-            + "\n\n## Repository Topics (technology tags)\n"
-            + "\n".join(topics_data or ["No data"])
-            + "\n\n## Research Paper Keywords\n"
-            + "\n".join(paper_keywords_data or ["No data"])
-            + "\n\n## Research Paper Topics\n"
-            + "\n".join(paper_topics_data or ["No data"])
-            + "\n\n## Top Trending Repositories\n"
-            + "\n".join(trending_repos_data or ["No data"])
-            + "\n\n## Top Trending Papers\n"
-            + "\n".join(trending_papers_data or ["No data"])
-        )
-
-        prompt = TECH_RADAR_PROMPT.format(data=data_text)
-        radar_data = await llm.generate_json(prompt, max_tokens=2000, temperature=0.3)
 
-        # Validate structure
-        for ring in ("adopt", "trial", "assess", "hold"):
-            if ring not in radar_data:
-                radar_data[ring] = []
+    # Format data for LLM: every line goes into one buffer, joined once
+    buf: list[str] = []
+
+    def section(heading: str, lines) -> None:
+        if buf:
+            buf.append("")
+        buf.append(f"## {heading}")
+        start = len(buf)
+        buf.extend(lines)
+        if len(buf) == start:
+            buf.append("No data")
+
+    # Top frameworks used in repos (the most relevant signal)
+    section(
+        "Frameworks & Libraries (from repositories)",
+        (
+            f"- {r.tag}: used in {r.count} repos, avg {r.avg_stars:.0f} stars"
+            for r in tag_counts["framework"]
+        ),
+    )
+    # Top topics from repos (technologies, not languages)
+    section(
+        "Repository Topics (technology tags)",
+        (f"- {r.tag}: {r.count} repos" for r in tag_counts["repo_topic"]),
+    )
+    # Top paper keywords/topics (research trends)
+    section(
+        "Research Paper Keywords",
+        (f"- {r.tag}: {r.count} papers" for r in tag_counts["paper_keyword"]),
+    )
+    section(
+        "Research Paper Topics",
+        (f"- {r.tag}: {r.count} papers" for r in tag_counts["paper_topic"]),
+    )
+    # Top trending repos with actual names
+    section(
+        "Top Trending Repositories",
+        (
+            f"- {repo.full_name} ({repo.primary_language or 'N/A'}): "
+            f"{repo.stars_count} stars, score={repo.total_score:.1f}, "
+            f"frameworks=[{repo.frameworks_str}], topics=[{repo.topics_str}]"
+            for repo in trending_repos
+        ),
+    )
+    # Top trending papers with titles
+    section(
+        "Top Trending Papers",
+        (
+            f"- \"{paper.title}\" [{paper.categories_str}]: "
+            f"{paper.citation_count} citations, score={paper.total_score:.1f}"
+            for paper in trending_papers
+        ),
+    )
+    data_text = "\n".join(buf)
+
+    prompt = TECH_RADAR_USER.format(data=data_text)
+    radar_data = await llm.generate_json(
+        prompt,
+        max_tokens=2000,
+        temperature=0.3,
+        system_prompt=TECH_RADAR_SYSTEM,
+    )
+
+    # Validate structure
+    for ring in ("adopt", "trial", "assess", "hold"):
+        if ring not in radar_data:
+            radar_data[ring] = []
 
-        snapshot = TechRadarSnapshot(
-            data=radar_data,
-            period_start=period_start,
-            period_end=period_end,
+    async with async_session_factory() as session:
+        session.add(
+            TechRadarSnapshot(
+                data=radar_data,
+                period_start=period_start,
+                period_end=period_end,
+            )
         )
-        session.add(snapshot)
         await session.commit()
 
-        logger.info(
-            "Tech radar generated",
-            adopt=len(radar_data.get("adopt", [])),
-            trial=len(radar_data.get("trial", [])),
-            assess=len(radar_data.get("assess", [])),
-            hold=len(radar_data.get("hold", [])),
-        )
+    logger.info(
+        "Tech radar generated",
+        adopt=len(radar_data.get("adopt", [])),
+        trial=len(radar_data.get("trial", [])),
+        assess=len(radar_data.get("assess", [])),
+        hold=len(radar_data.get("hold", [])),
+    )
 
 
 @celery_app.task(name="src.workers.tasks.reporting.send_alerts")
@@ -389,27 +481,58 @@ def send_alerts():
     _run_async(_send_pending_alerts())
 
 
+# Upper bound on in-flight alert sends, to stay within channel rate limits
+ALERT_DISPATCH_CONCURRENCY = 20
+
+
+async def _dispatch(alert) -> bool:
+    """Deliver one alert; True once it has been sent."""
+    # Here you would integrate with email/Slack/Telegram
+    logger.info("Would send alert", title=alert.title, type=alert.alert_type)
+    return True
+
+
 async def _send_pending_alerts():
-    from sqlalchemy import select
+    from sqlalchemy import any_, bindparam, func, select, update
+    from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
-    from src.storage.database import create_async_session_factory
     from src.storage.models.alert import Alert
 
-    async_session_factory = create_async_session_factory()
+    async_session_factory = get_worker_session_factory()
     async with async_session_factory() as session:
         result = await session.execute(
             select(Alert).where(Alert.is_sent == False).limit(100)  # noqa: E712
         )
         alerts = result.scalars().all()
 
-        for alert in alerts:
-            try:
-                # Here you would integrate with email/Slack/Telegram
-                logger.info("Would send alert", title=alert.title, type=alert.alert_type)
-                alert.is_sent = True
-            except Exception as e:
-                logger.error("Failed to send alert", error=str(e))
+        # Alerts are dispatched concurrently; only successful ones are marked
+        semaphore = asyncio.Semaphore(ALERT_DISPATCH_CONCURRENCY)
+
+        async def dispatch_bounded(alert) -> bool:
+            async with semaphore:
+                return await _dispatch(alert)
 
+        results = await asyncio.gather(
+            *(dispatch_bounded(alert) for alert in alerts), return_exceptions=True
+        )
+        sent_ids = []
+        for alert, sent in zip(alerts, results):
+            if isinstance(sent, BaseException):
+                logger.error("Failed to send alert", alert_id=str(alert.id), error=str(sent))
+            elif sent:
+                sent_ids.append(alert.id)
+
+        # One UPDATE for the batch rather than a flushed UPDATE per alert
+        if sent_ids:
+            await session.execute(
+                update(Alert)
+                .where(
+                    Alert.id
+                    == any_(bindparam("ids", sent_ids, type_=ARRAY(UUID(as_uuid=True))))
+                )
+                .values(is_sent=True, sent_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
         await session.commit()
 
-    logger.info("Alert sending completed", count=len(alerts))
+    logger.info("Alert sending completed", count=len(sent_ids))